@@ -5,14 +5,16 @@ from typing import Optional
 
 from fastapi import Cookie, Depends
 from fastapi.security import OAuth2PasswordBearer
-import jwt
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from beanie import PydanticObjectId
 
+from app.auth.token_state import token_states
 from app.core.config import settings
+from app.core.security import decode_jwt
+from app.core.user_cache import user_cache
 from app.models.user import User
-from app.schemas.token import TokenPayload
+from app.schemas.token import Principal, TokenPayload
 from app.exceptions.auth import (
     INACTIVE_USER,
     INVALID_CREDENTIALS,
@@ -49,16 +51,12 @@ def get_token_from_cookie_or_header(
     raise NO_TOKEN_PROVIDED
 
 
-async def get_current_user(
-    token: str = Depends(get_token_from_cookie_or_header),
-) -> User:
+def decode_token(token: str) -> tuple[TokenPayload, PydanticObjectId]:
     """
-    토큰(쿠키 또는 헤더)을 디코딩하여 현재 사용자를 반환합니다.
+    토큰을 디코딩하여 (페이로드, 사용자 ID)를 반환합니다.
     """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_jwt(token)
         token_data = TokenPayload(**payload)
     except (InvalidTokenError, ValidationError) as e:
         logger.error(f"JWT 디코딩 오류: {e}")
@@ -69,10 +67,23 @@ async def get_current_user(
     except Exception as e:
         logger.error(f"sub 값 변환 오류: {e}")
         raise INVALID_CREDENTIALS
+    return token_data, user_id
 
-    user = await User.get(user_id)
+
+async def get_current_user(
+    token: str = Depends(get_token_from_cookie_or_header),
+) -> User:
+    """
+    토큰(쿠키 또는 헤더)을 디코딩하여 현재 사용자를 반환합니다.
+    User 문서 전체가 필요한 라우트에서만 사용하고, 신원/권한만 필요하면 get_current_principal 을 사용합니다.
+    """
+    token_data, user_id = decode_token(token)
+    user = await user_cache.get(user_id, User.get)
     if not user:
         raise USER_NOT_FOUND
+    if token_data.ver != user.token_version:
+        # 비밀번호/권한 변경 등으로 폐기된 토큰
+        raise INVALID_OR_EXPIRED_TOKEN
     return user
 
 
@@ -120,3 +131,50 @@ def get_current_active_superuser(
     if not current_user.is_superuser:
         raise SUPERUSER_REQUIRED
     return current_user
+
+
+# --------------------------------------------------------
+# Claims principal (User 문서를 읽지 않는 인증)
+# --------------------------------------------------------
+async def get_current_principal(
+    token: str = Depends(get_token_from_cookie_or_header),
+) -> Principal:
+    """
+    검증된 액세스 토큰 클레임으로 현재 사용자를 구성합니다.
+    User 전체 조회 대신 캐시된 토큰 상태(PRINCIPAL_CHECK_TTL)로 다음을 확인합니다.
+    - 토큰의 ver 가 사용자의 token_version 과 같은지 (비밀번호/권한 변경 시 무효화)
+    - 활성 사용자이고 이메일이 검증되었는지 (get_current_active_verified_user 와 동일한 조건)
+    """
+    token_data, user_id = decode_token(token)
+    if token_data.type != "access":
+        raise INVALID_OR_EXPIRED_TOKEN
+
+    state = await token_states.get(user_id)
+    if not state:
+        raise USER_NOT_FOUND
+    if state.token_version != token_data.ver:
+        raise INVALID_OR_EXPIRED_TOKEN
+    if not state.is_active:
+        raise INACTIVE_USER
+    if not state.is_verified:
+        raise UNVERIFIED_EMAIL
+
+    return Principal(
+        id=user_id,
+        email=token_data.email,
+        name=token_data.name,
+        apps=token_data.apps or [],
+        is_superuser=token_data.is_superuser,
+    )
+
+
+def get_current_superuser_principal(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
+    """
+    현재 사용자가 슈퍼유저인지 토큰 클레임으로 검증
+    (권한 변경 시 token_version 이 올라가므로 이전 클레임은 재사용할 수 없습니다.)
+    """
+    if not principal.is_superuser:
+        raise SUPERUSER_REQUIRED
+    return principal
@@ -3,7 +3,7 @@ import logging
 from beanie import PydanticObjectId
 from fastapi import APIRouter, Body, HTTPException, Depends
 
-from app.api.deps import get_current_active_superuser
+from app.api.deps import get_current_superuser_principal
 from app.exceptions.subscription import APP_NOT_FOUND
 from app.models import App
 from app.schemas.token import Message
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/apps")
     "/",
     response_description="App created",
     response_model=AppPublic,
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_superuser_principal)],
 )
 async def create_app(app_in: AppCreate) -> AppPublic:
     """
@@ -87,7 +87,7 @@ async def read_app_by_id(app_id: PydanticObjectId) -> AppPublic:
     "/{app_id}",
     response_description="App updated",
     response_model=AppPublic,
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_superuser_principal)],
 )
 async def update_app(
     app_id: PydanticObjectId,
@@ -109,7 +109,7 @@ async def update_app(
     "/{app_id}",
     response_description="App deleted",
     response_model=Message,
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_superuser_principal)],
 )
 async def delete_app(app_id: PydanticObjectId) -> Message:
     """
@@ -5,7 +5,8 @@ from typing import List, Optional
 from beanie import PydanticObjectId
 from fastapi import APIRouter, Body, HTTPException, Depends, Query
 
-from app.api.deps import get_current_active_superuser
+from app.api.deps import get_current_superuser_principal
+from app.auth.token_state import revoke_user_tokens
 from app.models import User, App, Subscription
 from app.schemas.user import (
     SubscriptionCreate,
@@ -17,7 +18,7 @@ from app.schemas.token import Message
 
 logger = logging.getLogger()
 
-router = APIRouter(dependencies=[Depends(get_current_active_superuser)])
+router = APIRouter(dependencies=[Depends(get_current_superuser_principal)])
 
 # --------------------------------------------------------
 # 관리자 전용 구독관리 API
@@ -61,6 +62,8 @@ async def create_subscription(
     )
     user.apps.append(app.name)
     await user.save()
+    # 토큰의 apps 클레임이 바뀌므로 기존 토큰을 무효화 (재발급 시 새 apps 반영)
+    await revoke_user_tokens(user.id)
 
     await new_subscription.insert()
     return SubscriptionPublic.model_validate(new_subscription.model_dump(by_alias=True))
@@ -133,5 +136,7 @@ async def delete_subscription(
     user = await User.get(subscription.user.id)
     user.apps.remove(subscription.app.name)
     await user.save()
+    # 토큰의 apps 클레임이 바뀌므로 기존 토큰을 무효화 (재발급 시 새 apps 반영)
+    await revoke_user_tokens(user.id)
     # 구독 삭제 후 사용자에게 알림을 보낼 수 있습니다.
     return Message(message="구독이 삭제되었습니다")
@@ -6,8 +6,9 @@ from typing import Any, List, Optional
 from beanie import PydanticObjectId
 from fastapi import APIRouter, Depends, Query
 
-from app.api.deps import get_current_active_superuser
-from app.core.security import get_password_hash
+from app.api.deps import get_current_superuser_principal
+from app.auth.token_state import revoke_user_tokens
+from app.core.security import get_password_hash_async
 from app.core.config import settings
 
 from app.exceptions.auth import EXISTING_USER, USER_NOT_FOUND
@@ -23,7 +24,7 @@ from app.utils.email.email_sending import send_email
 
 logger = logging.getLogger()
 
-router = APIRouter(dependencies=[Depends(get_current_active_superuser)])
+router = APIRouter(dependencies=[Depends(get_current_superuser_principal)])
 
 # --------------------------------------------------------
 # 관리자 전용 사용자관리 API
@@ -81,7 +82,7 @@ async def create_user(entry: AdminUserCreate) -> Any:
         email=entry.email,
         fullname=entry.fullname,
         provider=entry.provider,
-        hashed_password=get_password_hash(entry.password),
+        hashed_password=await get_password_hash_async(entry.password),
         is_active=entry.is_active,
         is_superuser=entry.is_superuser,
     )
@@ -119,6 +120,9 @@ async def update_user(
     des_body = {k: v for k, v in update_data if v is not None}
     update_query = {"$set": des_body}
     await entry.update(update_query)
+    # 토큰 클레임이나 로그인 가능 여부가 바뀌면 기존 토큰을 무효화
+    if des_body.keys() & {"email", "fullname", "password", "is_active", "is_superuser"}:
+        entry.token_version = await revoke_user_tokens(entry.id) or entry.token_version
     return UserPublic(**entry.model_dump(by_alias=True))
 
 
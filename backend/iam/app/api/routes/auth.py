@@ -6,11 +6,11 @@ from fastapi import APIRouter, BackgroundTasks, Body, Cookie, Depends, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.deps import get_current_active_superuser
+from app.api.deps import get_current_superuser_principal
+from app.auth.token_state import revoke_user_tokens
 from app.core.security import (
-    get_password_hash,
+    get_password_hash_async,
     validate_token,
-    verify_password,
 )
 from app.core.config import settings
 from app.exceptions.auth import (
@@ -25,6 +25,7 @@ from app.exceptions.auth import (
 from app.models import User
 from app.schemas.token import Message, NewPassword, Token
 from app.schemas.user import UserPublic, UserRegister
+from app.services.password_service import verify_user_password
 from app.utils import (
     generate_email_token,
     generate_reset_password_email,
@@ -62,7 +63,7 @@ async def register_user(
         is_active=True,
         is_superuser=False,
         is_verified=False,
-        hashed_password=get_password_hash(entry.password),
+        hashed_password=await get_password_hash_async(entry.password),
     )
     await user.save()
 
@@ -115,6 +116,7 @@ async def verify_email(response: Response, token: str = Body(...)) -> Any:
 )
 async def login_access_token(
     response: Response,
+    background_tasks: BackgroundTasks,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Token:
     """
@@ -125,7 +127,7 @@ async def login_access_token(
     user = await User.find_one(User.email == form_data.username)
     if not user:
         raise USER_NOT_FOUND
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await verify_user_password(user, form_data.password, background_tasks):
         raise INCORRECT_PASSWORD
     elif not user.is_active:
         raise INACTIVE_USER
@@ -176,16 +178,17 @@ async def reset_password(body: NewPassword) -> Message:
     elif not user.is_active:
         raise INACTIVE_USER
 
-    hashed_password = get_password_hash(password=body.new_password)
+    hashed_password = await get_password_hash_async(password=body.new_password)
     user.hashed_password = hashed_password
 
     await user.save()
+    await revoke_user_tokens(user.id)
     return Message(message="Password updated successfully")
 
 
 @router.post(
     "/password-recovery-html-content/{email}",
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_superuser_principal)],
     response_class=HTMLResponse,
 )
 async def recover_password_html_content(email: str) -> Any:
@@ -219,6 +222,8 @@ async def refresh_token(response: Response, refresh_token: str = Cookie(...)):
     user = await User.get(user_id)
     if not user:
         raise USER_NOT_FOUND
+    if token_payload.ver != user.token_version:
+        raise INVALID_OR_EXPIRED_TOKEN
 
     access_token = await authentication(response, user)
 
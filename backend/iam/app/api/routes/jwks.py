@@ -0,0 +1,25 @@
+# path: app/api/routes/jwks.py
+
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Response
+
+from app.core.keys import asymmetric_signing, get_keyring
+
+logger = logging.getLogger()
+
+router = APIRouter()
+
+
+@router.get("/.well-known/jwks.json")
+def read_jwks(response: Response) -> dict[str, Any]:
+    """
+    액세스 토큰 검증용 공개키 목록 (JWKS)
+    다른 서비스는 이 키로 토큰을 로컬에서 검증하며, 교체 중인 이전 키도 함께 공개됩니다.
+    HS256 으로 서명 중이면 빈 목록을 반환합니다.
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    if not asymmetric_signing():
+        return {"keys": []}
+    return get_keyring().jwks()
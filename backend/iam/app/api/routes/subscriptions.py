@@ -13,8 +13,8 @@ from app.services.subscription_service import (
     update_subscription,
     cancel_subscription,
 )
-from app.api.deps import get_current_active_verified_user
-from app.schemas.token import Message
+from app.api.deps import get_current_active_verified_user, get_current_principal
+from app.schemas.token import Message, Principal
 from app.schemas.user import (
     SubscriptionCreate,
     SubscriptionPublic,
@@ -52,8 +52,8 @@ async def subscribe_user(
     await subscription.save()
 
     # 사용자(User)의 subscription 필드를 생성된 Subscription의 ID로 업데이트
-    current_user.subscription = subscription.id
-    await current_user.save()
+    # (current_user 는 캐시된 사본일 수 있으므로 전체를 save 하지 않고 변경한 필드만 저장)
+    await current_user.set({"subscription": subscription.id})
 
     # 응답 DTO 구성: 각 서비스는 AppPublic 모델로 변환
     subscription_data = subscription.model_dump(by_alias=True)
@@ -65,7 +65,7 @@ async def subscribe_user(
 
 
 @router.get("/", response_model=SubscriptionPublic)
-async def get_subscription(user: User = Depends(get_current_active_verified_user)):
+async def get_subscription(user: Principal = Depends(get_current_principal)):
     """유저 구독 정보 조회 API"""
     subscription = await get_user_subscription(user.id)
     if not subscription:
@@ -81,7 +81,7 @@ async def get_subscription(user: User = Depends(get_current_active_verified_user
 @router.patch("/", response_model=SubscriptionPublic)
 async def update_user_subscription(
     entry: SubscriptionUpdate,
-    current_user: User = Depends(get_current_active_verified_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """유저 구독 정보 수정 API"""
     subscription = await get_user_subscription(current_user.id)
@@ -112,7 +112,7 @@ async def cancel_user_subscription(
 async def add_app_to_subscription(
     subscription_id: PydanticObjectId,
     app_id: PydanticObjectId,
-    current_user: User = Depends(get_current_active_verified_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     특정 구독에 서비스 추가 API
@@ -147,7 +147,7 @@ async def add_app_to_subscription(
 async def remove_app_from_subscription(
     subscription_id: PydanticObjectId,
     app_id: PydanticObjectId,
-    current_user: User = Depends(get_current_active_verified_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     특정 구독에서 서비스 삭제 API
@@ -3,10 +3,12 @@
 import logging  # ✅ MongoDB의 정규식 연산자 사용
 
 from typing import Any, Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
-from app.api.deps import get_current_active_verified_user
-from app.core.security import get_password_hash, verify_password
+from app.api.deps import get_current_active_verified_user, get_current_principal
+from app.auth.authentication import authentication
+from app.auth.token_state import revoke_user_tokens
+from app.core.security import get_password_hash_async, verify_password_async
 from app.models import User
 from app.schemas.token import Message
 from app.schemas.user import (
@@ -40,12 +42,12 @@ async def read_user_me(
     "/search",
     response_model=list[UserSearchPublic],
     response_description="Search users by partial email (excluding domain) or name",
-    dependencies=[Depends(get_current_active_verified_user)],
+    dependencies=[Depends(get_current_principal)],
 )
 async def search_user(
     email: Optional[str] = Query(None, min_length=2, max_length=100),
     fullname: Optional[str] = Query(None, min_length=2, max_length=100),
-)-> list[UserSearchPublic]:
+) -> list[UserSearchPublic]:
     """
     이메일의 로컬 부분 또는 이름의 일부로 사용자 검색 (도메인 제외)
     """
@@ -72,7 +74,7 @@ async def search_user(
 @router.get(
     "/{user_id}",
     response_model=UserPublic,
-    dependencies=[Depends(get_current_active_verified_user)],
+    dependencies=[Depends(get_current_principal)],
 )
 async def read_user_by_id(
     user_id: str,
@@ -89,7 +91,7 @@ async def read_user_by_id(
 @router.get(
     "/",
     response_model=UserPublic,
-    dependencies=[Depends(get_current_active_verified_user)],
+    dependencies=[Depends(get_current_principal)],
 )
 async def read_user_by_email(
     email: str,
@@ -114,9 +116,7 @@ async def update_me(
     """
     내 정보 업데이트
     """
-    entry = await User.get(current_user.id)
-    if not entry:
-        raise USER_NOT_FOUND
+    entry = current_user
     update_fields = update_data.model_dump(exclude_unset=True)
     if update_fields:
         await entry.update({"$set": update_fields})
@@ -128,21 +128,25 @@ async def update_me(
     response_model=Message,
 )
 async def update_password(
+    response: Response,
     entry: UpdatePassword,
     current_user: User = Depends(get_current_active_verified_user),
 ) -> Any:
     """
     내 비밀번호 변경
     """
-    user = await User.get(current_user.id)
-    if not user:
-        raise USER_NOT_FOUND
-
-    if not verify_password(entry.current_password, user.hashed_password):
+    user = current_user
+    if not await verify_password_async(entry.current_password, user.hashed_password):
         raise OLD_PASSWORD_INCORRECT
 
-    user.hashed_password = get_password_hash(entry.new_password)
-    await user.save()
+    # 캐시된 사본 전체를 덮어쓰지 않도록 변경한 필드만 저장
+    await user.set(
+        {"hashed_password": await get_password_hash_async(entry.new_password)}
+    )
+
+    # 다른 세션의 토큰은 무효화하고 현재 세션에는 새 토큰을 발급
+    user.token_version = await revoke_user_tokens(user.id) or user.token_version
+    await authentication(response, user)
     return Message(message="패스워드가 변경되었습니다.")
 
 
@@ -153,8 +157,5 @@ async def delete_me(
     """
     내 계정 탈퇴
     """
-    user = await User.get(current_user.id)
-    if not user:
-        raise USER_NOT_FOUND
-    await user.delete()
+    await current_user.delete()
     return Message(message="계정이 삭제되었습니다.")
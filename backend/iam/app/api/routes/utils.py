@@ -1,10 +1,14 @@
 # path: app/api/routes/utils.py
 
 import logging
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
-from app.api.deps import get_current_active_superuser
+from app.api.deps import get_current_superuser_principal
+from app.core.password_pool import password_pool
+from app.core.user_cache import user_cache
 from app.schemas.token import Message
 from app.utils.email.email_gen import generate_test_email
 from app.utils.email.email_sending import send_email
@@ -16,7 +20,7 @@ router = APIRouter()
 
 @router.post(
     "/test-email/",
-    dependencies=[Depends(get_current_active_superuser)],
+    dependencies=[Depends(get_current_superuser_principal)],
     status_code=201,
 )
 def test_email(email_to: EmailStr) -> Message:
@@ -30,3 +34,25 @@ def test_email(email_to: EmailStr) -> Message:
         html_content=email_data.html_content,
     )
     return Message(message="Test email sent")
+
+
+@router.get(
+    "/password-pool",
+    dependencies=[Depends(get_current_superuser_principal)],
+)
+def password_pool_stats() -> dict[str, Any]:
+    """
+    비밀번호 해싱 풀 상태 (실행 중/대기 중 작업 수, 최대 대기열 깊이, 거절/시간 초과 수, 평균 대기·실행 시간)
+    """
+    return password_pool.stats()
+
+
+@router.get(
+    "/user-cache",
+    dependencies=[Depends(get_current_superuser_principal)],
+)
+def user_cache_stats() -> dict[str, Any]:
+    """
+    사용자 캐시 상태 (크기, 적중/미적중 수와 적중률, LRU 제거 수, 무효화 수, 전파 방식)
+    """
+    return user_cache.stats()
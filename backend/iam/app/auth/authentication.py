@@ -39,10 +39,12 @@ async def authentication(response: Response, user: User) -> tuple[str, str]:
             username=user.fullname or user.email.split("@")[0],
             apps=user.apps,
             is_superuser=user.is_superuser,
+            token_version=user.token_version,
         )
         refresh_token = create_refresh_token(
             subject=str(user.id),
             expired_delta=refresh_token_expires,
+            token_version=user.token_version,
         )
 
         # 쿠키 설정
@@ -11,7 +11,7 @@ from httpx_oauth.clients.naver import NaverOAuth2
 from app.core.config import settings
 from app.exceptions.auth import FAILED_TO_GET_OAUTH_URL, ERROR_IN_TOKEN_GENERATION
 from app.models.user import User, OAuthAccount
-from app.core.security import generate_secure_password, get_password_hash
+from app.core.security import generate_secure_password, get_password_hash_async
 from app.utils.email.email_gen import generate_new_account_email
 from app.utils.email.email_sending import send_email
 from app.schemas.oauth2 import (
@@ -202,7 +202,7 @@ class OAuthManager:
             else:
                 # 신규가입
                 random_password = generate_secure_password()
-                hashed_pw = get_password_hash(random_password)
+                hashed_pw = await get_password_hash_async(random_password)
 
                 new_user = User(
                     fullname=fullname or None,
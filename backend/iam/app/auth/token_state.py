@@ -0,0 +1,83 @@
+# path: app/auth/token_state.py
+
+import logging
+import time
+from typing import Optional
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.core.user_cache import user_cache
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class TokenState(BaseModel):
+    """토큰 유효성 확인에 필요한 사용자 상태 (users 문서의 일부 필드)"""
+
+    token_version: int = 0
+    is_active: bool = True
+    is_verified: bool = False
+
+
+class TokenStateCache:
+    """
+    사용자별 TokenState 를 PRINCIPAL_CHECK_TTL 초 동안 보관하는 프로세스 내 캐시
+    - claims principal 은 요청마다 User 전체를 읽는 대신 이 상태로 토큰 버전/활성 여부만 확인합니다.
+    - 사용자 캐시 무효화(user_cache.subscribe)와 함께 비워지므로 같은 워커에서는 즉시,
+      다른 워커에서는 무효화 전파 방식(USER_CACHE_BUS)에 따라 즉시 또는 최대 TTL 이후에 반영됩니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[PydanticObjectId, tuple[float, TokenState]] = {}
+        # 조회 중 무효화(토큰 폐기 등)가 일어나면 조회 결과(이전 값)를 캐시하지 않기 위한 카운터
+        self._epoch = 0
+
+    async def get(self, user_id: PydanticObjectId) -> Optional[TokenState]:
+        entry = self._entries.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        epoch = self._epoch
+        doc = await User.get_motor_collection().find_one(
+            {"_id": user_id},
+            {"token_version": 1, "is_active": 1, "is_verified": 1},
+        )
+        if doc is None:
+            self._entries.pop(user_id, None)
+            return None
+        state = TokenState(**doc)
+        if epoch == self._epoch:
+            self._entries[user_id] = (time.monotonic() + self.ttl, state)
+        return state
+
+    def invalidate(self, user_id: Optional[PydanticObjectId] = None) -> None:
+        self._epoch += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+
+token_states = TokenStateCache(settings.PRINCIPAL_CHECK_TTL)
+# 사용자 문서가 변경되면(다른 워커 포함) 토큰 상태도 다시 읽습니다.
+user_cache.subscribe(token_states.invalidate)
+
+
+async def revoke_user_tokens(user_id: PydanticObjectId) -> Optional[int]:
+    """
+    사용자의 token_version 을 올려 이미 발급된 액세스 토큰을 모두 무효화하고 새 버전을 반환합니다.
+    비밀번호 변경/재설정, 권한·활성 상태 변경 시 호출합니다.
+    """
+    doc = await User.get_motor_collection().find_one_and_update(
+        {"_id": user_id},
+        {"$inc": {"token_version": 1}},
+        projection={"token_version": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    await user_cache.invalidate(user_id)
+    return doc["token_version"] if doc else None
@@ -53,9 +53,34 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     EMAIL_TOKEN_EXPIRE_HOURS: int = 48
+    # 액세스/리프레시 토큰 서명 (HS256: SECRET_KEY, RS256/EdDSA: JWT_KEYS_DIR 의 <kid>.pem, app/core/keys.py 참고)
+    # 이메일/비밀번호 재설정 토큰은 IAM 내부에서만 검증하므로 ALGORITHM(HS256)을 그대로 사용합니다.
+    JWT_SIGNING_ALGORITHM: Literal["HS256", "RS256", "EdDSA"] = "HS256"
+    JWT_KEYS_DIR: str = "keys"
+    JWT_ACTIVE_KID: str | None = None
+    # 비대칭 서명 전환 후에도 기존 HS256 토큰을 만료 시까지 허용 (IAM 내부 검증에만 해당)
+    JWT_ACCEPT_HS256: bool = True
+    # claims principal 의 토큰 버전/활성 상태 캐시 유지 시간(초)
+    PRINCIPAL_CHECK_TTL: int = 30
     SECURE_COOKIE: bool
     SAME_SITE: Literal["strict", "lax", "none"]
 
+    # Argon2 파라미터 (기본값은 argon2-cffi 기본값, memory_cost 단위는 KiB)
+    # 값을 바꾸면 기존 해시는 다음 로그인 때 새 파라미터로 다시 해싱됩니다.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
+    # 사용자 캐시 설정 (USER_CACHE_BUS: 워커 간 무효화 전파 방식, memory 는 프로세스 내에서만 전달)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_BUS: Literal["memory", "mongo"] = "memory"
+
+    # 비밀번호 해싱 풀 설정 (0 이면 min(4, CPU 수))
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_TIMEOUT: float = 10.0
+
     # CORS 설정
     BACKEND_CORS_ORIGINS: Annotated[list[AnyUrl] | str, BeforeValidator(parse_cors)] = [
         "http://localhost:3000"
@@ -86,7 +111,6 @@ class Settings(BaseSettings):
                 f"mongodb://{self.MONGODB_USER}:{self.MONGODB_PASSWORD}"
                 f"@{self.MONGODB_SERVER}/{self.APP_NAME}?authSource=admin"
             )
-            
 
     # OAuth2 설정
     GOOGLE_CLIENT_ID: str
@@ -0,0 +1,108 @@
+# path: app/core/keys.py
+"""
+액세스/리프레시 토큰 서명용 비대칭 키 링 (JWT_SIGNING_ALGORITHM 이 RS256 또는 EdDSA 일 때 사용)
+
+- JWT_KEYS_DIR 의 <kid>.pem (PKCS8 개인키) 파일을 모두 읽습니다. 키 종류로 알고리즘을 정합니다. (RSA → RS256, Ed25519 → EdDSA)
+- 서명에는 JWT_ACTIVE_KID(없으면 파일명 정렬 기준 마지막 키)를 사용하고, 검증과 JWKS 공개에는 모든 키를 사용합니다.
+- 키 교체: 새 키 파일 추가 → JWT_ACTIVE_KID 변경 후 재시작 → 기존 토큰이 모두 만료된 뒤(REFRESH_TOKEN_EXPIRE_DAYS) 이전 키 파일 삭제
+- dev/local 에서 키가 없으면 개발용 키를 생성해 저장합니다. (여러 워커가 같은 키를 쓰도록 파일로 공유)
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from app.core.config import settings
+
+logger = logging.getLogger()
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    private_key: Any
+    public_key: Any
+
+    def to_jwk(self) -> dict[str, Any]:
+        if self.algorithm == "RS256":
+            jwk = RSAAlgorithm.to_jwk(self.public_key, as_dict=True)
+        else:
+            jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+        return {**jwk, "kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+def _load_key(path: Path) -> SigningKey:
+    private_key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+    if isinstance(private_key, rsa.RSAPrivateKey):
+        algorithm = "RS256"
+    elif isinstance(private_key, ed25519.Ed25519PrivateKey):
+        algorithm = "EdDSA"
+    else:
+        raise ValueError(f"지원하지 않는 키 종류입니다: {path.name}")
+    return SigningKey(path.stem, algorithm, private_key, private_key.public_key())
+
+
+def _generate_dev_key(directory: Path, algorithm: str) -> None:
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"dev-{algorithm.lower()}.pem"
+    tmp = directory / f".{path.name}.{os.getpid()}"
+    tmp.write_bytes(pem)
+    try:
+        # 동시에 시작한 워커 중 먼저 링크한 키만 사용됩니다.
+        os.link(tmp, path)
+        logger.warning(f"개발용 JWT 서명 키를 생성했습니다: {path}")
+    except FileExistsError:
+        pass
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class KeyRing:
+    def __init__(self, keys: list[SigningKey], active_kid: Optional[str] = None):
+        if not keys:
+            raise ValueError("JWT 서명 키가 없습니다.")
+        self._keys = {key.kid: key for key in keys}
+        kid = active_kid or sorted(self._keys)[-1]
+        if kid not in self._keys:
+            raise ValueError(f"JWT_ACTIVE_KID 에 해당하는 키가 없습니다: {kid}")
+        self.active = self._keys[kid]
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        return self._keys.get(kid) if kid else None
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        return {"keys": [key.to_jwk() for key in self._keys.values()]}
+
+    @classmethod
+    def load(cls, directory: Path, active_kid: Optional[str] = None) -> "KeyRing":
+        paths = sorted(directory.glob("*.pem")) if directory.is_dir() else []
+        if not paths and settings.ENVIRONMENT in ("dev", "local"):
+            _generate_dev_key(directory, settings.JWT_SIGNING_ALGORITHM)
+            paths = sorted(directory.glob("*.pem"))
+        return cls([_load_key(path) for path in paths], active_kid)
+
+
+def asymmetric_signing() -> bool:
+    return settings.JWT_SIGNING_ALGORITHM != "HS256"
+
+
+@lru_cache
+def get_keyring() -> KeyRing:
+    return KeyRing.load(Path(settings.JWT_KEYS_DIR), settings.JWT_ACTIVE_KID)
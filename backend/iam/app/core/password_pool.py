@@ -0,0 +1,139 @@
+# path: app/core/password_pool.py
+"""
+Argon2 해싱/검증 전용 스레드 풀
+
+Argon2 는 한 번에 수십~100ms 의 CPU 를 쓰므로 async 라우트에서 직접 호출하면 이벤트 루프가 그동안 멈춥니다.
+argon2-cffi 는 해싱 중 GIL 을 놓기 때문에 스레드 풀에서 실행하면 루프를 막지 않고 코어 수만큼 병렬로 처리됩니다.
+
+- PASSWORD_HASH_WORKERS: 동시에 실행할 해싱 작업 수 (워커 스레드 수)
+- PASSWORD_HASH_MAX_PENDING: 실행 중 + 대기 중 작업 상한. 넘으면 즉시 503 을 반환해 대기열이 무한히 쌓이지 않게 합니다.
+- PASSWORD_HASH_TIMEOUT: 결과를 기다리는 최대 시간(초). 초과 시 503 (작업 자체는 끝까지 실행된 뒤 자리를 반환합니다)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.exceptions.auth import PASSWORD_HASH_BUSY
+
+logger = logging.getLogger()
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """크기와 대기열이 제한된 해싱 전용 스레드 풀 (대기열 깊이/대기·실행 시간 지표 포함)"""
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0  # 실행 중 + 대기 중
+        self._running = 0
+        self.max_queue_depth = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._wait_total = 0.0
+        self._run_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="argon2"
+            )
+        return self._executor
+
+    def _call(self, fn: Callable[..., T], args: tuple, queued_at: float) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self._wait_total += started - queued_at
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._run_total += time.perf_counter() - started
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """fn(*args) 를 풀에서 실행하고 결과를 기다립니다. 대기열이 가득 찼거나 시간 초과 시 PASSWORD_HASH_BUSY"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PASSWORD_HASH_BUSY
+            self._pending += 1
+            self.submitted += 1
+            self.max_queue_depth = max(
+                self.max_queue_depth, self._pending - self._running
+            )
+
+        try:
+            future = self._get_executor().submit(
+                self._call, fn, args, time.perf_counter()
+            )
+        except RuntimeError:
+            # 종료 중인 풀
+            with self._lock:
+                self._pending -= 1
+            raise PASSWORD_HASH_BUSY
+        # 호출자가 시간 초과로 떠나도 작업이 끝날 때 자리를 반환합니다.
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            logger.warning(
+                f"비밀번호 해싱 대기 시간 초과 ({self.timeout}s), 대기 {self.queue_depth}건"
+            )
+            raise PASSWORD_HASH_BUSY
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._pending - self._running, 0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            done = self.completed
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "running": self._running,
+                "queued": max(self._pending - self._running, 0),
+                "max_queue_depth": self.max_queue_depth,
+                "submitted": self.submitted,
+                "completed": done,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self._wait_total / done * 1000, 2)
+                if done
+                else 0.0,
+                "avg_run_ms": round(self._run_total / done * 1000, 2) if done else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1),
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT,
+)
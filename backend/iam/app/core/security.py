@@ -7,18 +7,55 @@ import secrets
 import string
 import jwt
 from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
 from jwt.exceptions import InvalidTokenError
 
 from app.core.config import settings
+from app.core.keys import asymmetric_signing, get_keyring
+from app.core.password_pool import password_pool
 from app.schemas.token import TokenPayload
 from app.exceptions.auth import INVALID_OR_EXPIRED_TOKEN, INVALID_TOKEN_TYPE
 
 
 logger = logging.getLogger()
 
-# Argon2 해싱 도구 초기화
-password_hasher = PasswordHasher()
+# Argon2 해싱 도구 초기화 (환경별 파라미터는 설정에서 조정)
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+
+def encode_jwt(payload: dict[str, Any]) -> str:
+    """
+    액세스/리프레시 토큰 서명
+    RS256/EdDSA 이면 활성 키로 서명하고 헤더에 kid 를 넣어 JWKS 로 검증할 수 있게 합니다.
+    """
+    if not asymmetric_signing():
+        return jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+    key = get_keyring().active
+    return jwt.encode(
+        payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid}
+    )
+
+
+def decode_jwt(token: str) -> dict[str, Any]:
+    """
+    액세스/리프레시 토큰 검증 (실패 시 InvalidTokenError)
+    헤더의 kid 로 키 링에서 공개키를 찾으며, HS256 토큰은 JWT_ACCEPT_HS256 일 때만 허용합니다.
+    """
+    header = jwt.get_unverified_header(token)
+    if header.get("alg") == "HS256":
+        if asymmetric_signing() and not settings.JWT_ACCEPT_HS256:
+            raise InvalidTokenError("HS256 토큰은 허용되지 않습니다.")
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    if not asymmetric_signing():
+        raise InvalidTokenError("비대칭 서명 토큰을 검증할 수 없습니다.")
+    key = get_keyring().get(header.get("kid"))
+    if key is None:
+        raise InvalidTokenError(f"알 수 없는 kid: {header.get('kid')}")
+    return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
 
 
 def create_access_token(
@@ -28,6 +65,7 @@ def create_access_token(
     username: str,
     apps: Optional[list[str]] = None,
     is_superuser: bool = False,
+    token_version: int = 0,
 ) -> str:
     expire = datetime.now(timezone.utc) + expired_delta
     to_encode = {
@@ -37,33 +75,24 @@ def create_access_token(
         "name": username,
         "apps": apps,
         "is_superuser": is_superuser,
+        "ver": token_version,
     }
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
-        headers={"kid": "web-client-key"},
-    )
-    return encoded_jwt
+    return encode_jwt(to_encode)
 
 
 def create_refresh_token(
     subject: str | Any,
     expired_delta: timedelta,
+    token_version: int = 0,
 ) -> str:
     expire = datetime.now(timezone.utc) + expired_delta
     to_encode = {
         "exp": expire,
         "sub": str(subject),
         "type": "refresh",
+        "ver": token_version,
     }
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
-        headers={"kid": "web-client-key"},
-    )
-    return encoded_jwt
+    return encode_jwt(to_encode)
 
 
 def verify_password(plain_password: str, password: str) -> bool:
@@ -80,6 +109,17 @@ def verify_password(plain_password: str, password: str) -> bool:
         return False
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    해시의 파라미터가 현재 설정과 다른지 여부
+    (Argon2 형식이 아닌 해시는 검증 단계에서 이미 실패하므로 다시 해싱하지 않습니다.)
+    """
+    try:
+        return password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
+
+
 def get_password_hash(password: str) -> str:
     """
     비밀번호 해싱
@@ -89,6 +129,19 @@ def get_password_hash(password: str) -> str:
     return password_hasher.hash(password)
 
 
+async def verify_password_async(plain_password: str, password: str) -> bool:
+    """
+    비밀번호 검증 (해싱 풀에서 실행, async 라우트에서는 이 함수를 사용)
+    풀이 가득 찼거나 시간 초과 시 PASSWORD_HASH_BUSY(503)
+    """
+    return await password_pool.run(verify_password, plain_password, password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (해싱 풀에서 실행, async 라우트에서는 이 함수를 사용)"""
+    return await password_pool.run(get_password_hash, password)
+
+
 def generate_password_reset_token(email: str) -> str:
     delta = timedelta(hours=settings.EMAIL_TOKEN_EXPIRE_HOURS)
     now = datetime.now(timezone.utc)
@@ -124,9 +177,7 @@ def validate_token(token: str, expected_type: str = "access") -> TokenPayload:
     올바른 경우 TokenPayload 인스턴스를 반환하며, 그렇지 않으면 HTTPException을 발생시킵니다.
     """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_jwt(token)
         token_data = TokenPayload(**payload)
     except jwt.PyJWTError as e:
         raise INVALID_OR_EXPIRED_TOKEN from e
@@ -0,0 +1,241 @@
+# path: app/core/user_cache.py
+"""
+get_current_user 용 사용자 캐시 (LRU + TTL)
+
+- 키: 사용자 ID, 최대 USER_CACHE_SIZE 개, 항목마다 USER_CACHE_TTL 초 후 만료
+- User 의 save/replace/update/delete 이벤트 훅에서 invalidate 를 호출해 해당 항목을 비웁니다.
+  (쿼리 단위 update 나 motor 직접 쓰기는 훅이 실행되지 않으므로 호출한 쪽에서 invalidate 해야 합니다.)
+- 다른 워커로의 무효화 전파는 InvalidationBus 로 분리했습니다.
+  기본값(memory)은 같은 프로세스 안에서만 전달하며, mongo 는 capped 컬렉션을 tail 해 워커 간에 전달합니다.
+  memory 사용 시 다른 워커의 변경은 TTL 이 지나야 반영됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Protocol
+
+from beanie import Document, PydanticObjectId
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+
+from app.core.config import settings
+
+logger = logging.getLogger()
+
+Listener = Callable[[PydanticObjectId], None]
+
+
+class InvalidationBus(Protocol):
+    """사용자 캐시 무효화 메시지 전달 인터페이스"""
+
+    async def start(self, on_message: Listener) -> None:
+        ...
+
+    async def publish(self, user_id: PydanticObjectId) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
+
+
+class InMemoryInvalidationBus:
+    """프로세스 내 전달 (무효화는 이미 로컬에서 처리되므로 전달할 대상이 없습니다)"""
+
+    async def start(self, on_message: Listener) -> None:
+        pass
+
+    async def publish(self, user_id: PydanticObjectId) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class MongoInvalidationBus:
+    """
+    capped 컬렉션에 무효화 메시지를 기록하고 tailable cursor 로 다른 워커의 메시지를 받습니다.
+    추가 인프라 없이 같은 MongoDB 를 쓰는 모든 워커 간에 전달됩니다.
+    """
+
+    def __init__(
+        self, collection_name: str = "user_cache_invalidations", size: int = 1024 * 1024
+    ):
+        self.collection_name = collection_name
+        self.size = size
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._collection = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, on_message: Listener) -> None:
+        from app.models.user import User
+
+        database = User.get_motor_collection().database
+        try:
+            await database.create_collection(
+                self.collection_name, capped=True, size=self.size
+            )
+        except CollectionInvalid:
+            pass
+        self._collection = database[self.collection_name]
+        # tailable cursor 는 빈 컬렉션에서 바로 닫히므로 기준 문서를 하나 남깁니다.
+        last = await self._collection.find_one(sort=[("$natural", -1)])
+        if last is None:
+            result = await self._collection.insert_one(
+                {"origin": self.origin, "user_id": None}
+            )
+            last = {"_id": result.inserted_id}
+        self._task = asyncio.create_task(
+            self._tail(last["_id"], on_message), name="user-cache-bus"
+        )
+
+    async def _tail(self, last_id: Any, on_message: Listener) -> None:
+        """
+        삽입 순서($natural)대로 읽으면서 마지막으로 처리한 문서(last_id)까지는 건너뜁니다.
+        같은 초에 여러 프로세스가 만든 ObjectId 는 삽입 순서대로 정렬되지 않으므로 _id 크기로 거르지 않습니다.
+        last_id 가 capped 컬렉션에서 밀려났으면 남아 있는 메시지를 모두 다시 처리합니다. (중복 무효화는 무해)
+        """
+        while True:
+            try:
+                skipping = (
+                    await self._collection.find_one({"_id": last_id}, {"_id": 1})
+                    is not None
+                )
+                cursor = self._collection.find(
+                    {}, cursor_type=CursorType.TAILABLE_AWAIT
+                )
+                async for doc in cursor:
+                    if skipping:
+                        skipping = doc["_id"] != last_id
+                        continue
+                    last_id = doc["_id"]
+                    if doc.get("user_id") and doc.get("origin") != self.origin:
+                        on_message(doc["user_id"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"사용자 캐시 무효화 구독 오류: {e}")
+            await asyncio.sleep(1)
+
+    async def publish(self, user_id: PydanticObjectId) -> None:
+        if self._collection is None:
+            return
+        try:
+            await self._collection.insert_one(
+                {"origin": self.origin, "user_id": user_id}
+            )
+        except Exception as e:
+            # 다른 워커는 TTL 이후 반영되므로 요청은 실패시키지 않습니다.
+            logger.error(f"사용자 캐시 무효화 전파 실패 ({user_id}): {e}")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def create_invalidation_bus(kind: str) -> InvalidationBus:
+    if kind == "mongo":
+        return MongoInvalidationBus()
+    return InMemoryInvalidationBus()
+
+
+class UserCache:
+    """
+    사용자 ID → User 문서 LRU + TTL 캐시
+    반환하는 문서는 캐시 항목의 복사본이므로 라우트에서 수정/저장해도 캐시에 영향이 없습니다.
+    조회 결과가 없으면 캐시하지 않습니다.
+    """
+
+    def __init__(self, max_size: int, ttl: float, bus: InvalidationBus):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.bus = bus
+        self._entries: OrderedDict[
+            PydanticObjectId, tuple[float, Document]
+        ] = OrderedDict()
+        self._listeners: list[Listener] = []
+        # 조회 중 무효화가 일어나면 조회 결과(이전 값)를 캐시하지 않기 위한 카운터
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def subscribe(self, listener: Listener) -> None:
+        """무효화(로컬/다른 워커) 시 함께 호출할 콜백을 등록합니다."""
+        self._listeners.append(listener)
+
+    async def get(
+        self,
+        user_id: PydanticObjectId,
+        load: Callable[[PydanticObjectId], Awaitable[Optional[Document]]],
+    ) -> Optional[Document]:
+        entry = self._entries.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1].model_copy(deep=True)
+
+        self.misses += 1
+        epoch = self._epoch
+        doc = await load(user_id)
+        if doc is None or epoch != self._epoch:
+            self._entries.pop(user_id, None)
+            return doc
+        self._entries[user_id] = (
+            time.monotonic() + self.ttl,
+            doc.model_copy(deep=True),
+        )
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return doc
+
+    def invalidate_local(self, user_id: PydanticObjectId) -> None:
+        self._epoch += 1
+        self.invalidations += 1
+        self._entries.pop(user_id, None)
+        for listener in self._listeners:
+            listener(user_id)
+
+    async def invalidate(self, user_id: PydanticObjectId) -> None:
+        """이 워커의 항목을 비우고 다른 워커에 무효화를 전파합니다."""
+        self.invalidate_local(user_id)
+        await self.bus.publish(user_id)
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+
+    async def start(self) -> None:
+        await self.bus.start(self.invalidate_local)
+
+    async def stop(self) -> None:
+        await self.bus.stop()
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "bus": type(self.bus).__name__,
+        }
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+    bus=create_invalidation_bus(settings.USER_CACHE_BUS),
+)
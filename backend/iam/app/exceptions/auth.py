@@ -60,3 +60,9 @@ FAILED_TO_GET_OAUTH_URL = HTTPException(
 INVALID_TOKEN_TYPE = HTTPException(
     status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 토큰 타입입니다."
 )
+
+PASSWORD_HASH_BUSY = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+    headers={"Retry-After": "1"},
+)
@@ -11,8 +11,12 @@ from starlette.middleware.cors import CORSMiddleware
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
 
 from app.api.main import api_router
+from app.api.routes import jwks
 from app.core.database import initiate_database, settings
+from app.core.keys import asymmetric_signing, get_keyring
 from app.core.logging import setup_logging
+from app.core.password_pool import password_pool
+from app.core.user_cache import user_cache
 from app.exceptions.handlers import (
     validation_exception_handler,
     http_exception_handler,
@@ -46,7 +50,15 @@ if settings.ENVIRONMENT == "production":
 async def lifespan(app: FastAPI):
     """애플리케이션 시작 시 실행할 코드"""
     app.state.db = await initiate_database()
+    if asymmetric_signing():
+        # 키 파일 오류는 첫 로그인이 아니라 시작 시점에 드러나도록 미리 읽습니다.
+        logger.info(
+            f"JWT 서명 키: {get_keyring().active.kid} ({settings.JWT_SIGNING_ALGORITHM})"
+        )
+    await user_cache.start()
     yield
+    await user_cache.stop()
+    password_pool.shutdown()
     # await app.state.db.close()
 
 
@@ -85,3 +97,4 @@ app.add_exception_handler(Exception, global_exception_handler)
 
 # ✅ API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(jwks.router, tags=["JWKS"])
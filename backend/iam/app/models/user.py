@@ -3,10 +3,21 @@
 from datetime import date, datetime
 from enum import Enum
 from typing import List, Optional
-from beanie import Document, Link, PydanticObjectId
+from beanie import (
+    Delete,
+    Document,
+    Link,
+    PydanticObjectId,
+    Replace,
+    Save,
+    SaveChanges,
+    Update,
+    after_event,
+)
 from pydantic import Field
 from pymongo import IndexModel
 from pymongo.collation import Collation
+from app.core.user_cache import user_cache
 from app.models.base import BaseDocument
 # from app.models.subscription import Subscription
 
@@ -84,7 +95,15 @@ class User(BaseDocument):
 
     oauth_accounts: List[OAuthAccount] = Field(default_factory=list)
     apps: List[str] = Field(default_factory=list)
-
+    # 액세스 토큰의 ver 클레임과 비교, 값을 올리면 이전에 발급된 토큰이 모두 무효화됨
+    token_version: int = 0
+
+    @after_event([Save, Replace, SaveChanges, Update, Delete])
+    async def invalidate_user_cache(self):
+        """
+        문서가 변경/삭제되면 사용자 캐시에서 제거 (다른 워커에도 전파)
+        """
+        await user_cache.invalidate(self.id)
 
     class Settings:
         name = "users"
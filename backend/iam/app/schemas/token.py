@@ -1,4 +1,5 @@
 from typing import List, Optional
+from beanie import PydanticObjectId
 from pydantic import BaseModel, Field
 
 
@@ -13,6 +14,19 @@ class TokenPayload(BaseModel):
     email: Optional[str] = None
     name: Optional[str] = None
     apps: Optional[List[str]] = []
+    is_superuser: bool = False
+    ver: int = 0
+
+
+class Principal(BaseModel):
+    """검증된 액세스 토큰 클레임으로 구성한 현재 사용자 (User 문서를 읽지 않음)"""
+
+    id: PydanticObjectId
+    email: Optional[str] = None
+    name: Optional[str] = None
+    # apps 가 바뀌면 token_version 을 올리므로 get_current_principal 에서 이전 토큰은 거부됩니다.
+    apps: List[str] = []
+    is_superuser: bool = False
 
 
 class NewPassword(BaseModel):
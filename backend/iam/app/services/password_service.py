@@ -0,0 +1,58 @@
+import logging
+
+from beanie import PydanticObjectId
+from fastapi import BackgroundTasks, HTTPException
+
+from app.core.user_cache import user_cache
+from app.core.security import (
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+async def verify_user_password(
+    user: User, plain_password: str, background_tasks: BackgroundTasks
+) -> bool:
+    """
+    사용자 비밀번호 검증
+    검증에 성공했고 저장된 해시의 Argon2 파라미터가 현재 설정과 다르면,
+    응답 후 백그라운드에서 새 파라미터로 다시 해싱해 저장합니다. (강제 재설정 없이 파라미터 변경 반영)
+    """
+    if not await verify_password_async(plain_password, user.hashed_password):
+        return False
+    if password_needs_rehash(user.hashed_password):
+        background_tasks.add_task(
+            rehash_password, user.id, plain_password, user.hashed_password
+        )
+    return True
+
+
+async def rehash_password(
+    user_id: PydanticObjectId, plain_password: str, old_hash: str
+) -> None:
+    """
+    현재 파라미터로 다시 해싱해 저장합니다.
+    그 사이 비밀번호가 변경되었으면(저장된 해시 != old_hash) 덮어쓰지 않습니다.
+    실패해도 로그인에는 영향이 없으며 다음 로그인 때 다시 시도됩니다.
+    """
+    try:
+        new_hash = await get_password_hash_async(plain_password)
+        result = await User.get_motor_collection().update_one(
+            {"_id": user_id, "hashed_password": old_hash},
+            {"$set": {"hashed_password": new_hash}},
+        )
+    except HTTPException:
+        logger.info(f"해싱 풀이 혼잡해 비밀번호 재해싱을 건너뜁니다. (user={user_id})")
+        return
+    except Exception as e:
+        logger.error(f"비밀번호 재해싱 실패 (user={user_id}): {e}")
+        return
+    if result.modified_count:
+        await user_cache.invalidate(user_id)
+        logger.info(
+            f"비밀번호 해시를 현재 Argon2 파라미터로 갱신했습니다. (user={user_id})"
+        )
@@ -0,0 +1,129 @@
+# benchmarks/bench_password_pool.py
+"""
+로그인 동시성 부하 테스트 (Argon2 검증을 이벤트 루프에서 직접 실행 vs 해싱 풀에서 실행)
+
+    cd backend/iam
+    python -m benchmarks.bench_password_pool --requests 400 --concurrency 32 --workers 4
+
+로그인 한 건 = DB 조회를 흉내 낸 대기(--db-ms) + 비밀번호 검증.
+동시에 --probe-ms 간격으로 가벼운 요청(프로브)을 흘려 보내 '다른 요청'이 얼마나 지연되는지도 측정합니다.
+inline 모드에서는 검증이 루프를 막아 프로브 지연이 로그인 처리 시간만큼 늘어나고,
+pool 모드에서는 프로브가 거의 지연되지 않으며 로그인 p99 는 풀 크기와 대기열 깊이로 결정됩니다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# 설정 파일 없이도 실행할 수 있도록 필수 설정에 기본값을 채웁니다. (.env 가 있으면 그 값이 우선)
+for _name, _value in {
+    "PROJECT_NAME": "bench",
+    "DOMAIN": "localhost",
+    "FRONTEND_HOST": "http://localhost:3000",
+    "SECRET_KEY": "bench",
+    "SECURE_COOKIE": "false",
+    "SAME_SITE": "lax",
+    "MONGODB_SERVER": "localhost:27017",
+    "MONGODB_USER": "bench",
+    "MONGODB_PASSWORD": "bench",
+    "GOOGLE_CLIENT_ID": "-",
+    "GOOGLE_CLIENT_SECRET": "-",
+    "KAKAO_CLIENT_ID": "-",
+    "KAKAO_CLIENT_SECRET": "-",
+    "NAVER_CLIENT_ID": "-",
+    "NAVER_CLIENT_SECRET": "-",
+    "FIRST_SUPERUSER": "bench@example.com",
+    "FIRST_SUPERUSER_PASSWORD": "bench",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from app.core import security  # noqa: E402
+from app.core.password_pool import PasswordHashPool  # noqa: E402
+
+
+def percentile(values: list[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+async def probe(stop: asyncio.Event, interval: float, lags: list[float]) -> None:
+    """interval 마다 깨어나 예정 시각보다 얼마나 늦었는지(루프 정체 시간) 기록합니다."""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - expected) * 1000)
+
+
+async def run_mode(mode: str, args: argparse.Namespace, hashed: str) -> None:
+    if mode == "pool":
+        # 벤치마크 중 거절이 생기지 않도록 대기열 상한을 넉넉히 잡습니다.
+        security.password_pool = PasswordHashPool(
+            args.workers, args.requests, timeout=60
+        )
+
+    async def login() -> float:
+        start = time.perf_counter()
+        await asyncio.sleep(args.db_ms / 1000)
+        if mode == "inline":
+            ok = security.verify_password(args.password, hashed)
+        else:
+            ok = await security.verify_password_async(args.password, hashed)
+        assert ok
+        return (time.perf_counter() - start) * 1000
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited() -> float:
+        async with semaphore:
+            return await login()
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe_task = asyncio.create_task(probe(stop, args.probe_ms / 1000, lags))
+    started = time.perf_counter()
+    timings = await asyncio.gather(*(limited() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+
+    print(
+        f"{mode:<6} logins/s={args.requests / elapsed:7.1f} "
+        f"login p50={statistics.median(timings):8.1f}ms p99={percentile(timings, 99):8.1f}ms | "
+        f"probe lag p50={statistics.median(lags):7.1f}ms p99={percentile(lags, 99):7.1f}ms"
+    )
+    if mode == "pool":
+        stats = security.password_pool.stats()
+        print(
+            f"       pool workers={stats['workers']} max_queue_depth={stats['max_queue_depth']} "
+            f"avg_wait={stats['avg_wait_ms']}ms avg_run={stats['avg_run_ms']}ms"
+        )
+        security.password_pool.shutdown()
+
+
+async def run(args: argparse.Namespace) -> None:
+    hashed = security.get_password_hash(args.password)
+    for mode in args.modes:
+        await run_mode(mode, args, hashed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="로그인 동시성 부하 테스트 (Argon2 inline vs 해싱 풀)"
+    )
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument(
+        "--db-ms", type=float, default=2.0, help="로그인당 DB 조회 지연(흉내)"
+    )
+    parser.add_argument("--probe-ms", type=float, default=10.0, help="프로브 요청 간격")
+    parser.add_argument("--password", default="correct horse battery staple")
+    parser.add_argument(
+        "--modes", nargs="+", choices=["inline", "pool"], default=["inline", "pool"]
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
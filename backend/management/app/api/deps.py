@@ -0,0 +1,59 @@
+# Path: app/api/deps.py
+
+import logging
+from typing import Optional
+
+from fastapi import Cookie, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt.exceptions import InvalidTokenError
+from pydantic import BaseModel, ValidationError
+
+from app.core.jwks import jwks_verifier
+
+logger = logging.getLogger()
+
+bearer = HTTPBearer(auto_error=False)
+
+
+class Principal(BaseModel):
+    """IAM 액세스 토큰 클레임으로 구성한 현재 사용자"""
+
+    id: str
+    email: Optional[str] = None
+    name: Optional[str] = None
+    # IAM 은 apps 변경 시 token_version 을 올리지만 여기서는 폐기 여부를 확인할 수 없으므로
+    # 액세스 토큰 만료(ACCESS_TOKEN_EXPIRE_MINUTES) 전까지는 이전 값일 수 있습니다.
+    apps: list[str] = []
+    is_superuser: bool = False
+
+
+async def get_current_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
+    access_token: Optional[str] = Cookie(None),
+) -> Principal:
+    """
+    Authorization: Bearer 헤더(없으면 access_token 쿠키)의 IAM 액세스 토큰을 JWKS 로 로컬 검증합니다.
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="토큰이 제공되지 않았습니다.")
+    try:
+        claims = await jwks_verifier.verify(token)
+        if claims.get("type", "access") != "access":
+            raise InvalidTokenError("액세스 토큰이 아닙니다.")
+        return Principal(
+            id=claims["sub"],
+            email=claims.get("email"),
+            name=claims.get("name"),
+            apps=claims.get("apps") or [],
+            is_superuser=claims.get("is_superuser", False),
+        )
+    except (InvalidTokenError, KeyError, ValidationError) as e:
+        logger.info(f"액세스 토큰 검증 실패: {e}")
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않거나 만료된 토큰입니다.")
+
+
+def get_current_superuser(principal: Principal = Depends(get_current_principal)) -> Principal:
+    if not principal.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="슈퍼유저 권한이 없습니다.")
+    return principal
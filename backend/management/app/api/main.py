@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from app.api.routes import (
     categories,
     brands,
@@ -9,11 +9,17 @@ from app.api.routes import (
     listings,
     rankings,
     media_assets,
+    cache,
+    search,
 )
+from app.api.deps import get_current_principal
+from app.core.config import settings
 
 
-
-api_router = APIRouter()
+# IAM_AUTH_REQUIRED 이면 모든 API 에서 IAM 액세스 토큰을 로컬(JWKS)로 검증합니다.
+api_router = APIRouter(
+    dependencies=[Depends(get_current_principal)] if settings.IAM_AUTH_REQUIRED else []
+)
 
 
 api_router.include_router(categories.router, prefix="/categories", tags=["category"])
@@ -29,4 +35,6 @@ api_router.include_router(rankings.router, prefix="/rankings", tags=["ranking"])
 
 api_router.include_router(
     media_assets.router, prefix="/media-assets", tags=["media"]
-)
\ No newline at end of file
+)
+api_router.include_router(cache.router, prefix="/cache", tags=["cache"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
\ No newline at end of file
@@ -0,0 +1,112 @@
+# Path: app/api/pagination.py
+"""
+관리 API 목록 조회용 키셋(커서) 페이지네이션
+
+skip 은 오프셋만큼 인덱스를 건너뛰며 읽으므로 뒤 페이지일수록 느려집니다.
+커서는 이전 페이지 마지막 문서의 (정렬 키, _id) 값을 불투명 문자열로 인코딩한 것으로,
+다음 페이지를 {정렬 키, _id} 범위 조건으로 조회해 오프셋과 무관하게 인덱스 범위 스캔 한 번으로 끝납니다.
+
+- 요청: ?limit=100 (첫 페이지) → 응답 헤더 X-Next-Cursor → ?cursor=<값>&limit=100
+- 응답 본문(목록)은 그대로 유지하며, 마지막 페이지에는 X-Next-Cursor 헤더가 없습니다.
+- 기존 skip 파라미터는 호환을 위해 유지하며, cursor 가 함께 오면 skip 은 무시합니다.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from bson import json_util
+from fastapi import HTTPException, Query, Response, status
+from pymongo import ASCENDING
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    skip: int
+    limit: int
+    cursor: Optional[str] = None
+
+    @property
+    def fetch_limit(self) -> int:
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회합니다.
+        return self.limit + 1
+
+
+def page_params(
+    skip: int = Query(0, ge=0, description="건너뛸 문서 수 (cursor 사용 시 무시)"),
+    limit: int = Query(100, gt=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+) -> Page:
+    return Page(skip=skip, limit=limit, cursor=cursor)
+
+
+def encode_cursor(values: list[Any]) -> str:
+    # ObjectId / datetime 을 보존하기 위해 Extended JSON 으로 직렬화합니다.
+    raw = json_util.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json_util.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or not values:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+    return values
+
+
+def sort_spec(sort_field: str = "_id", direction: int = ASCENDING) -> list[tuple[str, int]]:
+    """정렬 키가 중복될 수 있으므로 _id 를 보조 정렬 키로 붙입니다."""
+    if sort_field == "_id":
+        return [("_id", direction)]
+    return [(sort_field, direction), ("_id", direction)]
+
+
+def keyset_query(
+    filters: dict,
+    page: Page,
+    sort_field: str = "_id",
+    direction: int = ASCENDING,
+) -> tuple[dict, int]:
+    """
+    커서가 있으면 filters 에 '마지막 문서 이후' 조건을 더한 쿼리와 skip=0 을,
+    없으면 filters 와 요청한 skip 을 그대로 반환합니다.
+    """
+    if not page.cursor:
+        return filters, page.skip
+
+    values = decode_cursor(page.cursor)
+    op = "$gt" if direction == ASCENDING else "$lt"
+    if sort_field == "_id":
+        after = {"_id": {op: values[0]}}
+    else:
+        if len(values) != 2:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+        value, last_id = values
+        after = {"$or": [
+            {sort_field: {op: value}},
+            {sort_field: value, "_id": {op: last_id}},
+        ]}
+    return ({"$and": [filters, after]} if filters else after), 0
+
+
+def _value(doc: Any, field: str) -> Any:
+    if isinstance(doc, dict):
+        return doc.get(field)
+    return getattr(doc, "id" if field == "_id" else field)
+
+
+def finish_page(response: Response, docs: Sequence, page: Page, sort_field: str = "_id") -> Sequence:
+    """fetch_limit 로 조회한 결과를 limit 건으로 자르고, 다음 페이지가 있으면 X-Next-Cursor 헤더를 설정합니다."""
+    if len(docs) <= page.limit:
+        return docs
+    docs = docs[:page.limit]
+    last = docs[-1]
+    values = [_value(last, "_id")] if sort_field == "_id" else [_value(last, sort_field), _value(last, "_id")]
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(values)
+    return docs
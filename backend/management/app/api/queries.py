@@ -0,0 +1,96 @@
+# Path: app/api/queries.py
+"""
+관리 API 목록 조회용 공통 쿼리 레이어
+
+목록 엔드포인트마다 $match → $sort → $skip/$limit → $lookup 으로 이어지는 집계 파이프라인 하나를 만들어
+링크된 문서를 한 번의 왕복으로 가져옵니다. (문서별 fetch_link / fetch_all_links 반복 제거)
+Beanie Link 는 DBRef 로 저장되므로 "<field>.$id" 를 localField 로 사용합니다.
+"""
+
+from typing import Any, Optional
+
+from beanie import Document
+
+from app.models.inventory import Inventory
+from app.models.listing import Listing
+from app.models.market import MarketPlace
+from app.models.product import Product, Variant
+
+
+def lookup_link(
+    field: str,
+    target: type[Document],
+    as_field: Optional[str] = None,
+    many: bool = False,
+    required: bool = True,
+    project: Optional[dict[str, Any]] = None,
+) -> list[dict]:
+    """
+    Link / List[Link] 필드를 대상 컬렉션과 조인하는 스테이지를 반환합니다.
+    - many=False 이면 결과를 단일 문서로 펼치고, required=True 이면 링크가 깨진 문서는 제외합니다.
+    - project 를 주면 조인한 문서에서 필요한 필드만 가져옵니다.
+    """
+    as_field = as_field or field
+    lookup: dict[str, Any] = {
+        "from": target.get_collection_name(),
+        "localField": f"{field}.$id",
+        "foreignField": "_id",
+        "as": as_field,
+    }
+    if project:
+        lookup["pipeline"] = [{"$project": project}]
+    stages: list[dict] = [{"$lookup": lookup}]
+    if not many:
+        stages.append({"$unwind": {"path": f"${as_field}", "preserveNullAndEmptyArrays": not required}})
+    return stages
+
+
+def page_stages(skip: int, limit: int, sort: Optional[dict[str, int]] = None) -> list[dict]:
+    # 조인 전에 페이지를 먼저 잘라 조회 대상 문서 수만큼만 $lookup 합니다.
+    # 키셋 커서 조건은 호출 측에서 $match 에 포함되며, 그 경우 skip 은 0 입니다.
+    stages: list[dict] = [{"$sort": sort or {"_id": 1}}]
+    if skip:
+        stages.append({"$skip": skip})
+    stages.append({"$limit": limit})
+    return stages
+
+
+async def aggregate(model: type[Document], pipeline: list[dict]) -> list[dict]:
+    return await model.get_motor_collection().aggregate(pipeline).to_list(length=None)
+
+
+# 제품 목록에 포함하는 변형 요약 필드 (변형 문서에 임베드된 product 사본은 제외)
+VARIANT_SUMMARY_FIELDS = {"_id": 1, "name": 1, "sku": 1, "barcode": 1, "options": 1, "price": 1}
+
+
+async def list_products_query(
+    filters: dict,
+    skip: int,
+    limit: int,
+    include_variants: bool = False,
+) -> list[dict]:
+    pipeline = [{"$match": filters}, *page_stages(skip, limit)]
+    if include_variants:
+        pipeline += lookup_link("variants", Variant, many=True, project=VARIANT_SUMMARY_FIELDS)
+    else:
+        pipeline.append({"$project": {"variants": 0}})
+    return await aggregate(Product, pipeline)
+
+
+async def list_inventory_query(filters: dict, skip: int, limit: int) -> list[dict]:
+    pipeline = [
+        {"$match": filters},
+        *page_stages(skip, limit),
+        *lookup_link("variant", Variant),
+    ]
+    return await aggregate(Inventory, pipeline)
+
+
+async def list_listings_query(filters: dict, skip: int, limit: int) -> list[dict]:
+    pipeline = [
+        {"$match": filters},
+        *page_stages(skip, limit),
+        *lookup_link("variant", Variant),
+        *lookup_link("market_place", MarketPlace, as_field="marketplace"),
+    ]
+    return await aggregate(Listing, pipeline)
@@ -1,31 +1,34 @@
 # Path: app/api/routes/brands.py
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List, Optional
 from beanie import PydanticObjectId
-from app.models.product import Category,Brand
+from app.models.product import Brand
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.services.reference_cache import reference_cache
 from app.schemas.brand import BrandCreate, BrandUpdate, BrandPublic
 
 router = APIRouter()
 
 @router.get("/", response_model=List[BrandPublic])
 async def list_brands(
+    response: Response,
     category_name: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0), 
-    limit: int = Query(100, gt=0)
+    page: Page = Depends(page_params),
 ):  
     filter = {}
     if category_name and category_name != "total":
-        category = await Category.find_one(Category.name == category_name)
+        category = await reference_cache.get_category_by_name(category_name)
         if not category:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="카테고리를 찾을 수 없습니다.")
-        filter["category"] = category
-    
-    docs = await Brand.find(filter).skip(skip).limit(limit).to_list()
-    return [BrandPublic(**d.model_dump(by_alias=True)) for d in docs]
+        filter["category._id"] = category.id
+
+    query, skip = keyset_query(filter, page)
+    docs = await Brand.find(query).sort("+_id").skip(skip).limit(page.fetch_limit).to_list()
+    return [BrandPublic(**d.model_dump(by_alias=True)) for d in finish_page(response, docs, page)]
 
 @router.post("/", response_model=BrandPublic, status_code=status.HTTP_201_CREATED)
 async def create_brand(obj_in: BrandCreate):
-    cat = await Category.get(obj_in.category_id)
+    cat = await reference_cache.get_category(obj_in.category_id)
     if not cat:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="카테고리를 찾을 수 없습니다.")
     if await Brand.find_one(Brand.name == obj_in.name):
@@ -36,6 +39,7 @@ async def create_brand(obj_in: BrandCreate):
         logo_url=obj_in.logo_url,
         category=cat,
     ).insert()
+    reference_cache.invalidate(Brand)
     await new.fetch_all_links()
     return BrandPublic(**new.model_dump(by_alias=True))
 
@@ -52,6 +56,7 @@ async def update_brand(id: PydanticObjectId, obj_in: BrandUpdate):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="브랜를를 찾을 수 없습니다.")
     updated = await doc.update({"$set": obj_in.model_dump(exclude_none=True)})
+    reference_cache.invalidate(Brand)
     return BrandPublic(**updated.model_dump(by_alias=True))
 
 @router.delete("/{id}")
@@ -60,4 +65,5 @@ async def delete_brand(id: PydanticObjectId):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="브랜를를 찾을 수 없습니다.")
     await doc.delete()
+    reference_cache.invalidate(Brand)
     return {"message": "Brand deleted", "id": str(id)}
\ No newline at end of file
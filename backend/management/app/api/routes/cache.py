@@ -0,0 +1,17 @@
+# Path: app/api/routes/cache.py
+from fastapi import APIRouter
+from app.schemas.cache import ReferenceCacheStats
+from app.services.reference_cache import reference_cache
+
+router = APIRouter()
+
+
+@router.get("/reference", response_model=ReferenceCacheStats, summary="참조 데이터 캐시 적중/미스 통계")
+async def read_reference_cache_stats():
+    return ReferenceCacheStats(ttl=reference_cache.ttl, models=reference_cache.stats())
+
+
+@router.delete("/reference", summary="참조 데이터 캐시 비우기 (현재 워커)")
+async def clear_reference_cache():
+    reference_cache.invalidate()
+    return {"message": "Reference cache cleared"}
@@ -1,22 +1,26 @@
 # Path: app/api/routes/categories.py
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List
 from beanie import PydanticObjectId
 from app.models.product import Category
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.services.reference_cache import reference_cache
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryPublic
 
 router = APIRouter()
 
 @router.get("/", response_model=List[CategoryPublic])
-async def list_categories(skip: int = Query(0, ge=0), limit: int = Query(100, gt=0)):
-    docs = await Category.find_all().skip(skip).limit(limit).to_list()
-    return [CategoryPublic(**d.model_dump(by_alias=True)) for d in docs]
+async def list_categories(response: Response, page: Page = Depends(page_params)):
+    query, skip = keyset_query({}, page)
+    docs = await Category.find(query).sort("+_id").skip(skip).limit(page.fetch_limit).to_list()
+    return [CategoryPublic(**d.model_dump(by_alias=True)) for d in finish_page(response, docs, page)]
 
 @router.post("/", response_model=CategoryPublic, status_code=status.HTTP_201_CREATED)
 async def create_category(obj_in: CategoryCreate):
     if await Category.find_one(Category.name == obj_in.name):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 카테고리입니다.")
     new = await Category(**obj_in.model_dump()).insert()
+    reference_cache.invalidate(Category)
     return CategoryPublic(**new.model_dump(by_alias=True))
 
 @router.get("/{category_name}", response_model=CategoryPublic)
@@ -32,6 +36,7 @@ async def update_category(id: PydanticObjectId, obj_in: CategoryUpdate):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="카테고리를 찾을 수 없습니다")
     updated = await doc.update({"$set": obj_in.model_dump(exclude_none=True)})
+    reference_cache.invalidate(Category)
     return CategoryPublic(**updated.model_dump(by_alias=True))
 
 @router.delete("/{id}")
@@ -40,4 +45,5 @@ async def delete_category(id: PydanticObjectId):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="카테고리를 찾을 수 없습니다")
     await doc.delete()
+    reference_cache.invalidate(Category)
     return {"message": "Category deleted", "id": str(id)}
@@ -1,19 +1,70 @@
 # Path: app/api/routes/inventory.py
-from fastapi import APIRouter, HTTPException, Query, status
-from typing import List
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional
 from beanie import PydanticObjectId
-from app.models.inventory import Inventory
-from app.schemas.inventory import InventoryCreate, InventoryPublic
+from app.models.inventory import Inventory, StockLevel
+from app.models.product import Variant
+from app.core.config import settings
+from app.schemas.inventory import InventoryBulkResult, InventoryCreate, InventoryPublic, StockLevelPublic
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.api.queries import list_inventory_query
+from app.services.inventory_service import (
+    delete_inventory_change,
+    get_stock_level,
+    parse_bulk_rows,
+    record_inventory_change,
+    record_inventory_changes,
+    update_inventory_change,
+)
+from app.services.stock_checkpoint_service import stock_as_of
 
 router = APIRouter()
 
+
+def stock_to_public(stock: StockLevel) -> StockLevelPublic:
+    return StockLevelPublic(variant_id=stock.id, quantity=stock.quantity, updated_at=stock.updated_at)
+
 @router.get("/", response_model=List[InventoryPublic])
-async def list_inventory(skip: int = Query(0, ge=0), limit: int = Query(100, gt=0)):
-    docs = await Inventory.find_all().skip(skip).limit(limit).to_list()
-    for d in docs:
-        await d.fetch_link(Inventory.variant)
-    return [InventoryPublic(**d.model_dump(by_alias=True)) for d in docs]
+async def list_inventory(response: Response, page: Page = Depends(page_params)):
+    query, skip = keyset_query({}, page)
+    docs = await list_inventory_query(query, skip, page.fetch_limit)
+    return [InventoryPublic(**d) for d in finish_page(response, docs, page)]
+
+
+@router.get("/stock", response_model=List[StockLevelPublic], summary="변형별 현재 재고 목록")
+async def list_stock_levels(
+    response: Response,
+    page: Page = Depends(page_params),
+    as_of: Optional[datetime] = Query(None, description="지정하면 해당 시점의 재고 (시간대가 없으면 UTC)"),
+):
+    query, skip = keyset_query({}, page)
+    docs = finish_page(
+        response,
+        await StockLevel.find(query).sort("+_id").skip(skip).limit(page.fetch_limit).to_list(),
+        page,
+    )
+    if as_of is None:
+        return [stock_to_public(d) for d in docs]
+    quantities = await stock_as_of([d.id for d in docs], as_of)
+    return [StockLevelPublic(variant_id=d.id, quantity=quantities[d.id], as_of=as_of) for d in docs]
+
 
+@router.get("/stock/{variant_id}", response_model=StockLevelPublic, summary="변형 현재 재고 조회")
+async def read_stock_level(
+    variant_id: PydanticObjectId,
+    as_of: Optional[datetime] = Query(None, description="지정하면 해당 시점의 재고 (시간대가 없으면 UTC)"),
+):
+    stock = await get_stock_level(variant_id)
+    # 원장 기록이 없는 변형은 재고 0
+    if not stock and not await Variant.get(variant_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품 변형을 찾을 수 없습니다.")
+    if as_of is not None:
+        quantities = await stock_as_of([variant_id], as_of)
+        return StockLevelPublic(variant_id=variant_id, quantity=quantities[variant_id], as_of=as_of)
+    if stock:
+        return stock_to_public(stock)
+    return StockLevelPublic(variant_id=variant_id, quantity=0)
 
 
 @router.post(
@@ -21,19 +72,35 @@ async def list_inventory(skip: int = Query(0, ge=0), limit: int = Query(100, gt=
     response_model=InventoryPublic, 
     status_code=status.HTTP_201_CREATED,
     summary="재고 변경 내역 생성",
-    responses={409: {"description": "Inventory already exists"}}
+    responses={404: {"description": "Variant not found"}}
 )
 async def create_inventory(obj_in: InventoryCreate):
-    if obj_in.variant_id and await Inventory.find_one(Inventory.variant == obj_in.variant_id):
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Inventory already exists")
-    inventory = await Inventory(
-        variant=obj_in.variant_id,
-        change_type=obj_in.change_type,
-        quantity=obj_in.quantity
-    ).insert()
+    if not await Variant.get(obj_in.variant_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품 변형을 찾을 수 없습니다.")
+    inventory = await record_inventory_change(obj_in.variant_id, obj_in.change_type, obj_in.quantity)
     new = await Inventory.get(inventory.id, fetch_links=True)
     return InventoryPublic(**new.model_dump(by_alias=True))
 
+@router.post(
+    "/bulk",
+    response_model=InventoryBulkResult,
+    summary="재고 변경 내역 일괄 생성",
+    description="JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson) 본문을 받아 유효한 행만 저장하고 행별 오류를 반환합니다.",
+)
+async def create_inventory_bulk(request: Request):
+    body = await request.body()
+    ndjson = "ndjson" in request.headers.get("content-type", "")
+    try:
+        rows, errors = parse_bulk_rows(body, ndjson)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"잘못된 요청 본문입니다: {e}")
+    if len(rows) > settings.INVENTORY_BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {settings.INVENTORY_BULK_MAX_ROWS}건까지 등록할 수 있습니다.",
+        )
+    return await record_inventory_changes(rows, errors)
+
 @router.get("/{id}", response_model=InventoryPublic)
 async def read_inventory(id: PydanticObjectId):
     """
@@ -49,10 +116,14 @@ async def update_inventory(id: PydanticObjectId, obj_in: InventoryCreate):
     """
     ID로 재고 변경 내역 업데이트
     """
-    doc = await Inventory.get(id, fetch_links=True)
+    doc = await Inventory.get(id)
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory record not found")
-    updated = await doc.update({"$set": obj_in.model_dump()})
+    if not await Variant.get(obj_in.variant_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품 변형을 찾을 수 없습니다.")
+    if not await update_inventory_change(doc, obj_in.variant_id, obj_in.change_type, obj_in.quantity):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="다른 요청이 먼저 수정한 내역입니다. 다시 시도해 주세요.")
+    updated = await Inventory.get(id, fetch_links=True)
     return InventoryPublic(**updated.model_dump(by_alias=True))
 
 @router.delete("/{id}")
@@ -63,5 +134,6 @@ async def delete_inventory(id: PydanticObjectId):
     doc = await Inventory.get(id)
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory record not found")
-    await doc.delete()
+    if not await delete_inventory_change(doc):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory record not found")
     return {"message": "Inventory record deleted", "id": str(id)}
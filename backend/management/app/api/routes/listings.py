@@ -1,21 +1,22 @@
 # Path: app/api/routes/listings.py
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List
 from beanie import PydanticObjectId
 from app.models.listing import Listing
 from app.schemas.listing import ListingCreate, ListingPublic
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.api.queries import list_listings_query
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ListingPublic])
-async def list_listings(skip: int = Query(0, ge=0), limit: int = Query(100, gt=0)):
+async def list_listings(response: Response, page: Page = Depends(page_params)):
     """
     모든 리스팅 조회
     """
-    docs = await Listing.find_all().skip(skip).limit(limit).to_list()
-    for d in docs:
-        await d.fetch_link(Listing.variant)
-    return [ListingPublic(**d.model_dump(by_alias=True)) for d in docs]
+    query, skip = keyset_query({}, page)
+    docs = await list_listings_query(query, skip, page.fetch_limit)
+    return [ListingPublic(**d) for d in finish_page(response, docs, page)]
 
 @router.post(
     "/",
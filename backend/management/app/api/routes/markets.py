@@ -1,27 +1,31 @@
 # Path: app/api/routes/categories.py
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from typing import List, Optional
 from beanie import PydanticObjectId
 from app.models.market import MarketPlace
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.services.reference_cache import reference_cache
 from app.schemas.market import MarketPlaceCreate, MarketPlaceUpdate, MarketPlacePublic
 
 router = APIRouter()
 
 @router.get("/", response_model=List[MarketPlacePublic])
-async def list_markets(skip: int = Query(0, ge=0), limit: int = Query(100, gt=0)):
-    docs = await MarketPlace.find_all().skip(skip).limit(limit).to_list()
-    return [MarketPlacePublic(**d.model_dump(by_alias=True)) for d in docs]
+async def list_markets(response: Response, page: Page = Depends(page_params)):
+    query, skip = keyset_query({}, page)
+    docs = await MarketPlace.find(query).sort("+_id").skip(skip).limit(page.fetch_limit).to_list()
+    return [MarketPlacePublic(**d.model_dump(by_alias=True)) for d in finish_page(response, docs, page)]
 
 @router.post("/", response_model=MarketPlacePublic, status_code=status.HTTP_201_CREATED)
 async def create_market(obj_in: MarketPlaceCreate):
     if await MarketPlace.find_one(MarketPlace.name == obj_in.name):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="MarketPlace already exists")
     new = await MarketPlace(**obj_in.model_dump()).insert()
+    reference_cache.invalidate(MarketPlace)
     return MarketPlacePublic(**new.model_dump(by_alias=True))
 
 @router.get("/{id}", response_model=MarketPlacePublic)
 async def read_market(id: PydanticObjectId):
-    doc = await MarketPlace.get(id)
+    doc = await reference_cache.get_marketplace(id)
     if not doc:
         raise HTTPException(status_code=404, detail="MarketPlace not found")
     return MarketPlacePublic(**doc.model_dump(by_alias=True))
@@ -32,6 +36,7 @@ async def update_market(id: PydanticObjectId, obj_in: MarketPlaceUpdate):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="MarketPlace not found")
     updated = await doc.update({"$set": obj_in.model_dump(exclude_none=True)})
+    reference_cache.invalidate(MarketPlace)
     return MarketPlacePublic(**updated.model_dump(by_alias=True))
 
 @router.delete("/{id}")
@@ -40,4 +45,5 @@ async def delete_market(id: PydanticObjectId):
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="MarketPlace not found")
     await doc.delete()
+    reference_cache.invalidate(MarketPlace)
     return {"message": "MarketPlace deleted", "id": str(id)}
@@ -1,31 +1,41 @@
 # Path: app/api/routes/products.py
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List
 from beanie import PydanticObjectId
-from app.models.product import Product, Brand
-from app.schemas.product import ProductCreate, ProductUpdate, ProductPublic
+from app.models.product import Product
+from app.schemas.product import ProductCreate, ProductListPublic, ProductUpdate, ProductPublic
 from app.models.media_asset import MediaAsset
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from app.api.queries import list_products_query
+from app.services.reference_cache import reference_cache
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ProductPublic])
-async def list_products(category_name: str = Query(None), brand_name: str = Query(None), skip: int = Query(0, ge=0), limit: int = Query(100, gt=0)):
+@router.get("/", response_model=List[ProductListPublic])
+async def list_products(
+    response: Response,
+    category_name: str = Query(None),
+    brand_name: str = Query(None),
+    page: Page = Depends(page_params),
+    include_variants: bool = Query(False, description="변형 요약 목록 포함 여부"),
+):
     filters = {}
     if category_name and category_name != "total":
         filters["brand.category.name"] = category_name
     if brand_name:
         filters["brand.name"] = brand_name
-    docs = await Product.find(filters, fetch_links=True).skip(skip).limit(limit).to_list()
-    for d in docs:
-        await d.fetch_all_links()
-    return [ProductPublic(**d.model_dump(by_alias=True)) for d in docs]
+    query, skip = keyset_query(filters, page)
+    docs = await list_products_query(query, skip, page.fetch_limit, include_variants)
+    return [ProductListPublic(**d) for d in finish_page(response, docs, page)]
 
 
 @router.post("/", response_model=ProductPublic, status_code=status.HTTP_201_CREATED)
 async def create_product(obj_in: ProductCreate):
     if await Product.find_one(Product.name == obj_in.name, fetch_links=True):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 제품입니다.")
-    brand = await Brand.get(obj_in.brand_id)
+    brand = await reference_cache.get_brand(obj_in.brand_id)
+    if not brand:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="브랜드를 찾을 수 없습니다.")
     new = await Product(
         name=obj_in.name,
         description=obj_in.description,
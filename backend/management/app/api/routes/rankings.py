@@ -1,43 +1,125 @@
 # app/api/routes/rankings.py
-from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pymongo import ASCENDING, DESCENDING
 from typing import List, Optional
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 import os
 
 from beanie import PydanticObjectId
-from app.models.ranking import ItemSnapshot, RankingSnapshot
-from app.schemas.ranking import ItemSnapshotPublic, RankingPublic, RankingSnapshotPublic
-from app.services.scraping_service import update_db_from_scraped_data
-from app.services.excel_service import export_ranking_to_excel
+from app.api.pagination import Page, finish_page, keyset_query, page_params, sort_spec
+from app.models.ranking import RankingSnapshot, RankingSummary, ScrapeJob
+from app.schemas.ranking import ItemHistoryPublic, RankingMoversPublic, RankingPublic, RankingSnapshotPublic, ScrapeAllResult, ScrapeJobPublic, ScrapeSchedulerStatus
+from app.services.ranking_service import get_item_history, ranking_to_public
+from app.services.rollup_service import get_movers
+from app.services.scheduler_service import scrape_scheduler
+from app.services.scrape_job_service import scrape_jobs
+from app.services.scraping_service import scrape_all_categories, update_db_from_scraped_data
+from app.services.excel_service import EXPORT_FORMAT, export_ranking_to_excel, export_ranking_to_stream, iter_file
+from app.services.export_cache import etag_matches, export_cache
+from app.services.history_export_service import MEDIA_TYPES, export_item_history_to_stream
 
 router = APIRouter()
 
 @router.get("/", response_model=List[RankingPublic])
 async def list_rankings(
+    response: Response,
     category: Optional[str] = Query(None, regex="^(total|beauty|fashion|food)$"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, gt=0),
+    page: Page = Depends(page_params),
     sort_by: str = Query("created_at", regex="^(created_at|updated_at)$"),
     sort_order: str = Query("desc", regex="^(asc|desc)$"),
 ):
     direction = ASCENDING if sort_order == "asc" else DESCENDING
-    query = {"category": category} if category else {}
-    rankings = await RankingSnapshot.find(query, sort=[(sort_by, direction)]).skip(skip).limit(limit).to_list()
-    return [RankingPublic(**ranking.model_dump(by_alias=True), counts=len(ranking.items)) for ranking in rankings]
+    query, skip = keyset_query({"category": category} if category else {}, page, sort_by, direction)
+    rankings = await (
+        RankingSnapshot.find(query, sort=sort_spec(sort_by, direction))
+        .skip(skip)
+        .limit(page.fetch_limit)
+        .project(RankingSummary)
+        .to_list()
+    )
+    return [RankingPublic(**ranking.model_dump(by_alias=True)) for ranking in finish_page(response, rankings, page, sort_by)]
+
+
+@router.get("/schedule", response_model=ScrapeSchedulerStatus, summary="주기 스크래핑 일정 및 실행 지표")
+async def read_scrape_schedule() -> ScrapeSchedulerStatus:
+    return await scrape_scheduler.status()
 
 
 @router.get("/{ranking_id}", response_model=RankingSnapshotPublic)
 async def read_ranking_snapshot(ranking_id: PydanticObjectId)-> RankingSnapshotPublic:
     
-    ranking = await RankingSnapshot.get(ranking_id, fetch_links=True)
+    ranking = await RankingSnapshot.get(ranking_id)
     if not ranking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="랭킹 정보를 찾을 수 없습니다.")
-    return RankingSnapshotPublic(**ranking.model_dump(by_alias=True))
+    return await ranking_to_public(ranking)
+
 
+@router.get("/items/{item_id}/history", response_model=ItemHistoryPublic, summary="아이템 순위/가격/판매량 추이")
+async def read_item_history(
+    item_id: str,
+    start: Optional[datetime] = Query(None, description="기본값: end 기준 30일 전"),
+    end: Optional[datetime] = Query(None, description="기본값: 현재 시각"),
+    bucket: str = Query("day", regex="^(hour|day|week|month)$"),
+) -> ItemHistoryPublic:
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start 는 end 보다 이전이어야 합니다.")
+    return await get_item_history(item_id, start, end, bucket)
 
-@router.get("/today/{category}", response_model=List[RankingSnapshotPublic])
+
+@router.get(
+    "/history/export",
+    summary="아이템 이력 Parquet/Arrow 내보내기",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}}},
+)
+async def export_item_history(
+    start: Optional[datetime] = Query(None, description="기본값: end 기준 30일 전"),
+    end: Optional[datetime] = Query(None, description="기본값: 현재 시각"),
+    category: Optional[str] = Query(None, description="비우면 전체 카테고리"),
+    format: str = Query("parquet", regex="^(parquet|arrow)$"),
+):
+    end = end or datetime.now(timezone.utc)
+    start = start or end - timedelta(days=30)
+    if start >= end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start 는 end 보다 이전이어야 합니다.")
+
+    spool, size = await export_item_history_to_stream(format, start, end, category)
+    extension = "parquet" if format == "parquet" else "arrows"
+    file_name = f"item_history_{category or 'total'}_{start:%Y%m%d}-{end:%Y%m%d}.{extension}"
+    # 응답 전송이 끝나면 임시 파일을 닫아 삭제합니다.
+    return StreamingResponse(
+        iter_file(spool),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_name}"',
+            "Content-Length": str(size),
+        },
+        background=BackgroundTask(spool.close),
+    )
+
+
+@router.get("/movers/{category}", response_model=RankingMoversPublic, summary="일별 순위 급상승/급하락 아이템")
+async def read_ranking_movers(
+    category: str,
+    day: Optional[date] = Query(None, description="기본값: 가장 최근 롤업 일자 (UTC)"),
+    limit: int = Query(10, gt=0, le=100),
+) -> RankingMoversPublic:
+    movers = await get_movers(category, day, limit)
+    if not movers:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="랭킹 롤업 정보를 찾을 수 없습니다.")
+    return movers
+
+
+@router.get(
+    "/today/{category}",
+    response_model=List[RankingSnapshotPublic],
+    responses={status.HTTP_202_ACCEPTED: {"model": ScrapeJobPublic, "description": "스냅샷이 없어 스크래핑 작업을 등록함"}},
+)
 async def get_today_rankings(
     category: str,
     skip: int = 0,
@@ -48,15 +130,42 @@ async def get_today_rankings(
     tomorrow = today_start + timedelta(days=1)
     query = {"category": category, "timestamp": {"$gte": today_start, "$lt": tomorrow}}
     rankings = await RankingSnapshot.find_many(query).skip(skip).limit(limit).to_list()
-    if not rankings:
-        # 오늘 데이터 없으면 스크래핑 후 재조회
-        await update_db_from_scraped_data(category)
-        rankings = await RankingSnapshot.find_many(query).skip(skip).limit(limit).to_list()
-        if not rankings:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="스크래핑 실패: 관리자에게 문의하세요.")
-    for ranking in rankings:
-        await ranking.fetch_all_links()
-    return [RankingSnapshotPublic(**r.model_dump(by_alias=True)) for r in rankings]
+    if rankings:
+        return [await ranking_to_public(r) for r in rankings]
+
+    # 오늘 데이터가 없으면 스크래핑 작업을 등록하고, 완료 전까지는 가장 최근 스냅샷을 stale 로 반환
+    try:
+        job = await scrape_jobs.enqueue(category)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    latest = await RankingSnapshot.find({"category": category}).sort("-timestamp").first_or_none()
+    if not latest:
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=jsonable_encoder(job_to_public(job)))
+    public = await ranking_to_public(latest)
+    public.stale = True
+    public.job_id = job.id
+    return [public]
+
+
+def job_to_public(job: ScrapeJob) -> ScrapeJobPublic:
+    return ScrapeJobPublic(**job.model_dump(by_alias=True))
+
+
+@router.post("/jobs", response_model=ScrapeJobPublic, status_code=status.HTTP_202_ACCEPTED, summary="스크래핑 작업 등록")
+async def create_scrape_job(category: str = Query(...)) -> ScrapeJobPublic:
+    try:
+        job = await scrape_jobs.enqueue(category)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return job_to_public(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ScrapeJobPublic, summary="스크래핑 작업 상태 조회")
+async def read_scrape_job(job_id: PydanticObjectId) -> ScrapeJobPublic:
+    job = await ScrapeJob.get(job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="스크래핑 작업을 찾을 수 없습니다.")
+    return job_to_public(job)
 
 
 
@@ -67,6 +176,7 @@ async def delete_ranking(ranking_id: PydanticObjectId):
     if not ranking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="랭킹 정보를 찾을 수 없습니다.")
     await ranking.delete()
+    await export_cache.invalidate(ranking_id)
     return {"message": "랭킹 정보가 삭제되었습니다."}
 
 
@@ -74,30 +184,88 @@ async def delete_ranking(ranking_id: PydanticObjectId):
 @router.post("/scrape/{category}", response_model=RankingSnapshotPublic)
 async def scrape_and_return(category: str):
     snapshot = await update_db_from_scraped_data(category)
-    return RankingSnapshotPublic(**snapshot.model_dump(by_alias=True))
+    return await ranking_to_public(snapshot)
+
+
+@router.post("/scrape-all", response_model=ScrapeAllResult, summary="전체 카테고리 동시 스크래핑")
+async def scrape_all(
+    categories: Optional[List[str]] = Query(None),
+    pool_size: Optional[int] = Query(None, ge=1, le=10),
+) -> ScrapeAllResult:
+    try:
+        return await scrape_all_categories(categories, pool_size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/download/{ranking_id}", summary="랭킹정보 Excel 파일 다운로드", response_class=FileResponse)
+@router.get("/download/{ranking_id}", summary="랭킹정보 Excel 파일 다운로드", response_class=StreamingResponse)
 async def download_ranking(
-    ranking_id: str
+    ranking_id: str,
+    mode: str = Query("stream", regex="^(stream|file)$", description="stream: 캐시/임시 파일로 스트리밍, file: results/ 에 저장 후 전송"),
+    if_none_match: Optional[str] = Header(None),
 ):
     # ID 검증
     try:
         rid = PydanticObjectId(ranking_id)
     except Exception:
         raise HTTPException(status_code=400, detail="유효하지 않은 ID 형식입니다.")
+    file_name = f"qoo10_ranking_{datetime.now(timezone.utc).strftime('%Y-%m-%d_%H-%M')}.xlsx"
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    if mode == "stream":
+        # 스냅샷은 저장 후 변경되지 않으므로 생성된 결과를 캐시에서 재사용합니다.
+        artifact = await export_cache.get(rid, EXPORT_FORMAT)
+        if artifact and etag_matches(if_none_match, artifact.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": artifact.etag})
+
+        if artifact is None:
+            try:
+                spool, size, missing = await export_ranking_to_stream(rid)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+            # 썸네일 일부를 받지 못한 결과는 캐시하지 않고, 다음 요청에서 다시 생성합니다.
+            artifact = await export_cache.put(rid, EXPORT_FORMAT, spool, size) if not missing else None
+            if artifact is None:
+                # 캐시를 사용하지 않거나 저장하지 않은 경우: 응답 전송이 끝나면 임시 파일을 닫아 삭제합니다.
+                return StreamingResponse(
+                    iter_file(spool),
+                    media_type=media_type,
+                    headers={
+                        "Content-Disposition": f'attachment; filename="{file_name}"',
+                        "Content-Length": str(size),
+                    },
+                    background=BackgroundTask(spool.close),
+                )
+            spool.close()
+
+        headers = {"ETag": artifact.etag, "Cache-Control": "private, no-cache"}
+        if artifact.path:
+            return FileResponse(path=artifact.path, filename=file_name, media_type=media_type, headers=headers)
+        return StreamingResponse(
+            artifact.iter_bytes(),
+            media_type=media_type,
+            headers={
+                **headers,
+                "Content-Disposition": f'attachment; filename="{file_name}"',
+                "Content-Length": str(artifact.size),
+            },
+        )
+
     # 파일 생성 경로
     temp_dir = "results"
     os.makedirs(temp_dir, exist_ok=True)
-    file_name = f"qoo10_ranking_{datetime.now(timezone.utc).strftime('%Y-%m-%d_%H-%M')}.xlsx"
     output_path = os.path.join(temp_dir, file_name)
 
     # 엑셀 생성
-    await export_ranking_to_excel(rid, output_path)
+    try:
+        await export_ranking_to_excel(rid, output_path)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
-    # 다운로드 응답
+    # 다운로드 응답 (전송 후 파일 삭제)
     return FileResponse(
         path=output_path,
         filename=file_name,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        media_type=media_type,
+        background=BackgroundTask(os.remove, output_path),
     )
@@ -0,0 +1,14 @@
+# Path: app/api/routes/search.py
+from fastapi import APIRouter, Query
+from app.schemas.search import SearchResult
+from app.services.search_service import search_catalog
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResult, summary="제품/변형 통합 검색 (이름, 현지화 이름, 태그, 브랜드, SKU, 바코드)")
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, gt=0, le=100),
+):
+    return await search_catalog(q, limit)
@@ -1,24 +1,29 @@
 # Path: app/api/routes/variants.py
 import asyncio
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from typing import List
 from beanie import PydanticObjectId
 from app.models.product import Product, Variant
-from app.schemas.variant import VariantCreate, VariantUpdate, VariantPublic
+from app.api.pagination import Page, finish_page, keyset_query, page_params
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from app.core.config import settings
+from app.schemas.variant import VariantBulkCreate, VariantCreate, VariantUpdate, VariantPublic
+from app.services.variant_service import attach_variants, create_variant_matrix, insert_variant
 
 router = APIRouter()
 
 @router.get("/", response_model=List[VariantPublic])
 async def list_variants(
+    response: Response,
     product_id: PydanticObjectId = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, gt=0),
+    page: Page = Depends(page_params),
 ):
     filter = {}
     if product_id:
-        filter["product.id"] = product_id
-    docs = await Variant.find(fetch_links=True).skip(skip).limit(limit).to_list()
-    return [VariantPublic(**d.model_dump(by_alias=True)) for d in docs]
+        filter["product._id"] = product_id
+    query, skip = keyset_query(filter, page)
+    docs = await Variant.find(query, fetch_links=True).sort("+_id").skip(skip).limit(page.fetch_limit).to_list()
+    return [VariantPublic(**d.model_dump(by_alias=True)) for d in finish_page(response, docs, page)]
 
 
 @router.post(
@@ -40,19 +45,43 @@ async def create_variant(obj_in: VariantCreate):
         price=obj_in.price,
         product=product,
     )
-    await variant.insert()
+    try:
+        await insert_variant(variant)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="SKU 를 배정하지 못했습니다. 다시 시도해 주세요.")
+    await attach_variants(product.id, [variant.id])
     new_variant = await Variant.get(variant.id, fetch_links=True)
     return VariantPublic(**new_variant.model_dump(by_alias=True))
 
 
-@router.get("/{id}", response_model=VariantPublic)
-async def read_variant(id: PydanticObjectId):
-    doc = await Variant.get(id, fetch_links=True)
-    if not doc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품 변형을 찾을 수 없습니다.")
-    return VariantPublic(**doc.model_dump(by_alias=True))
+@router.post(
+    "/bulk",
+    response_model=List[VariantPublic],
+    status_code=status.HTTP_201_CREATED,
+    summary="옵션 조합으로 상품 변형 일괄 생성",
+    responses={409: {"description": "SKU 배정 실패"}, 413: {"description": "조합 수 초과"}},
+)
+async def create_variants_bulk(obj_in: VariantBulkCreate):
+    product = await Product.get(obj_in.product_id)
+    if not product:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품을 찾을 수 없습니다.")
+    combinations = 1
+    for axis in obj_in.axes:
+        combinations *= len(axis.values)
+    if combinations > settings.VARIANT_BULK_MAX_COMBINATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"옵션 조합은 최대 {settings.VARIANT_BULK_MAX_COMBINATIONS}개까지 생성할 수 있습니다.",
+        )
+    try:
+        variants = await create_variant_matrix(product, obj_in.axes, obj_in.price, obj_in.media_urls)
+    except BulkWriteError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="SKU 를 배정하지 못했습니다. 다시 시도해 주세요.")
+    return [VariantPublic(**v.model_dump(by_alias=True)) for v in variants]
+
 
-@router.get("/{barcode}", response_model=VariantPublic)
+# /{id} 보다 먼저 선언해야 바코드 경로가 ObjectId 검증에 가로막히지 않습니다.
+@router.get("/barcode/{barcode}", response_model=VariantPublic)
 async def search_variant_by_barcode(barcode: str):
     doc = await Variant.find_one({"barcode": barcode}, fetch_links=True)
     if not doc:
@@ -60,6 +89,13 @@ async def search_variant_by_barcode(barcode: str):
     return VariantPublic(**doc.model_dump(by_alias=True))
 
 
+@router.get("/{id}", response_model=VariantPublic)
+async def read_variant(id: PydanticObjectId):
+    doc = await Variant.get(id, fetch_links=True)
+    if not doc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="제품 변형을 찾을 수 없습니다.")
+    return VariantPublic(**doc.model_dump(by_alias=True))
+
 @router.put("/{id}", response_model=VariantPublic)
 async def update_variant(id: PydanticObjectId, obj_in: VariantUpdate):
     doc = await Variant.get(id)
@@ -0,0 +1,50 @@
+# app/commands/backfill_item_history.py
+"""
+item_history 시계열 컬렉션 도입 이전에 저장된 랭킹 스냅샷을 시계열 포인트로 채워 넣습니다.
+linked/embedded 형식 모두 지원하며, 처리한 스냅샷은 history_recorded 로 표시되어 다시 처리되지 않습니다.
+
+    cd backend/management
+    python -m app.commands.backfill_item_history [--dry-run]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.models.ranking import RankingSnapshot
+from app.services.ranking_service import load_ranking_entries, record_item_history
+
+logger = logging.getLogger()
+
+
+async def backfill(dry_run: bool) -> tuple[int, int]:
+    await initiate_database()
+    collection = RankingSnapshot.get_motor_collection()
+
+    snapshots = points = 0
+    query = RankingSnapshot.find({"history_recorded": {"$ne": True}}).sort("+timestamp")
+    async for ranking in query:
+        entries = await load_ranking_entries(ranking)
+        if not dry_run:
+            points += await record_item_history(ranking.category, ranking.timestamp, entries)
+            await collection.update_one({"_id": ranking.id}, {"$set": {"history_recorded": True}})
+        else:
+            points += len(entries)
+        snapshots += 1
+        logger.info(f"[{snapshots}] {ranking.category} {ranking.timestamp:%Y-%m-%d %H:%M} -> {len(entries)}건")
+    return snapshots, points
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="랭킹 스냅샷으로 item_history 시계열 채우기")
+    parser.add_argument("--dry-run", action="store_true", help="기록 대상만 출력하고 저장하지 않음")
+    args = parser.parse_args()
+    snapshots, points = asyncio.run(backfill(args.dry_run))
+    logger.info(f"완료: 스냅샷 {snapshots}개, 포인트 {points}건{' (dry-run)' if args.dry_run else ''}")
+
+
+if __name__ == "__main__":
+    main()
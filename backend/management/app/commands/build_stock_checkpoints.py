@@ -0,0 +1,55 @@
+# app/commands/build_stock_checkpoints.py
+"""
+재고 체크포인트(stock_checkpoints)를 지정한 기간의 UTC 자정마다 생성합니다.
+체크포인트 도입 전의 원장이나 서버 중단으로 건너뛴 날짜를 채울 때 사용합니다. (이미 있는 날짜는 다시 계산)
+
+    cd backend/management
+    python -m app.commands.build_stock_checkpoints --days 30
+    python -m app.commands.build_stock_checkpoints --start 2025-01-01 --end 2025-02-01
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.services.stock_checkpoint_service import build_checkpoints
+
+logger = logging.getLogger()
+
+
+async def build(start: date, end: date) -> int:
+    await initiate_database()
+    days = 0
+    day = start
+    # 이전 날짜의 체크포인트를 기반으로 다음 날짜를 계산하므로 오래된 날짜부터 처리합니다.
+    while day <= end:
+        as_of = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        count = await build_checkpoints(as_of)
+        logger.info(f"{day.isoformat()}: 변형 {count}개")
+        day += timedelta(days=1)
+        days += 1
+    return days
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="일일 재고 체크포인트 생성")
+    parser.add_argument("--days", type=int, default=None, help="오늘부터 거슬러 올라갈 일수")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (기본: 오늘)")
+    args = parser.parse_args()
+
+    end: date = args.end or datetime.now(timezone.utc).date()
+    start: Optional[date] = args.start or (end - timedelta(days=args.days - 1) if args.days else None)
+    if start is None:
+        parser.error("--days 또는 --start 를 지정하세요.")
+    count = asyncio.run(build(start, end))
+    logger.info(f"체크포인트 생성 완료: {count}일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# app/commands/dedupe_variant_skus.py
+"""
+중복된 변형 SKU 에 접미사(-2, -3 ...)를 붙여 고유하게 만듭니다.
+variants.sku 고유 인덱스(sku_unique)는 기존 데이터에 중복이 있으면 생성되지 않으므로,
+배포 전에 이 명령을 먼저 실행해야 합니다. (인덱스 생성 없이 DB 에 연결합니다)
+
+    cd backend/management
+    python -m app.commands.dedupe_variant_skus           # 중복 목록만 출력
+    python -m app.commands.dedupe_variant_skus --apply   # 가장 먼저 생성된 변형만 원래 SKU 를 유지
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.models.product import Variant, assign_unique_skus
+
+logger = logging.getLogger()
+
+
+async def dedupe(apply: bool) -> int:
+    await initiate_database(skip_indexes=True)
+    collection = Variant.get_motor_collection()
+    groups = await collection.aggregate([
+        {"$match": {"sku": {"$type": "string"}}},
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$sku", "ids": {"$push": "$_id"}}},
+        {"$match": {"ids.1": {"$exists": True}}},
+    ], allowDiskUse=True).to_list(length=None)
+
+    renamed = 0
+    for group in groups:
+        sku, duplicates = group["_id"], group["ids"][1:]
+        # 유지하는 첫 번째 문서가 기본 SKU 를 차지하므로 나머지는 -2 부터 배정됩니다.
+        new_skus = await assign_unique_skus([sku] * len(duplicates))
+        for variant_id, new_sku in zip(duplicates, new_skus):
+            logger.info(f"{variant_id}: {sku} -> {new_sku}")
+            if apply:
+                await collection.update_one({"_id": variant_id}, {"$set": {"sku": new_sku}})
+        renamed += len(duplicates)
+    return renamed
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="중복 변형 SKU 정리")
+    parser.add_argument("--apply", action="store_true", help="변경 사항을 저장")
+    args = parser.parse_args()
+    count = asyncio.run(dedupe(args.apply))
+    logger.info(f"중복 SKU {count}개 {'변경 완료' if args.apply else '발견 (--apply 로 적용)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# app/commands/export_item_history.py
+"""
+item_history 를 Item 정적 필드와 합쳐 Parquet / Arrow IPC 파일로 내보냅니다.
+
+    cd backend/management
+    python -m app.commands.export_item_history --start 2025-05-01 --end 2025-06-01 \\
+        [--category beauty] [--format parquet] [--output history.parquet]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.services.history_export_service import export_item_history
+
+logger = logging.getLogger()
+
+
+def _parse_date(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def run(args: argparse.Namespace) -> None:
+    await initiate_database()
+    output = args.output or f"item_history_{args.category or 'all'}_{args.start:%Y%m%d}-{args.end:%Y%m%d}.{args.format}"
+    started = time.perf_counter()
+    rows = await export_item_history(output, args.format, args.start, args.end, args.category, args.batch_size)
+    elapsed = time.perf_counter() - started
+    logger.info(f"{output}: {rows}행, {elapsed:.1f}초 ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="아이템 이력 Parquet/Arrow 내보내기")
+    parser.add_argument("--start", type=_parse_date, required=True, help="시작 시각 (ISO 8601, 기본 UTC)")
+    parser.add_argument("--end", type=_parse_date, default=datetime.now(timezone.utc), help="종료 시각 (기본값: 현재)")
+    parser.add_argument("--category", default=None)
+    parser.add_argument("--format", choices=("parquet", "arrow"), default="parquet")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# app/commands/migrate_ranking_snapshots.py
+"""
+기존 linked 형식(RankingSnapshot.items -> ItemSnapshot -> Item) 스냅샷을
+embedded 형식(RankingSnapshot.entries)으로 변환합니다.
+
+    cd backend/management
+    python -m app.commands.migrate_ranking_snapshots [--dry-run] [--batch-size 50] [--purge-item-snapshots]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from pymongo import UpdateOne
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.models.ranking import ItemSnapshot, RankingSnapshot
+from app.services.ranking_service import resolve_linked_entries
+
+logger = logging.getLogger()
+
+
+async def migrate(batch_size: int, dry_run: bool, purge_item_snapshots: bool) -> int:
+    await initiate_database()
+    collection = RankingSnapshot.get_motor_collection()
+
+    migrated = 0
+    operations: list[UpdateOne] = []
+    purge_ids = []
+
+    async def flush():
+        if operations and not dry_run:
+            await collection.bulk_write(operations, ordered=False)
+            if purge_item_snapshots and purge_ids:
+                await ItemSnapshot.get_motor_collection().delete_many({"_id": {"$in": purge_ids}})
+        operations.clear()
+        purge_ids.clear()
+
+    async for ranking in RankingSnapshot.find({"storage": {"$ne": "embedded"}}):
+        entries = await resolve_linked_entries(ranking)
+        operations.append(UpdateOne(
+            {"_id": ranking.id},
+            {"$set": {
+                "storage": "embedded",
+                "entries": [e.model_dump() for e in entries],
+                "items": [],
+            }},
+        ))
+        purge_ids.extend(e.snapshot_id for e in entries)
+        migrated += 1
+        logger.info(f"[{migrated}] {ranking.category} {ranking.timestamp:%Y-%m-%d %H:%M} -> {len(entries)}건")
+        if len(operations) >= batch_size:
+            await flush()
+    await flush()
+    return migrated
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="랭킹 스냅샷을 embedded 형식으로 변환")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--dry-run", action="store_true", help="변환 대상만 출력하고 저장하지 않음")
+    parser.add_argument(
+        "--purge-item-snapshots",
+        action="store_true",
+        help="변환이 끝난 스냅샷이 참조하던 ItemSnapshot 문서를 삭제",
+    )
+    args = parser.parse_args()
+    count = asyncio.run(migrate(args.batch_size, args.dry_run, args.purge_item_snapshots))
+    logger.info(f"변환 완료: {count}개 스냅샷{' (dry-run)' if args.dry_run else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# app/commands/rebuild_ranking_rollups.py
+"""
+저장된 랭킹 스냅샷으로 일별 롤업(ranking_daily_rollups)을 다시 계산합니다.
+스냅샷을 시간순으로 처리해야 전일 대비 순위 변동이 올바르게 계산되므로 기존 롤업을 삭제한 뒤 재생성합니다.
+
+    cd backend/management
+    python -m app.commands.rebuild_ranking_rollups [--category beauty]
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.models.ranking import RankingDailyRollup, RankingSnapshot
+from app.services.ranking_service import load_ranking_entries
+from app.services.rollup_service import refresh_daily_rollup
+
+logger = logging.getLogger()
+
+
+async def rebuild(category: Optional[str]) -> int:
+    await initiate_database()
+    query = {"category": category} if category else {}
+    await RankingDailyRollup.get_motor_collection().delete_many(query)
+
+    processed = 0
+    async for ranking in RankingSnapshot.find(query).sort("+timestamp"):
+        entries = await load_ranking_entries(ranking)
+        await refresh_daily_rollup(ranking.category, ranking.timestamp, entries)
+        processed += 1
+    return processed
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="랭킹 스냅샷으로 일별 롤업 재생성")
+    parser.add_argument("--category", default=None, help="지정한 카테고리만 재생성")
+    args = parser.parse_args()
+    count = asyncio.run(rebuild(args.category))
+    logger.info(f"재생성 완료: 스냅샷 {count}개")
+
+
+if __name__ == "__main__":
+    main()
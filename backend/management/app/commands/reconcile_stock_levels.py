@@ -0,0 +1,50 @@
+# app/commands/reconcile_stock_levels.py
+"""
+inventory 원장을 집계해 stock_levels 와 비교하고, 어긋난 변형을 보고하거나 수정합니다.
+stock_levels 는 원장 쓰기 직후 $inc 로 갱신되므로, 두 쓰기 사이에 프로세스가 중단되면 값이 어긋날 수 있습니다.
+
+    cd backend/management
+    python -m app.commands.reconcile_stock_levels            # 차이만 보고
+    python -m app.commands.reconcile_stock_levels --fix      # 원장 값으로 수정
+    python -m app.commands.reconcile_stock_levels --rebuild  # stock_levels 를 비우고 원장에서 재생성
+
+재고 변경이 없는 시간대에 실행하세요. (집계와 수정 사이의 쓰기는 반영되지 않습니다)
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.core.database import initiate_database
+from app.core.logging import setup_logging
+from app.models.inventory import StockLevel
+from app.services.inventory_service import reconcile_stock_levels
+
+logger = logging.getLogger()
+
+
+async def run(fix: bool, rebuild: bool) -> int:
+    await initiate_database()
+    if rebuild:
+        await StockLevel.get_motor_collection().delete_many({})
+    mismatches = await reconcile_stock_levels(fix=fix or rebuild)
+    if not rebuild:
+        for variant_id, (stored, expected) in sorted(mismatches.items()):
+            logger.info(f"{variant_id}: 저장 {stored} / 원장 {expected}")
+    return len(mismatches)
+
+
+def main() -> None:
+    setup_logging()
+    parser = argparse.ArgumentParser(description="재고(stock_levels) 재조정")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--fix", action="store_true", help="어긋난 변형을 원장 값으로 수정")
+    group.add_argument("--rebuild", action="store_true", help="stock_levels 를 원장에서 전부 재생성")
+    args = parser.parse_args()
+    count = asyncio.run(run(args.fix, args.rebuild))
+    action = "재생성" if args.rebuild else ("수정" if args.fix else "불일치")
+    logger.info(f"재조정 완료: {count}개 변형 {action}")
+
+
+if __name__ == "__main__":
+    main()
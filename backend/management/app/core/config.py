@@ -146,5 +146,67 @@ class Settings(BaseSettings):
     S3_REGION: str = "us-west-rack2"
     S3_ENDPOINT_URL: str = "localhost:9010"
 
+    # 스크래퍼 설정
+    SCRAPER_ENGINE: Literal["http", "selenium"] = "http"
+    SCRAPER_FALLBACK_ENGINE: Literal["http", "selenium"] | None = "selenium"
+    SCRAPER_HTTP_TIMEOUT: float = 15.0
+    SCRAPER_POOL_SIZE: int = 3
+
+    # 랭킹 스냅샷 저장 형식 (embedded: 랭킹 행을 스냅샷 문서에 임베드, linked: ItemSnapshot 링크)
+    RANKING_STORAGE_MODE: Literal["linked", "embedded"] = "embedded"
+
+    # 스크래핑 작업 큐 설정
+    SCRAPE_JOB_WORKERS: int = 1
+    SCRAPE_JOB_TIMEOUT: float = 300.0  # 작업 1건의 최대 실행 시간(초)
+    SCRAPE_JOB_POLL_INTERVAL: float = 30.0  # 대기 중인 작업을 DB 에서 다시 확인하는 주기(초)
+
+    # 주기 스크래핑 스케줄러 설정
+    SCRAPE_SCHEDULE_ENABLED: bool = True
+    SCRAPE_SCHEDULE_CATEGORIES: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []  # 비어 있으면 전체 카테고리
+    SCRAPE_SCHEDULE_INTERVAL: int = 60 * 60  # 카테고리별 갱신 주기(초)
+    SCRAPE_SCHEDULE_JITTER: float = 0.1  # 주기 대비 무작위 분산 비율
+    SCRAPE_SCHEDULE_RETRY_BASE: int = 60  # 실패 시 첫 재시도 대기(초), 연속 실패마다 2배
+    SCRAPE_SCHEDULE_MAX_BACKOFF: int = 6 * 60 * 60
+    SCRAPE_SCHEDULE_TICK: float = 15.0  # 스케줄 확인/리더 락 갱신 간격(초)
+    SCRAPE_SCHEDULE_LOCK_TTL: int = 60  # 리더 락 만료 시간(초)
+
+    # 썸네일 캐시 설정 (엑셀 내보내기)
+    THUMBNAIL_CACHE_DIR: str = "cache/thumbnails"
+    THUMBNAIL_CACHE_TTL: int = 7 * 24 * 60 * 60  # 초
+    THUMBNAIL_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    THUMBNAIL_FETCH_CONCURRENCY: int = 16
+    THUMBNAIL_FETCH_TIMEOUT: float = 10.0
+
+    # 엑셀 스트리밍 내보내기: 이 크기까지는 메모리, 초과 시 임시 파일 사용
+    EXCEL_SPOOL_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # 내보내기 결과 캐시 (disk: EXPORT_CACHE_DIR, minio: S3_BUCKET/EXPORT_CACHE_PREFIX, none: 사용 안 함)
+    EXPORT_CACHE_BACKEND: Literal["disk", "minio", "none"] = "disk"
+    EXPORT_CACHE_DIR: str = "cache/exports"
+    EXPORT_CACHE_PREFIX: str = "exports/"
+    EXPORT_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # 재고 일괄 등록 (/inventory/bulk) 요청당 최대 행 수
+    INVENTORY_BULK_MAX_ROWS: int = 10_000
+
+    # 변형 일괄 생성 (/variants/bulk) 옵션 조합 최대 개수
+    VARIANT_BULK_MAX_COMBINATIONS: int = 1000
+
+    # 카테고리/브랜드/마켓플레이스 프로세스 내 캐시 만료 시간(초)
+    REFERENCE_CACHE_TTL: float = 5 * 60
+
+    # 일일 재고 체크포인트 (기준 시각: UTC 자정)
+    STOCK_CHECKPOINT_ENABLED: bool = True
+    STOCK_CHECKPOINT_DELAY: int = 5 * 60  # 자정 이후 대기(초), 자정 직전 쓰기가 끝나도록 여유를 둡니다.
+    STOCK_CHECKPOINT_TICK: float = 10 * 60  # 실행 여부 확인 간격(초)
+    STOCK_CHECKPOINT_BATCH: int = 1000  # 한 번에 처리할 변형 수
+    STOCK_CHECKPOINT_STALE: int = 60 * 60  # running 상태가 이 시간(초)을 넘으면 다른 워커가 다시 실행
+
+    # IAM 액세스 토큰 검증 (IAM 의 /.well-known/jwks.json 공개키로 로컬 검증, app/core/jwks.py 참고)
+    IAM_JWKS_URL: str | None = None  # 예: https://iam.example.com/.well-known/jwks.json
+    IAM_JWKS_TTL: int = 60 * 60  # 키 목록 갱신 주기(초), 만료 후에도 갱신 전까지 기존 키로 검증
+    IAM_JWKS_MIN_REFRESH_INTERVAL: int = 30  # 모르는 kid 로 인한 강제 갱신 최소 간격(초)
+    IAM_AUTH_REQUIRED: bool = False  # True 이면 모든 API 에 액세스 토큰 필요
+
 
 settings = Settings()
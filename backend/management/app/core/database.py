@@ -6,8 +6,10 @@ from app.core.config import settings
 mongo_db_uri = settings.MONGODB_URL
 
 
-async def initiate_database():
+async def initiate_database(skip_indexes: bool = False):
     client = AsyncIOMotorClient(str(mongo_db_uri), uuidRepresentation="standard")
     await init_beanie(
-        database=client.get_default_database(), document_models=models.__all__
+        database=client.get_default_database(),
+        document_models=models.__all__,
+        skip_indexes=skip_indexes,
     )
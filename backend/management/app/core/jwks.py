@@ -0,0 +1,125 @@
+# app/core/jwks.py
+"""
+IAM 액세스 토큰 로컬 검증기
+
+IAM 이 RS256/EdDSA 로 서명한 토큰을 IAM 의 JWKS(공개키 목록)로 검증합니다.
+공개키는 프로세스 안에 캐시하므로 요청 처리 중에는 네트워크 호출이 없습니다.
+- IAM_JWKS_TTL 이 지나면 기존 키로 계속 검증하면서 백그라운드에서 갱신합니다.
+- 처음 보는 kid(IAM 키 교체 직후)는 즉시 갱신하되, IAM_JWKS_MIN_REFRESH_INTERVAL 간격으로 제한합니다.
+- IAM 에 연결할 수 없으면 마지막으로 받은 키를 그대로 사용합니다.
+IAM 의 token_version 폐기는 여기서 확인할 수 없으므로 토큰은 만료 시각까지 유효합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+import httpx
+import jwt
+from jwt import PyJWK
+from jwt.exceptions import InvalidTokenError, PyJWKError
+
+from app.core.config import settings
+
+logger = logging.getLogger()
+
+# 대칭키(HS256)나 none 으로 서명된 토큰은 공개키로 검증할 수 없으므로 받지 않습니다.
+ALLOWED_ALGORITHMS = ("RS256", "EdDSA")
+
+
+class JWKSVerifier:
+    def __init__(self, url: Optional[str], ttl: float, min_refresh_interval: float):
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: dict[str, PyJWK] = {}
+        self._fetched_at = 0.0
+        self._attempted_at = 0.0
+        self._lock = asyncio.Lock()
+        self._background: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    async def _fetch(self) -> None:
+        self._attempted_at = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.get(self.url)
+                response.raise_for_status()
+                data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"JWKS 조회 실패 ({self.url}): {e}")
+            return
+
+        keys: dict[str, PyJWK] = {}
+        for jwk in data.get("keys", []):
+            try:
+                key = PyJWK(jwk)
+            except PyJWKError as e:
+                logger.warning(f"JWKS 키 무시 (kid={jwk.get('kid')}): {e}")
+                continue
+            if key.key_id and key.algorithm_name in ALLOWED_ALGORITHMS:
+                keys[key.key_id] = key
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        logger.info(f"JWKS 갱신: {sorted(keys)}")
+
+    async def refresh(self, force: bool = False) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if not force and now - self._fetched_at < self.ttl:
+                return
+            if now - self._attempted_at < self.min_refresh_interval:
+                return
+            await self._fetch()
+
+    async def get_key(self, kid: Optional[str]) -> Optional[PyJWK]:
+        key = self._keys.get(kid) if kid else None
+        if key is not None:
+            if time.monotonic() - self._fetched_at >= self.ttl and not self._background:
+                self._background = asyncio.create_task(self._refresh_in_background())
+            return key
+        if kid:
+            # 키 교체 직후일 수 있으므로 한 번 갱신해 봅니다.
+            await self.refresh(force=True)
+            return self._keys.get(kid)
+        return None
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        finally:
+            self._background = None
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """토큰 서명과 만료를 검증하고 클레임을 반환합니다. (실패 시 InvalidTokenError)"""
+        if not self.enabled:
+            raise InvalidTokenError("IAM_JWKS_URL 이 설정되지 않았습니다.")
+        header = jwt.get_unverified_header(token)
+        if header.get("alg") not in ALLOWED_ALGORITHMS:
+            raise InvalidTokenError(f"허용되지 않는 알고리즘: {header.get('alg')}")
+        key = await self.get_key(header.get("kid"))
+        if key is None:
+            raise InvalidTokenError(f"알 수 없는 kid: {header.get('kid')}")
+        return jwt.decode(token, key.key, algorithms=[key.algorithm_name])
+
+    async def start(self) -> None:
+        """시작 시 키를 미리 받아 첫 요청에서 기다리지 않도록 합니다. (실패해도 요청 시 다시 시도)"""
+        if self.enabled:
+            await self.refresh(force=True)
+
+    async def stop(self) -> None:
+        if self._background:
+            self._background.cancel()
+            await asyncio.gather(self._background, return_exceptions=True)
+            self._background = None
+
+
+jwks_verifier = JWKSVerifier(
+    settings.IAM_JWKS_URL,
+    ttl=settings.IAM_JWKS_TTL,
+    min_refresh_interval=settings.IAM_JWKS_MIN_REFRESH_INTERVAL,
+)
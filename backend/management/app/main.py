@@ -12,8 +12,14 @@ from starlette.middleware.cors import CORSMiddleware
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
 
 from app.api.main import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.core.database import initiate_database, settings
+from app.core.jwks import jwks_verifier
 from app.core.logging import setup_logging
+from app.services.scheduler_service import scrape_scheduler
+from app.services.scrape_job_service import scrape_jobs
+from app.services.stock_checkpoint_service import stock_checkpoints
+from app.services.thumbnail_cache import thumbnail_cache
 
 
 # ✅ 로깅 설정 실행
@@ -42,7 +48,16 @@ if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
 async def lifespan(app: FastAPI):
     """애플리케이션 시작 시 실행할 코드"""
     app.state.db = await initiate_database()
+    await jwks_verifier.start()
+    scrape_jobs.start()
+    scrape_scheduler.start()
+    stock_checkpoints.start()
     yield
+    await stock_checkpoints.stop()
+    await scrape_scheduler.stop()
+    await scrape_jobs.stop()
+    await thumbnail_cache.close()
+    await jwks_verifier.stop()
     # await app.state.db.close()
 
 def datetime_encoder(v: datetime) -> str:
@@ -73,6 +88,7 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
 # ✅ API 라우터 등록
@@ -1,9 +1,10 @@
 from .product import Product, Category, Brand, Variant
 from .media_asset import MediaAsset
 from .listing import Listing
-from .inventory import Inventory
-from .ranking import RankingSnapshot, ItemSnapshot, Item
+from .inventory import Inventory, StockLevel, StockCheckpoint, StockCheckpointRun
+from .ranking import RankingSnapshot, ItemSnapshot, Item, ItemHistory, RankingDailyRollup, ScrapeJob
 from .market import MarketPlace
+from .scheduler import SchedulerLock, ScrapeSchedule
 
 __all__= [
     Category, 
@@ -11,8 +12,9 @@ __all__= [
     Product,
     Variant,
     MediaAsset,
-    Inventory,
+    Inventory, StockLevel, StockCheckpoint, StockCheckpointRun,
     MarketPlace,
     Listing,
-    RankingSnapshot, ItemSnapshot, Item
+    RankingSnapshot, ItemSnapshot, Item, ItemHistory, RankingDailyRollup, ScrapeJob,
+    SchedulerLock, ScrapeSchedule,
 ]
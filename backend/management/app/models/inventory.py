@@ -1,6 +1,9 @@
 # Path: app/models/inventory.py
-from typing import Literal
-from beanie import Link
+from datetime import datetime
+from typing import Literal, Optional
+from beanie import Document, Link, PydanticObjectId
+from pydantic import Field
+from pymongo import IndexModel
 from app.models.base import BaseDocument
 from app.models.product import Variant
 
@@ -10,4 +13,57 @@ class Inventory(BaseDocument):
     quantity: int
 
     class Settings:
-        name = "inventory"
\ No newline at end of file
+        name = "inventory"
+        indexes = [
+            [("variant.$id", 1), ("_id", 1)],
+            # 시점 재고 조회: 체크포인트 이후 원장만 변형별로 재생
+            [("variant.$id", 1), ("created_at", 1)],
+            [("created_at", 1)],
+        ]
+
+
+class StockLevel(Document):
+    """
+    변형별 현재 재고 (inventory 원장의 구체화 뷰)
+    _id 가 변형 ID 이므로 변형 하나의 재고는 _id 조회 한 번으로 끝납니다.
+    inventory 쓰기마다 $inc 로 갱신되며, 어긋난 경우 reconcile_stock_levels 명령으로 원장에서 다시 계산합니다.
+    """
+    id: PydanticObjectId  # 변형 ID
+    quantity: int = 0
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "stock_levels"
+
+
+class StockCheckpoint(Document):
+    """
+    변형별 일일 재고 체크포인트
+    quantity 는 created_at < as_of 인 원장 내역의 합계입니다.
+    시점 재고는 가장 가까운 이전 체크포인트에 그 이후 원장만 더해 계산합니다.
+    """
+    variant_id: PydanticObjectId
+    as_of: datetime
+    quantity: int
+
+    class Settings:
+        name = "stock_checkpoints"
+        indexes = [
+            IndexModel([("variant_id", 1), ("as_of", -1)], unique=True),
+            [("as_of", -1)],
+        ]
+
+
+class StockCheckpointRun(Document):
+    """일일 체크포인트 생성 실행 기록 (_id: 기준일 YYYY-MM-DD), 워커 간 중복 실행 방지에 사용"""
+    id: str
+    as_of: datetime
+    owner: str
+    status: Literal["running", "succeeded", "failed"] = "running"
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    variant_count: int = 0
+    error: Optional[str] = None
+
+    class Settings:
+        name = "stock_checkpoint_runs"
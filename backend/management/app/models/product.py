@@ -4,6 +4,7 @@ import re
 from typing import Optional, List, Union
 from beanie import Document, Insert, Link, before_event
 from pydantic import BaseModel
+from pymongo import IndexModel, TEXT
 from app.models.base import BaseDocument
 from app.models.media_asset import MediaAsset
 
@@ -25,6 +26,9 @@ class Brand(Document):
 
     class Settings:
         name = "brands"
+        indexes = [
+            [("category._id", 1), ("_id", 1)],
+        ]
 
 class LocaleName(BaseModel):
     locale: str
@@ -42,6 +46,21 @@ class Product(BaseDocument):
 
     class Settings:
         name = "products"
+        # 목록 필터 + 키셋 페이지네이션 (_id)
+        indexes = [
+            [("brand.category.name", 1), ("_id", 1)],
+            [("brand.name", 1), ("_id", 1)],
+            # /search: 이름 접두어 검색
+            [("name", 1)],
+            # /search: 전문 검색 (컬렉션당 text 인덱스는 하나)
+            # 한국어/일본어 형태소 분석이 없으므로 언어별 어간 처리를 끄고(none) 공백/구두점 단위로 토큰화합니다.
+            IndexModel(
+                [("name", TEXT), ("locale_names.name", TEXT), ("tags", TEXT), ("brand.name", TEXT)],
+                name="product_search_text",
+                weights={"name": 10, "locale_names.name": 5, "brand.name": 3, "tags": 2},
+                default_language="none",
+            ),
+        ]
 
 class VariantOption(BaseModel):
     name: str
@@ -60,17 +79,30 @@ class Variant(BaseDocument):
 
     class Settings:
         name = "variants"
+        indexes = [
+            [("product._id", 1), ("_id", 1)],
+            # SKU 는 변형마다 고유 (SKU 가 없는 기존 문서는 제외), /search 의 SKU 일치/접두어 조회에도 사용
+            IndexModel(
+                [("sku", 1)],
+                name="sku_unique",
+                unique=True,
+                partialFilterExpression={"sku": {"$type": "string"}},
+            ),
+            # /search, 바코드 조회
+            [("barcode", 1)],
+        ]
 
 
     @before_event(Insert)
     async def generate_sku_if_missing(self):
         if not self.sku:
-            self.sku = generate_sku(
+            base = generate_sku(
                 category_name=self.product.brand.category.name,
                 brand_name=self.product.brand.name,
                 product_name=self.product.name,
                 options=self.options
             )
+            self.sku = (await assign_unique_skus([base]))[0]
 
 
 def generate_sku(category_name: str, brand_name: str, product_name: str, options: List[VariantOption]) -> str:
@@ -96,3 +128,26 @@ def generate_sku(category_name: str, brand_name: str, product_name: str, options
 
     return f"{cat_code}-{brand_code}-{product_code}-{option_str}"
 
+
+async def assign_unique_skus(bases: List[str]) -> List[str]:
+    """
+    기본 SKU 목록에 대해 겹치지 않는 SKU 를 순서대로 정합니다.
+    이미 저장되어 있거나 목록 안에서 먼저 배정된 SKU 와 같으면 -2, -3 ... 중 비어 있는 가장 작은 접미사를 붙입니다.
+    기존 SKU 는 기본 SKU 별 앵커 정규식(^<base>(-N)?$)을 묶은 $in 조회 한 번으로 가져옵니다. (sku 인덱스 범위 조회)
+    동시에 같은 SKU 를 배정한 요청은 고유 인덱스에서 DuplicateKeyError 로 실패하므로 호출 측에서 다시 배정합니다.
+    """
+    patterns = [re.compile(f"^{re.escape(base)}(-\\d+)?$") for base in dict.fromkeys(bases)]
+    taken = set()
+    if patterns:
+        cursor = Variant.get_motor_collection().find({"sku": {"$in": patterns}}, {"sku": 1})
+        taken = {doc["sku"] async for doc in cursor}
+
+    skus = []
+    for base in bases:
+        sku, n = base, 1
+        while sku in taken:
+            n += 1
+            sku = f"{base}-{n}"
+        taken.add(sku)
+        skus.append(sku)
+    return skus
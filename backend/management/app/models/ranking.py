@@ -1,7 +1,8 @@
-from beanie import Document, Indexed, Link, after_event, Insert
-from pydantic import  Field
+from beanie import Document, Granularity, Indexed, Link, PydanticObjectId, TimeSeriesConfig, after_event, Insert
+from pymongo import IndexModel
+from pydantic import BaseModel, Field
 from datetime import datetime, timezone, timedelta
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 
 from app.models.base import BaseDocument
 
@@ -31,21 +32,81 @@ class ItemSnapshot(Document):
     review_count: Optional[int] = None
     class Settings:
         name = "item_snapshots"
+
+class ItemHistory(Document):
+    """
+    아이템별 순위/가격/판매량 시계열 포인트 (MongoDB time-series 컬렉션)
+    """
+    timestamp: datetime
+    item_id: str
+    category: Optional[str] = None
+    rank: Optional[int] = None
+    sold: Optional[int] = None
+    original_price: Optional[int] = None
+    sale_price: Optional[int] = None
+    mega_price: Optional[int] = None
+    review_count: Optional[int] = None
+
+    class Settings:
+        name = "item_history"
+        timeseries = TimeSeriesConfig(
+            time_field="timestamp",
+            meta_field="item_id",
+            granularity=Granularity.hours,
+        )
         indexes = [
-            [("item", 1), ("ranking_snapshot", 1)]
+            [("item_id", 1), ("timestamp", -1)],
+            [("category", 1), ("timestamp", -1)],
         ]
 
+class RankingEntry(BaseModel):
+    """
+    RankingSnapshot 에 직접 임베드되는 랭킹 행 (Item 정적 필드 비정규화 포함)
+    """
+    snapshot_id: PydanticObjectId = Field(default_factory=PydanticObjectId)
+    item_ref: PydanticObjectId  # Item 문서의 _id
+    item_id: str
+    item_name: str
+    link: str
+    brand_name: Optional[str] = None
+    brand_link: Optional[str] = None
+    thumbnail: Optional[str] = None
+    ship_info: Optional[str] = None
+    is_official: bool = False
+    category: Optional[str] = None
+    rank: Optional[int] = None
+    sold: Optional[int] = None
+    original_price: Optional[int] = None
+    sale_price: Optional[int] = None
+    discount_rate: Optional[float] = None
+    mega_price: Optional[int] = None
+    mega_discount_rate: Optional[float] = None
+    review_count: Optional[int] = None
+
 class RankingSnapshot(BaseDocument):
     category: str
     timestamp: datetime = Field(default_factory=datetime.now)
+    # linked: items 에 ItemSnapshot 링크 저장 (기존 형식)
+    # embedded: entries 에 랭킹 행을 직접 저장 (단일 문서 조회)
+    storage: Literal["linked", "embedded"] = "linked"
     items: List[Link[ItemSnapshot]] = []
+    entries: List[RankingEntry] = []
+    history_recorded: bool = False  # item_history 시계열 기록 여부
 
     class Settings:
         name = "ranking_snapshots"
         indexes = [
             [("category", 1), ("display_time", -1)],
+            # 목록 조회 키셋 페이지네이션 (sort_by, _id)
+            [("category", 1), ("created_at", -1), ("_id", -1)],
+            [("category", 1), ("updated_at", -1), ("_id", -1)],
+            [("created_at", -1), ("_id", -1)],
+            [("updated_at", -1), ("_id", -1)],
         ]
 
+    def item_count(self) -> int:
+        return len(self.entries) if self.storage == "embedded" else len(self.items)
+
     async def save(self, *args, **kwargs):
         self.updated_at = datetime.now(timezone.utc)
         return await super().save(*args, **kwargs)
@@ -58,3 +119,91 @@ class RankingSnapshot(BaseDocument):
             "category": self.category,
             "display_time": {"$lt": threshold}
         })
+
+
+class RankingSummary(BaseModel):
+    """목록 조회용 프로젝션 (items/entries 배열을 읽지 않고 개수만 계산)"""
+    id: PydanticObjectId = Field(alias="_id")
+    category: str
+    timestamp: datetime
+    counts: int
+    # 키셋 커서 생성용 정렬 키
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "category": 1,
+            "timestamp": 1,
+            "created_at": 1,
+            "updated_at": 1,
+            "counts": {
+                "$add": [
+                    {"$size": {"$ifNull": ["$items", []]}},
+                    {"$size": {"$ifNull": ["$entries", []]}},
+                ]
+            },
+        }
+
+
+class RollupItem(BaseModel):
+    """일별 롤업의 아이템별 순위 요약"""
+    item_id: str
+    item_name: str
+    link: str
+    brand_name: Optional[str] = None
+    thumbnail: Optional[str] = None
+    best_rank: Optional[int] = None
+    worst_rank: Optional[int] = None
+    last_rank: Optional[int] = None
+    prev_rank: Optional[int] = None  # 전일 마지막 순위
+    rank_delta: Optional[int] = None  # prev_rank - last_rank (양수: 상승)
+    in_latest: bool = True  # 당일 마지막 스냅샷에 포함 여부
+    is_new: bool = False  # 전일 마지막 스냅샷에 없던 신규 진입
+
+class RankingDailyRollup(BaseDocument):
+    """
+    카테고리/일자별 랭킹 롤업 (스냅샷 저장 시마다 갱신)
+    """
+    category: str
+    day: datetime  # UTC 자정
+    previous_day: Optional[datetime] = None  # 비교 대상 전일 롤업
+    snapshot_count: int = 0
+    last_snapshot_at: Optional[datetime] = None
+    items: List[RollupItem] = []
+    dropped: List[RollupItem] = []  # 전일 마지막 스냅샷에는 있었으나 당일 마지막 스냅샷에서 빠진 아이템
+    version: int = 0  # 동시 갱신 감지용 (갱신마다 1 증가)
+
+    class Settings:
+        name = "ranking_daily_rollups"
+        indexes = [
+            IndexModel([("category", 1), ("day", -1)], unique=True),
+        ]
+
+
+class ScrapeJob(BaseDocument):
+    """
+    백그라운드 스크래핑 작업
+    active 가 True 인 작업은 카테고리별로 1건만 존재할 수 있습니다 (부분 유니크 인덱스).
+    """
+    category: str
+    status: Literal["queued", "running", "succeeded", "failed"] = "queued"
+    active: bool = True
+    ranking_id: Optional[PydanticObjectId] = None
+    item_count: int = 0
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Settings:
+        name = "scrape_jobs"
+        indexes = [
+            IndexModel(
+                [("category", 1)],
+                unique=True,
+                partialFilterExpression={"active": True},
+                name="category_active_unique",
+            ),
+            [("category", 1), ("created_at", -1)],
+        ]
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Annotated, Literal, Optional
+
+from beanie import Document, Indexed, PydanticObjectId
+
+from app.models.base import BaseDocument
+
+
+class SchedulerLock(Document):
+    """
+    여러 uvicorn 워커/레플리카 중 하나만 스케줄러를 실행하도록 하는 리더 락
+    expires_at 이 지나면 다른 인스턴스가 락을 가져갈 수 있습니다.
+    """
+    id: str  # 락 이름
+    owner: str
+    expires_at: datetime
+
+    class Settings:
+        name = "scheduler_locks"
+
+
+class ScrapeSchedule(BaseDocument):
+    """카테고리별 주기 스크래핑 일정 및 마지막 실행 지표"""
+    category: Annotated[str, Indexed(unique=True)]
+    next_run_at: datetime
+    job_id: Optional[PydanticObjectId] = None  # 진행 중인 작업
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_status: Optional[Literal["succeeded", "failed"]] = None
+    last_error: Optional[str] = None
+    last_duration: Optional[float] = None  # 초
+    last_item_count: Optional[int] = None
+    last_ranking_id: Optional[PydanticObjectId] = None
+    consecutive_failures: int = 0
+    run_count: int = 0
+    failure_count: int = 0
+
+    class Settings:
+        name = "scrape_schedules"
@@ -0,0 +1,14 @@
+# Path: app/schemas/cache.py
+from typing import Dict
+from pydantic import BaseModel
+
+
+class CacheCounters(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+
+class ReferenceCacheStats(BaseModel):
+    ttl: float
+    models: Dict[str, CacheCounters]
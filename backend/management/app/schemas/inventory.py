@@ -1,6 +1,6 @@
 # Path: app/schemas/inventory.py
 from datetime import datetime
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 from beanie import PydanticObjectId
 from app.schemas.variant import VariantPublic
@@ -49,4 +49,31 @@ class InventoryPublic(BaseModel):
                 "created_at": "2023-10-01T12:00:00Z",
                 "updated_at": "2023-10-01T12:00:00Z"
             }
-        }   
\ No newline at end of file
+        }
+
+class StockLevelPublic(BaseModel):
+    variant_id: PydanticObjectId
+    quantity: int
+    updated_at: Optional[datetime] = None
+    as_of: Optional[datetime] = None  # 시점 조회인 경우 기준 시각
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "variant_id": "6810abc648c0e7f0cb3c4bec",
+                "quantity": 100,
+                "updated_at": "2023-10-01T12:00:00Z"
+            }
+        }
+
+
+class InventoryBulkError(BaseModel):
+    index: int  # 요청 본문에서의 행 위치 (0부터)
+    error: str
+
+
+class InventoryBulkResult(BaseModel):
+    received: int
+    inserted: int
+    failed: int
+    errors: List[InventoryBulkError] = []
@@ -4,7 +4,7 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 from beanie import PydanticObjectId
 from app.schemas.brand import BrandPublic
-from app.models.product import LocaleName
+from app.models.product import LocaleName, VariantOption
 from app.schemas.media import MediaAssetPublic
 
 class ProductCreate(BaseModel):
@@ -27,6 +27,14 @@ class ProductUpdate(BaseModel):
     class Config:
         extra='allow'
 
+class VariantSummary(BaseModel):
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    sku: Optional[str] = None
+    barcode: Optional[str] = None
+    options: List[VariantOption] = []
+    price: float
+
 class ProductPublic(BaseModel):
     id: PydanticObjectId = Field(alias="_id")
     name: str
@@ -39,3 +47,8 @@ class ProductPublic(BaseModel):
     
     class Config:
         from_attributes = True
+
+class ProductListPublic(ProductPublic):
+    # 제품 목록 전용: include_variants=true 이면 $lookup 으로 조인한 변형 요약, 아니면 None
+    # (Product.variants 는 Link/DBRef 목록이므로 단건 조회/수정 및 변형에 임베드된 제품 응답에는 포함하지 않습니다.)
+    variants: Optional[List[VariantSummary]] = None
@@ -40,6 +40,8 @@ class RankingSnapshotPublic(BaseModel):
     category: str
     items: List[ItemSnapshotPublic]
     timestamp: datetime
+    stale: bool = False  # 새 스크래핑 작업이 끝나기 전의 이전 스냅샷 여부
+    job_id: Optional[PydanticObjectId] = None
 
 class ScrapeItem(BaseModel):
     item_id: str
@@ -58,3 +60,102 @@ class ScrapeItem(BaseModel):
     mega_price: Optional[int]
     mega_discount_rate: Optional[float]
     review_count: Optional[int]
+
+
+class CategoryScrapeResult(BaseModel):
+    category: str
+    ranking_id: Optional[PydanticObjectId] = None
+    item_count: int = 0
+    scrape_seconds: float = 0.0
+    persist_seconds: float = 0.0
+    total_seconds: float = 0.0
+    error: Optional[str] = None
+
+class ScrapeAllResult(BaseModel):
+    pool_size: int
+    total_seconds: float
+    results: List[CategoryScrapeResult]
+
+
+class ItemHistoryPoint(BaseModel):
+    timestamp: datetime
+    best_rank: Optional[int] = None
+    worst_rank: Optional[int] = None
+    avg_rank: Optional[float] = None
+    last_rank: Optional[int] = None
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    last_price: Optional[int] = None
+    first_sold: Optional[int] = None
+    last_sold: Optional[int] = None
+    sold_delta: Optional[int] = None
+    review_count: Optional[int] = None
+    samples: int
+
+class ItemHistoryPublic(BaseModel):
+    item_id: str
+    bucket: str
+    start: datetime
+    end: datetime
+    points: List[ItemHistoryPoint]
+
+
+class RollupItemPublic(BaseModel):
+    item_id: str
+    item_name: str
+    link: str
+    brand_name: Optional[str] = None
+    thumbnail: Optional[str] = None
+    best_rank: Optional[int] = None
+    worst_rank: Optional[int] = None
+    last_rank: Optional[int] = None
+    prev_rank: Optional[int] = None
+    rank_delta: Optional[int] = None
+    is_new: bool = False
+
+class RankingMoversPublic(BaseModel):
+    category: str
+    day: datetime
+    previous_day: Optional[datetime] = None
+    snapshot_count: int
+    last_snapshot_at: Optional[datetime] = None
+    risers: List[RollupItemPublic]
+    fallers: List[RollupItemPublic]
+    new_entries: List[RollupItemPublic]
+    dropped: List[RollupItemPublic]
+
+
+class ScrapeJobPublic(BaseModel):
+    id: PydanticObjectId = Field(alias="_id")
+    category: str
+    status: str
+    ranking_id: Optional[PydanticObjectId] = None
+    item_count: int = 0
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class ScrapeSchedulePublic(BaseModel):
+    category: str
+    next_run_at: datetime
+    job_id: Optional[PydanticObjectId] = None
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_error: Optional[str] = None
+    last_duration: Optional[float] = None
+    last_item_count: Optional[int] = None
+    last_ranking_id: Optional[PydanticObjectId] = None
+    consecutive_failures: int = 0
+    run_count: int = 0
+    failure_count: int = 0
+
+class ScrapeSchedulerStatus(BaseModel):
+    enabled: bool
+    interval: int
+    instance: str  # 응답한 인스턴스
+    leader: Optional[str] = None  # 현재 리더 락 소유 인스턴스
+    lock_expires_at: Optional[datetime] = None
+    categories: List[ScrapeSchedulePublic]
@@ -0,0 +1,22 @@
+# Path: app/schemas/search.py
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+from beanie import PydanticObjectId
+
+
+class SearchHit(BaseModel):
+    type: Literal["product", "variant"]
+    id: PydanticObjectId
+    product_id: PydanticObjectId
+    name: str
+    product_name: str
+    brand_name: Optional[str] = None
+    sku: Optional[str] = None
+    barcode: Optional[str] = None
+    match: Literal["barcode", "sku", "sku_prefix", "text", "name_prefix"]
+    score: float
+
+
+class SearchResult(BaseModel):
+    query: str
+    hits: List[SearchHit]
@@ -1,6 +1,6 @@
 # Path: app/schemas/product.py
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 from pydantic import BaseModel, Field
 from beanie import PydanticObjectId
 from app.models.product import VariantOption
@@ -31,6 +31,31 @@ class VariantCreate(BaseModel):
             }
         }
 
+class VariantOptionAxis(BaseModel):
+    name: str
+    values: List[Union[str, int]] = Field(..., min_length=1)
+    unit: Optional[str] = None
+
+
+class VariantBulkCreate(BaseModel):
+    """옵션 축의 모든 조합(데카르트 곱)으로 변형을 생성합니다."""
+    product_id: PydanticObjectId
+    axes: List[VariantOptionAxis] = Field(..., min_length=1)
+    price: float
+    media_urls: Optional[List[str]] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "product_id": "6818be2b6f3825e94c1d93e8",
+                "axes": [
+                    {"name": "Size", "values": [50, 100], "unit": "ml"},
+                    {"name": "Color", "values": ["Red", "Blue"]}
+                ],
+                "price": 19.99
+            }
+        }
+
 class VariantUpdate(BaseModel):
     name: Optional[str]
     barcode: Optional[str] = None
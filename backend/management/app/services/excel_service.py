@@ -1,22 +1,107 @@
 # app/services/excel_service.py
-import os
+import asyncio
 import io
-import requests
-import pandas as pd
-from beanie import PydanticObjectId
+import logging
 from datetime import datetime
-from app.models.ranking import RankingSnapshot
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, Optional
 
-async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str):
+import xlsxwriter
+from beanie import PydanticObjectId
+from PIL import Image
+
+from app.core.config import settings
+from app.models.ranking import RankingEntry, RankingSnapshot
+from app.services.ranking_service import load_ranking_entries
+from app.services.thumbnail_cache import thumbnail_cache
+
+logger = logging.getLogger()
+
+EXPORT_FORMAT = "xlsx"  # 내보내기 캐시 키, 워크북 레이아웃을 바꾸면 함께 바꿔 기존 캐시를 무효화합니다.
+ROW_HEIGHT = 73  # pt
+# 행 높이 73pt(약 97px), B열 너비 13.57(약 100px) 안에 들어가도록 여백을 둔 썸네일 크기
+THUMBNAIL_BOX = (95, 95)
+
+
+async def _load_export_data(ranking_id: PydanticObjectId) -> tuple[RankingSnapshot, list[RankingEntry], dict[str, Optional[bytes]]]:
     ranking = await RankingSnapshot.get(ranking_id)
     if not ranking:
         raise ValueError("해당 Ranking 데이터가 존재하지 않습니다.")
 
-    items = ranking.items
-    display_str = ranking.display_time.strftime("%Y-%m-%d %H:%M")
+    items = await load_ranking_entries(ranking)
+    # 썸네일은 캐시 조회 후 미스만 동시에 다운로드하고, 워크북 작성은 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    thumbnails = await thumbnail_cache.fetch_many(snap.thumbnail for snap in items)
+    return ranking, items, thumbnails
+
+
+async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str):
+    ranking, items, thumbnails = await _load_export_data(ranking_id)
+    await asyncio.to_thread(
+        write_ranking_workbook, ranking.category, ranking.timestamp, items, thumbnails, output_path
+    )
+
+
+async def export_ranking_to_stream(ranking_id: PydanticObjectId) -> tuple[SpooledTemporaryFile, int, int]:
+    """
+    스트리밍 다운로드용 내보내기 -> (파일, 크기, 받지 못한 썸네일 수)
+    constant_memory 모드로 행을 순서대로 기록하고, 썸네일은 행 높이에 맞게 축소해 삽입합니다.
+    결과는 EXCEL_SPOOL_MAX_BYTES 까지는 메모리, 그 이상은 임시 파일에 기록되며 close() 시 삭제됩니다.
+    """
+    ranking, items, thumbnails = await _load_export_data(ranking_id)
+    spool = SpooledTemporaryFile(max_size=settings.EXCEL_SPOOL_MAX_BYTES)
+    try:
+        await asyncio.to_thread(
+            write_ranking_workbook,
+            ranking.category,
+            ranking.timestamp,
+            items,
+            thumbnails,
+            spool,
+            constant_memory=True,
+            thumbnail_box=THUMBNAIL_BOX,
+        )
+    except Exception:
+        spool.close()
+        raise
+    size = spool.tell()
+    spool.seek(0)
+    missing = sum(1 for data in thumbnails.values() if data is None)
+    return spool, size, missing
+
+
+def iter_file(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def downscale_thumbnail(data: bytes, box: tuple[int, int]) -> Optional[bytes]:
+    """썸네일을 box 크기 안으로 축소해 JPEG 로 다시 인코딩합니다. 읽을 수 없는 이미지는 None"""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img.thumbnail(box, Image.Resampling.LANCZOS)
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            out = io.BytesIO()
+            img.save(out, format="JPEG", quality=85, optimize=True)
+            return out.getvalue()
+    except Exception as e:
+        logger.warning(f"썸네일 축소 실패: {e}")
+        return None
+
+
+def write_ranking_workbook(
+    category: str,
+    timestamp: datetime,
+    items: list[RankingEntry],
+    thumbnails: dict[str, Optional[bytes]],
+    output: str | BinaryIO,
+    constant_memory: bool = False,
+    thumbnail_box: Optional[tuple[int, int]] = None,
+):
+    display_str = timestamp.strftime("%Y-%m-%d %H:%M")
 
-    with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-        workbook = writer.book
+    # constant_memory 모드는 행 단위로 기록 후 바로 내보내므로 아래 코드는 행 순서대로만 작성해야 합니다.
+    with xlsxwriter.Workbook(output, {"constant_memory": constant_memory}) as workbook:
         currency_format = workbook.add_format({
             'num_format': '#,##0"円"', 'valign': 'vcenter', 'align': 'right', 'border': 1})
         ranking_format = workbook.add_format({
@@ -43,7 +128,7 @@ async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str
             'num_format': '0.0%', 'valign': 'vcenter', 'align': 'center', 'border': 1})
 
         worksheet = workbook.add_worksheet("Ranking")
-        worksheet.write("A1", f"Qoo10 {ranking.category} 랭킹 리포트 (기준 시각: {display_str})", title_format)
+        worksheet.write("A1", f"Qoo10 {category} 랭킹 리포트 (기준 시각: {display_str})", title_format)
         worksheet.set_column("B:B", 13.57)
         worksheet.set_column("C:C", 45)
         worksheet.set_column("D:D", 25)
@@ -56,20 +141,16 @@ async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str
 
         for idx, snap in enumerate(items):
             row = idx + 3
-            worksheet.set_row(row, 73)
+            worksheet.set_row(row, ROW_HEIGHT)
 
-            rank_val = snap.overall_ranking if ranking.category == "total" else snap.category_rank
-            worksheet.write_number(row, 0, rank_val or 0, ranking_format)
+            worksheet.write_number(row, 0, snap.rank or 0, ranking_format)
 
             worksheet.write_blank(row, 1, None, text_format)
-            if snap.thumbnail:
-                try:
-                    resp = requests.get(snap.thumbnail)
-                    if resp.status_code == 200:
-                        img = io.BytesIO(resp.content)
-                        worksheet.insert_image(row, 1, 'img.jpg', {'image_data': img})
-                except:
-                    pass
+            image = thumbnails.get(snap.thumbnail) if snap.thumbnail else None
+            if image and thumbnail_box:
+                image = downscale_thumbnail(image, thumbnail_box)
+            if image:
+                worksheet.insert_image(row, 1, 'img.jpg', {'image_data': io.BytesIO(image), 'x_offset': 2, 'y_offset': 2})
 
             worksheet.write_url(row, 2, snap.link, link_format, snap.item_name)
             if snap.brand_link:
@@ -77,8 +158,9 @@ async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str
             else:
                 worksheet.write(row, 3, snap.brand_name, left_text_format)
 
-            fmt = official_format if snap.item_type == "공식" else unofficial_format
-            worksheet.write(row, 4, snap.item_type, fmt)
+            item_type = "공식" if snap.is_official else "비공식"
+            fmt = official_format if snap.is_official else unofficial_format
+            worksheet.write(row, 4, item_type, fmt)
 
             worksheet.write_number(row, 5, snap.sold or 0, number_format)
             worksheet.write_number(row, 6, snap.original_price or 0, currency_format)
@@ -93,4 +175,5 @@ async def export_ranking_to_excel(ranking_id: PydanticObjectId, output_path: str
             else:
                 worksheet.write(row, 10, "", text_format)
             worksheet.write_number(row, 11, snap.review_count or 0, number_format)
-    print(f"✅ 엑셀 저장 완료: {output_path}")
\ No newline at end of file
+    if isinstance(output, str):
+        print(f"✅ 엑셀 저장 완료: {output}")
\ No newline at end of file
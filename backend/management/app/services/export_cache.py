@@ -0,0 +1,276 @@
+# app/services/export_cache.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+
+logger = logging.getLogger()
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ExportArtifact:
+    """캐시된 내보내기 결과"""
+    key: str
+    etag: str  # 따옴표를 포함한 강한 ETag ("<sha256>")
+    size: int
+    path: Optional[str] = None  # 디스크 저장소인 경우 파일 경로
+    store: Optional["ExportStore"] = None
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        if self.path:
+            with open(self.path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    yield chunk
+        else:
+            yield from self.store.iter_object(self.key)
+
+
+def export_key(ranking_id, fmt: str) -> str:
+    return f"{ranking_id}.{fmt}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 값, W/ 접두사, * 포함)가 etag 와 일치하는지 확인합니다."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ExportStore:
+    """내보내기 결과 저장소 인터페이스 (모든 메서드는 동기, 호출 측에서 스레드로 실행)"""
+
+    def get(self, key: str) -> Optional[ExportArtifact]:
+        raise NotImplementedError
+
+    def put(self, key: str, file: BinaryIO, size: int) -> ExportArtifact:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> int:
+        raise NotImplementedError
+
+    def iter_object(self, key: str) -> Iterator[bytes]:
+        raise NotImplementedError
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """용량 초과분을 삭제합니다. keep 키는 방금 저장한 결과이므로 삭제하지 않습니다."""
+        raise NotImplementedError
+
+
+def _sha256_file(file: BinaryIO) -> str:
+    file.seek(0)
+    digest = hashlib.sha256()
+    while chunk := file.read(CHUNK_SIZE):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+class DiskExportStore(ExportStore):
+    """
+    로컬 디스크 저장소: <root>/<key> 와 메타데이터 <root>/<key>.json
+    조회 시 mtime 을 갱신하고, 전체 크기가 max_bytes 를 넘으면 오래된 파일부터 삭제합니다 (LRU).
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[ExportArtifact]:
+        path = self.root / key
+        try:
+            meta = json.loads((self.root / f"{key}.json").read_text())
+            size = path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return ExportArtifact(key=key, etag=meta["etag"], size=size, path=str(path))
+
+    def put(self, key: str, file: BinaryIO, size: int) -> ExportArtifact:
+        self.root.mkdir(parents=True, exist_ok=True)
+        etag = f'"{_sha256_file(file)}"'
+        path = self.root / key
+        tmp = self.root / f"{key}.{uuid4().hex}.tmp"
+        with open(tmp, "wb") as out:
+            shutil.copyfileobj(file, out, CHUNK_SIZE)
+        tmp.replace(path)
+        (self.root / f"{key}.json").write_text(json.dumps({"etag": etag, "size": size}))
+        file.seek(0)
+        return ExportArtifact(key=key, etag=etag, size=size, path=str(path))
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = 0
+        for path in self.root.glob(f"{prefix}*"):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += path.suffix != ".json"
+        return removed
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        if not self.root.exists():
+            return 0
+        files = []
+        total = 0
+        for path in self.root.iterdir():
+            if path.suffix in (".json", ".tmp"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if path.name != keep:
+                files.append((stat.st_mtime, stat.st_size, path))
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            Path(f"{path}.json").unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+class MinioExportStore(ExportStore):
+    """
+    MinIO 버킷 저장소: <prefix><key>, ETag 는 객체 메타데이터(x-amz-meta-sha256)에 저장합니다.
+    객체의 접근 시각을 갱신할 수 없으므로 용량 초과 시 마지막 수정 시각이 오래된 객체부터 삭제합니다.
+    """
+
+    def __init__(self, bucket: str, prefix: str, max_bytes: int):
+        from app.services.store_to_bucket import client
+
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[ExportArtifact]:
+        from minio.error import S3Error
+
+        try:
+            stat = self.client.stat_object(self.bucket, self.prefix + key)
+        except S3Error:
+            return None
+        digest = (stat.metadata or {}).get("x-amz-meta-sha256")
+        if not digest:
+            return None
+        return ExportArtifact(key=key, etag=f'"{digest}"', size=stat.size, store=self)
+
+    def put(self, key: str, file: BinaryIO, size: int) -> ExportArtifact:
+        digest = _sha256_file(file)
+        self.client.put_object(
+            self.bucket,
+            self.prefix + key,
+            file,
+            length=size,
+            content_type="application/octet-stream",
+            metadata={"sha256": digest},
+        )
+        file.seek(0)
+        return ExportArtifact(key=key, etag=f'"{digest}"', size=size, store=self)
+
+    def iter_object(self, key: str) -> Iterator[bytes]:
+        response = self.client.get_object(self.bucket, self.prefix + key)
+        try:
+            yield from response.stream(CHUNK_SIZE)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = 0
+        for obj in self.client.list_objects(self.bucket, prefix=self.prefix + prefix):
+            self.client.remove_object(self.bucket, obj.object_name)
+            removed += 1
+        return removed
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        objects = sorted(
+            self.client.list_objects(self.bucket, prefix=self.prefix),
+            key=lambda obj: obj.last_modified,
+        )
+        total = sum(obj.size for obj in objects)
+        removed = 0
+        for obj in objects:
+            if total <= self.max_bytes:
+                break
+            if keep and obj.object_name == self.prefix + keep:
+                continue
+            self.client.remove_object(self.bucket, obj.object_name)
+            total -= obj.size
+            removed += 1
+        return removed
+
+
+class ExportCache:
+    """
+    랭킹 내보내기 결과 캐시 (키: ranking_id + 형식)
+    RankingSnapshot 은 저장 후 변경되지 않으므로 한 번 만든 결과를 삭제 전까지 재사용합니다.
+    """
+
+    def __init__(self, store: Optional[ExportStore]):
+        self.store = store
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    async def get(self, ranking_id, fmt: str) -> Optional[ExportArtifact]:
+        if not self.store:
+            return None
+        try:
+            return await asyncio.to_thread(self.store.get, export_key(ranking_id, fmt))
+        except Exception as e:
+            logger.warning(f"내보내기 캐시 조회 실패 ({ranking_id}.{fmt}): {e}")
+            return None
+
+    async def put(self, ranking_id, fmt: str, file: BinaryIO, size: int) -> Optional[ExportArtifact]:
+        """생성한 결과를 저장합니다. 저장에 실패하면 None 을 반환하며 호출 측은 원본 파일을 그대로 사용합니다."""
+        if not self.store:
+            return None
+        try:
+            key = export_key(ranking_id, fmt)
+            artifact = await asyncio.to_thread(self.store.put, key, file, size)
+            removed = await asyncio.to_thread(self.store.evict, key)
+            if removed:
+                logger.info(f"내보내기 캐시 정리: {removed}개 삭제")
+            return artifact
+        except Exception as e:
+            logger.warning(f"내보내기 캐시 저장 실패 ({ranking_id}.{fmt}): {e}")
+            file.seek(0)
+            return None
+
+    async def invalidate(self, ranking_id) -> None:
+        if not self.store:
+            return
+        try:
+            await asyncio.to_thread(self.store.delete_prefix, f"{ranking_id}.")
+        except Exception as e:
+            logger.warning(f"내보내기 캐시 삭제 실패 ({ranking_id}): {e}")
+
+
+def _build_store() -> Optional[ExportStore]:
+    backend = settings.EXPORT_CACHE_BACKEND
+    if backend == "disk":
+        return DiskExportStore(settings.EXPORT_CACHE_DIR, settings.EXPORT_CACHE_MAX_BYTES)
+    if backend == "minio":
+        return MinioExportStore(settings.S3_BUCKET, settings.EXPORT_CACHE_PREFIX, settings.EXPORT_CACHE_MAX_BYTES)
+    return None
+
+
+export_cache = ExportCache(_build_store())
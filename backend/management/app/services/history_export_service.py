@@ -0,0 +1,141 @@
+# app/services/history_export_service.py
+
+import asyncio
+import logging
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Literal, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.core.config import settings
+from app.models.ranking import Item, ItemHistory
+from app.services.ranking_service import HISTORY_FIELDS
+
+logger = logging.getLogger()
+
+ExportFormat = Literal["parquet", "arrow"]
+
+MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# 내보내기 컬럼: item_history 측정값 + Item 정적 필드
+ITEM_EXPORT_FIELDS = ("item_name", "brand_name", "link", "thumbnail", "is_official")
+
+HISTORY_SCHEMA = pa.schema([
+    ("timestamp", pa.timestamp("ms", tz="UTC")),
+    ("category", pa.string()),
+    ("item_id", pa.string()),
+    ("rank", pa.int32()),
+    ("sold", pa.int64()),
+    ("original_price", pa.int64()),
+    ("sale_price", pa.int64()),
+    ("mega_price", pa.int64()),
+    ("review_count", pa.int64()),
+    ("item_name", pa.string()),
+    ("brand_name", pa.string()),
+    ("link", pa.string()),
+    ("thumbnail", pa.string()),
+    ("is_official", pa.bool_()),
+])
+
+
+def rows_to_batch(rows: list[dict]) -> pa.RecordBatch:
+    """item_history 문서(Item 필드 병합 완료)를 컬럼 단위 RecordBatch 로 변환합니다."""
+    return pa.RecordBatch.from_pydict(
+        {name: [row.get(name) for row in rows] for name in HISTORY_SCHEMA.names},
+        schema=HISTORY_SCHEMA,
+    )
+
+
+class HistoryWriter:
+    """Parquet / Arrow IPC 스트림 writer 공통 래퍼"""
+
+    def __init__(self, sink: BinaryIO | str, fmt: ExportFormat):
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(sink, HISTORY_SCHEMA, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_stream(sink, HISTORY_SCHEMA)
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+async def _attach_items(rows: list[dict], items: dict[str, dict]) -> None:
+    """배치에서 처음 보는 item_id 만 $in 으로 조회해 Item 정적 필드를 합칩니다."""
+    missing = list({row["item_id"] for row in rows} - items.keys())
+    if missing:
+        projection = {"_id": 0, "item_id": 1, **{f: 1 for f in ITEM_EXPORT_FIELDS}}
+        async for doc in Item.get_motor_collection().find({"item_id": {"$in": missing}}, projection):
+            items[doc["item_id"]] = doc
+    for row in rows:
+        row.update(items.get(row["item_id"], {}))
+
+
+async def export_item_history(
+    sink: BinaryIO | str,
+    fmt: ExportFormat,
+    start: datetime,
+    end: datetime,
+    category: Optional[str] = None,
+    batch_size: int = 5000,
+) -> int:
+    """
+    item_history 를 시간순 커서로 읽어 batch_size 행 단위 RecordBatch 로 기록합니다.
+    메모리에는 한 배치와 Item 정적 필드 캐시만 유지되므로 기간이 길어도 사용량이 일정합니다.
+    기록한 행 수를 반환합니다.
+    """
+    query: dict = {"timestamp": {"$gte": start, "$lt": end}}
+    if category:
+        query["category"] = category
+    projection = {"_id": 0, "timestamp": 1, "category": 1, "item_id": 1, **{f: 1 for f in HISTORY_FIELDS}}
+    cursor = (
+        ItemHistory.get_motor_collection()
+        .find(query, projection, batch_size=batch_size, allow_disk_use=True)
+        .sort("timestamp", 1)
+    )
+
+    writer = await asyncio.to_thread(HistoryWriter, sink, fmt)
+    items: dict[str, dict] = {}
+    rows: list[dict] = []
+    total = 0
+    try:
+        async for doc in cursor:
+            rows.append(doc)
+            if len(rows) >= batch_size:
+                await _attach_items(rows, items)
+                await asyncio.to_thread(writer.write, rows_to_batch(rows))
+                total += len(rows)
+                rows = []
+        if rows:
+            await _attach_items(rows, items)
+            await asyncio.to_thread(writer.write, rows_to_batch(rows))
+            total += len(rows)
+    finally:
+        await asyncio.to_thread(writer.close)
+    logger.info(f"아이템 이력 내보내기 완료: {total}행 ({fmt}, {category or '전체'})")
+    return total
+
+
+async def export_item_history_to_stream(
+    fmt: ExportFormat,
+    start: datetime,
+    end: datetime,
+    category: Optional[str] = None,
+) -> tuple[SpooledTemporaryFile, int]:
+    """다운로드 응답용으로 SpooledTemporaryFile 에 기록하고 (파일, 크기)를 반환합니다."""
+    spool = SpooledTemporaryFile(max_size=settings.EXCEL_SPOOL_MAX_BYTES)
+    try:
+        await export_item_history(spool, fmt, start, end, category)
+    except Exception:
+        spool.close()
+        raise
+    size = spool.tell()
+    spool.seek(0)
+    return spool, size
@@ -0,0 +1,276 @@
+# app/services/inventory_service.py
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+from beanie import Link, PydanticObjectId
+from pydantic import ValidationError
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.models.inventory import Inventory, StockCheckpoint, StockLevel
+from app.models.product import Variant
+from app.schemas.inventory import InventoryBulkError, InventoryBulkResult, InventoryCreate
+
+logger = logging.getLogger()
+
+
+def stock_delta(change_type: str, quantity: int) -> int:
+    """
+    원장 한 건이 재고에 미치는 증감량
+    - in: +quantity / out: -quantity / adjust: quantity 를 부호 있는 보정값으로 그대로 반영
+    """
+    return -quantity if change_type == "out" else quantity
+
+
+# 집계 파이프라인용 stock_delta 표현식
+STOCK_DELTA_EXPR = {
+    "$cond": [{"$eq": ["$change_type", "out"]}, {"$multiply": ["$quantity", -1]}, "$quantity"]
+}
+
+# Link 는 DBRef 로 저장되므로 집계 표현식에서는 $id 를 $getField 로 꺼냅니다.
+VARIANT_ID_EXPR = {"$getField": {"field": {"$literal": "$id"}, "input": "$variant"}}
+
+
+def variant_id_of(inventory: Inventory) -> PydanticObjectId:
+    # Link 가 아직 조회되지 않았으면 DBRef 의 id, 조회된 경우 문서의 id
+    variant = inventory.variant
+    return variant.ref.id if isinstance(variant, Link) else variant.id
+
+
+async def apply_stock_delta(variant_id: PydanticObjectId, delta: int) -> None:
+    """stock_levels 를 $inc 로 원자적으로 갱신합니다. (문서가 없으면 생성)"""
+    if not delta:
+        return
+    await StockLevel.get_motor_collection().update_one(
+        {"_id": variant_id},
+        {"$inc": {"quantity": delta}, "$set": {"updated_at": datetime.now(timezone.utc)}},
+        upsert=True,
+    )
+
+
+async def record_inventory_change(variant_id: PydanticObjectId, change_type: str, quantity: int) -> Inventory:
+    """원장에 변경 내역을 추가하고 재고를 반영합니다."""
+    inventory = await Inventory(
+        variant=Variant.link_from_id(variant_id),
+        change_type=change_type,
+        quantity=quantity,
+    ).insert()
+    await apply_stock_delta(variant_id, stock_delta(change_type, quantity))
+    return inventory
+
+
+async def update_inventory_change(
+    inventory: Inventory,
+    variant_id: PydanticObjectId,
+    change_type: str,
+    quantity: int,
+) -> bool:
+    """
+    기존 내역의 증감량을 되돌리고 수정된 내역의 증감량을 반영합니다. (변형이 바뀐 경우 양쪽 모두 갱신)
+    조회한 뒤 다른 요청이 먼저 수정/삭제했으면 아무것도 바꾸지 않고 False 를 반환합니다.
+    """
+    old_variant_id = variant_id_of(inventory)
+    old_delta = stock_delta(inventory.change_type, inventory.quantity)
+    new_delta = stock_delta(change_type, quantity)
+
+    # 조회한 값 그대로일 때만 수정해야 같은 증감량이 두 번 되돌려지지 않습니다.
+    result = await Inventory.get_motor_collection().update_one(
+        {
+            "_id": inventory.id,
+            "variant.$id": old_variant_id,
+            "change_type": inventory.change_type,
+            "quantity": inventory.quantity,
+        },
+        {"$set": {
+            "variant": Variant.link_from_id(variant_id).to_ref(),
+            "change_type": change_type,
+            "quantity": quantity,
+            "updated_at": datetime.now(timezone.utc),
+        }},
+    )
+    if result.matched_count != 1:
+        return False
+    if old_variant_id == variant_id:
+        await apply_stock_delta(variant_id, new_delta - old_delta)
+    else:
+        await apply_stock_delta(old_variant_id, -old_delta)
+        await apply_stock_delta(variant_id, new_delta)
+    await invalidate_checkpoints({old_variant_id, variant_id}, inventory.created_at)
+    return True
+
+
+async def delete_inventory_change(inventory: Inventory) -> bool:
+    """내역을 삭제하고 증감량을 되돌립니다. 이미 다른 요청이 삭제했으면 False 를 반환합니다."""
+    result = await Inventory.get_motor_collection().delete_one({"_id": inventory.id})
+    if result.deleted_count != 1:
+        return False
+    variant_id = variant_id_of(inventory)
+    await apply_stock_delta(variant_id, -stock_delta(inventory.change_type, inventory.quantity))
+    await invalidate_checkpoints({variant_id}, inventory.created_at)
+    return True
+
+
+async def invalidate_checkpoints(variant_ids: Iterable[PydanticObjectId], since: datetime) -> None:
+    """
+    과거 원장 내역이 수정/삭제되면 그 내역을 포함한 체크포인트(as_of > created_at)를 삭제합니다.
+    시점 조회는 더 이전 체크포인트부터 원장을 재생하므로 결과는 정확하게 유지됩니다.
+    """
+    await StockCheckpoint.get_motor_collection().delete_many(
+        {"variant_id": {"$in": list(variant_ids)}, "as_of": {"$gt": since}}
+    )
+
+
+def parse_bulk_rows(body: bytes, ndjson: bool) -> tuple[list[Any], list[InventoryBulkError]]:
+    """
+    일괄 등록 본문을 행 목록으로 변환합니다.
+    - ndjson: 줄마다 JSON 객체 하나 (빈 줄 무시), 파싱 실패한 줄은 행 오류로 기록
+    - 그 외: JSON 배열 (전체 파싱 실패 시 ValueError)
+    """
+    if not ndjson:
+        rows = json.loads(body)
+        if not isinstance(rows, list):
+            raise ValueError("JSON 배열이 아닙니다.")
+        return rows, []
+
+    rows: list[Any] = []
+    errors: list[InventoryBulkError] = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            rows.append(json.loads(line))
+        except ValueError as e:
+            errors.append(InventoryBulkError(index=len(rows), error=f"JSON 파싱 실패: {e}"))
+            rows.append(None)
+    return rows, errors
+
+
+async def record_inventory_changes(rows: list[Any], errors: Optional[list[InventoryBulkError]] = None) -> InventoryBulkResult:
+    """
+    재고 변경 내역 일괄 등록
+    1) 모든 행을 한 번에 검증  2) 변형 ID 를 $in 한 번으로 확인  3) insert_many(ordered=False)
+    4) 삽입된 행의 증감량을 변형별로 합산해 stock_levels 를 bulk_write 한 번으로 갱신
+    실패한 행은 건너뛰고 (index, error) 로 반환합니다.
+    """
+    errors = list(errors or [])
+    failed = {e.index for e in errors}
+    valid: list[tuple[int, InventoryCreate]] = []
+    for index, row in enumerate(rows):
+        if index in failed:
+            continue
+        try:
+            valid.append((index, InventoryCreate.model_validate(row)))
+        except ValidationError as e:
+            errors.append(InventoryBulkError(index=index, error=_validation_message(e)))
+
+    variant_ids = {obj.variant_id for _, obj in valid}
+    known = set()
+    if variant_ids:
+        cursor = Variant.get_motor_collection().find({"_id": {"$in": list(variant_ids)}}, {"_id": 1})
+        known = {doc["_id"] async for doc in cursor}
+
+    now = datetime.now(timezone.utc)
+    docs: list[Inventory] = []
+    positions: list[int] = []  # docs[i] 의 요청 행 위치
+    for index, obj in valid:
+        if obj.variant_id not in known:
+            errors.append(InventoryBulkError(index=index, error="제품 변형을 찾을 수 없습니다."))
+            continue
+        docs.append(Inventory(
+            id=PydanticObjectId(),
+            variant=Variant.link_from_id(obj.variant_id),
+            change_type=obj.change_type,
+            quantity=obj.quantity,
+            created_at=now,
+            updated_at=now,
+        ))
+        positions.append(index)
+
+    inserted = docs
+    if docs:
+        try:
+            await Inventory.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            rejected = {err["index"] for err in e.details.get("writeErrors", [])}
+            for err in e.details.get("writeErrors", []):
+                errors.append(InventoryBulkError(index=positions[err["index"]], error=err.get("errmsg", "저장 실패")))
+            inserted = [doc for i, doc in enumerate(docs) if i not in rejected]
+
+    deltas: dict[PydanticObjectId, int] = defaultdict(int)
+    for doc in inserted:
+        deltas[doc.variant.ref.id] += stock_delta(doc.change_type, doc.quantity)
+    await apply_stock_deltas(deltas, now)
+
+    errors.sort(key=lambda e: e.index)
+    return InventoryBulkResult(received=len(rows), inserted=len(inserted), failed=len(errors), errors=errors)
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in error.errors())
+
+
+async def apply_stock_deltas(deltas: dict[PydanticObjectId, int], now: Optional[datetime] = None) -> None:
+    """여러 변형의 증감량을 bulk_write 한 번으로 반영합니다."""
+    now = now or datetime.now(timezone.utc)
+    operations = [
+        UpdateOne({"_id": variant_id}, {"$inc": {"quantity": delta}, "$set": {"updated_at": now}}, upsert=True)
+        for variant_id, delta in deltas.items()
+        if delta
+    ]
+    if not operations:
+        return
+    try:
+        await StockLevel.get_motor_collection().bulk_write(operations, ordered=False)
+    except Exception as e:
+        # 원장은 이미 저장되었으므로 요청은 실패시키지 않고 재조정 명령으로 복구합니다.
+        logger.error(f"재고 일괄 반영 실패 ({len(operations)}개 변형), reconcile_stock_levels 로 재조정 필요: {e}")
+
+
+async def get_stock_level(variant_id: PydanticObjectId) -> Optional[StockLevel]:
+    return await StockLevel.get(variant_id)
+
+
+async def compute_stock_levels(variant_ids: Optional[Iterable[PydanticObjectId]] = None) -> dict[PydanticObjectId, int]:
+    """원장 전체(또는 지정 변형)를 집계해 변형별 재고를 계산합니다. (재조정용, 원장 전체 스캔)"""
+    pipeline: list[dict] = []
+    if variant_ids is not None:
+        pipeline.append({"$match": {"variant.$id": {"$in": list(variant_ids)}}})
+    pipeline.append({"$group": {
+        "_id": VARIANT_ID_EXPR,
+        "quantity": {"$sum": STOCK_DELTA_EXPR},
+    }})
+    cursor = Inventory.get_motor_collection().aggregate(pipeline, allowDiskUse=True)
+    return {doc["_id"]: doc["quantity"] async for doc in cursor}
+
+
+async def reconcile_stock_levels(fix: bool = False) -> dict[PydanticObjectId, tuple[int, int]]:
+    """
+    원장 집계 결과와 stock_levels 를 비교해 어긋난 변형의 (저장값, 원장값)을 반환합니다.
+    fix=True 이면 저장값을 원장값으로 덮어씁니다.
+    비교와 수정 사이에 들어온 쓰기는 반영되지 않으므로 재고 변경이 없는 시간대에 실행해야 합니다.
+    """
+    expected = await compute_stock_levels()
+    stored = {
+        doc["_id"]: doc.get("quantity", 0)
+        async for doc in StockLevel.get_motor_collection().find({}, {"quantity": 1})
+    }
+    mismatches = {
+        variant_id: (stored.get(variant_id, 0), expected.get(variant_id, 0))
+        for variant_id in expected.keys() | stored.keys()
+        if stored.get(variant_id, 0) != expected.get(variant_id, 0)
+    }
+    if fix and mismatches:
+        now = datetime.now(timezone.utc)
+        collection = StockLevel.get_motor_collection()
+        for variant_id, (_, quantity) in mismatches.items():
+            await collection.update_one(
+                {"_id": variant_id},
+                {"$set": {"quantity": quantity, "updated_at": now}},
+                upsert=True,
+            )
+        logger.info(f"재고 재조정: {len(mismatches)}개 변형 수정")
+    return mismatches
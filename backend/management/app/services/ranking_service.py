@@ -0,0 +1,273 @@
+# app/services/ranking_service.py
+
+import logging
+from datetime import datetime, timezone
+from typing import Literal, Optional
+
+from beanie import Link, PydanticObjectId
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.models.ranking import Item, ItemHistory, ItemSnapshot, RankingEntry, RankingSnapshot
+from app.schemas.ranking import (
+    ItemHistoryPoint,
+    ItemHistoryPublic,
+    ItemPublic,
+    ItemSnapshotPublic,
+    RankingSnapshotPublic,
+    ScrapeItem,
+)
+
+logger = logging.getLogger()
+
+# Item 문서에 저장되는 정적 필드 (스크래핑 시마다 최신값으로 갱신)
+ITEM_FIELDS = (
+    "item_name",
+    "link",
+    "brand_name",
+    "brand_link",
+    "thumbnail",
+    "ship_info",
+    "is_official",
+)
+
+
+# ItemSnapshot 에 저장되는 시점별 필드
+SNAPSHOT_FIELDS = (
+    "category",
+    "rank",
+    "sold",
+    "original_price",
+    "sale_price",
+    "discount_rate",
+    "mega_price",
+    "mega_discount_rate",
+    "review_count",
+)
+
+
+async def upsert_items(scraped_items: list[ScrapeItem]) -> dict[str, PydanticObjectId]:
+    """
+    스크래핑한 아이템을 item_id 기준으로 한 번의 bulk_write 로 upsert 하고,
+    item_id -> Item._id 매핑을 반환합니다.
+    """
+    if not scraped_items:
+        return {}
+
+    now = datetime.now(timezone.utc)
+    latest: dict[str, ScrapeItem] = {s.item_id: s for s in scraped_items}
+    operations = [
+        UpdateOne(
+            {"item_id": item_id},
+            {
+                "$set": {**{f: getattr(s, f) for f in ITEM_FIELDS}, "updated_at": now},
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+        )
+        for item_id, s in latest.items()
+    ]
+    collection = Item.get_motor_collection()
+    await collection.bulk_write(operations, ordered=False)
+
+    # upserted_ids 는 새로 생성된 문서만 포함하므로 기존 문서까지 한 번에 조회합니다.
+    cursor = collection.find({"item_id": {"$in": list(latest)}}, {"_id": 1, "item_id": 1})
+    return {doc["item_id"]: doc["_id"] async for doc in cursor}
+
+
+def build_item_snapshots(
+    category: str,
+    scraped_items: list[ScrapeItem],
+    item_ids: dict[str, PydanticObjectId],
+) -> list[ItemSnapshot]:
+    return [
+        ItemSnapshot(
+            id=PydanticObjectId(),
+            item=Item.link_from_id(item_ids[s.item_id]),
+            **s.model_dump(include=set(SNAPSHOT_FIELDS)),
+            category=category,
+        )
+        for s in scraped_items
+        if s.item_id in item_ids
+    ]
+
+
+def build_ranking_entries(
+    category: str,
+    scraped_items: list[ScrapeItem],
+    item_ids: dict[str, PydanticObjectId],
+) -> list[RankingEntry]:
+    return [
+        RankingEntry(
+            item_ref=item_ids[s.item_id],
+            category=category,
+            **s.model_dump(),
+        )
+        for s in scraped_items
+        if s.item_id in item_ids
+    ]
+
+
+async def save_ranking_snapshot(
+    category: str,
+    scraped_items: list[ScrapeItem],
+    storage: Optional[Literal["linked", "embedded"]] = None,
+) -> RankingSnapshot:
+    """
+    스크래핑 결과를 일괄 저장합니다.
+    1) Item: bulk_write(UpdateOne upsert) 1회 + _id 조회 1회
+    2) linked: ItemSnapshot insert_many 1회 / embedded: 랭킹 행을 스냅샷 문서에 임베드
+    3) RankingSnapshot: insert 1회
+    """
+    storage = storage or settings.RANKING_STORAGE_MODE
+    snapshot = RankingSnapshot(category=category, storage=storage)
+
+    item_ids = await upsert_items(scraped_items)
+    if storage == "embedded":
+        snapshot.entries = build_ranking_entries(category, scraped_items, item_ids)
+    else:
+        item_snapshots = build_item_snapshots(category, scraped_items, item_ids)
+        if item_snapshots:
+            await ItemSnapshot.insert_many(item_snapshots, ordered=True)
+        snapshot.items = [ItemSnapshot.link_from_id(s.id) for s in item_snapshots]
+
+    await record_item_history(category, snapshot.timestamp, scraped_items)
+    snapshot.history_recorded = True
+    await snapshot.insert()
+    logger.info(f"'{category}' 랭킹 스냅샷 저장 완료 ({snapshot.item_count()}건, {storage})")
+    return snapshot
+
+
+# ItemHistory 에 기록되는 측정 필드
+HISTORY_FIELDS = ("rank", "sold", "original_price", "sale_price", "mega_price", "review_count")
+
+
+async def record_item_history(category: str, timestamp: datetime, rows: list[ScrapeItem] | list[RankingEntry]) -> int:
+    """랭킹 행을 item_history 시계열 컬렉션에 insert_many 로 기록합니다."""
+    points = [
+        ItemHistory(
+            timestamp=timestamp,
+            item_id=row.item_id,
+            category=category,
+            **row.model_dump(include=set(HISTORY_FIELDS)),
+        )
+        for row in rows
+    ]
+    if points:
+        await ItemHistory.insert_many(points, ordered=False)
+    return len(points)
+
+
+async def resolve_linked_entries(ranking: RankingSnapshot) -> list[RankingEntry]:
+    """
+    linked 형식 스냅샷의 ItemSnapshot/Item 링크를 $in 조회 2회로 풀어 RankingEntry 로 변환합니다.
+    """
+    snapshot_ids = [item.ref.id if isinstance(item, Link) else item.id for item in ranking.items]
+    if not snapshot_ids:
+        return []
+
+    snapshot_docs = {
+        doc["_id"]: doc
+        async for doc in ItemSnapshot.get_motor_collection().find({"_id": {"$in": snapshot_ids}})
+    }
+    item_refs = {doc["item"].id for doc in snapshot_docs.values() if doc.get("item")}
+    item_docs = {
+        doc["_id"]: doc
+        async for doc in Item.get_motor_collection().find({"_id": {"$in": list(item_refs)}})
+    }
+
+    entries: list[RankingEntry] = []
+    for snapshot_id in snapshot_ids:
+        snap = snapshot_docs.get(snapshot_id)
+        item = item_docs.get(snap["item"].id) if snap and snap.get("item") else None
+        if not snap or not item:
+            continue
+        entries.append(RankingEntry(
+            snapshot_id=snapshot_id,
+            item_ref=item["_id"],
+            **{f: item.get(f) for f in ("item_id", *ITEM_FIELDS)},
+            **{f: snap.get(f) for f in SNAPSHOT_FIELDS},
+        ))
+    return entries
+
+
+async def load_ranking_entries(ranking: RankingSnapshot) -> list[RankingEntry]:
+    """저장 형식과 무관하게 스냅샷의 랭킹 행을 반환합니다."""
+    if ranking.storage == "embedded":
+        return ranking.entries
+    return await resolve_linked_entries(ranking)
+
+
+def entry_to_public(entry: RankingEntry) -> ItemSnapshotPublic:
+    return ItemSnapshotPublic(
+        _id=entry.snapshot_id,
+        item=ItemPublic(
+            _id=entry.item_ref,
+            item_id=entry.item_id,
+            item_name=entry.item_name,
+            link=entry.link,
+            brand_name=entry.brand_name,
+            brand_link=entry.brand_link,
+            thumbnail=entry.thumbnail,
+            ship_info=entry.ship_info,
+            is_official=entry.is_official,
+        ),
+        **entry.model_dump(include=set(SNAPSHOT_FIELDS)),
+    )
+
+
+async def ranking_to_public(ranking: RankingSnapshot) -> RankingSnapshotPublic:
+    entries = await load_ranking_entries(ranking)
+    return RankingSnapshotPublic(
+        _id=ranking.id,
+        category=ranking.category,
+        timestamp=ranking.timestamp,
+        items=[entry_to_public(e) for e in entries],
+    )
+
+
+async def get_item_history(
+    item_id: str,
+    start: datetime,
+    end: datetime,
+    bucket: Literal["hour", "day", "week", "month"] = "day",
+) -> ItemHistoryPublic:
+    """
+    item_history 시계열에서 기간 내 포인트를 bucket 단위로 집계합니다.
+    (item_id, timestamp) 범위 조회이므로 포인트 수가 많아도 해당 아이템의 버킷만 읽습니다.
+    """
+    pipeline = [
+        {"$match": {"item_id": item_id, "timestamp": {"$gte": start, "$lt": end}}},
+        {"$sort": {"timestamp": 1}},
+        {"$group": {
+            "_id": {"$dateTrunc": {"date": "$timestamp", "unit": bucket}},
+            "best_rank": {"$min": "$rank"},
+            "worst_rank": {"$max": "$rank"},
+            "avg_rank": {"$avg": "$rank"},
+            "last_rank": {"$last": "$rank"},
+            "min_price": {"$min": "$sale_price"},
+            "max_price": {"$max": "$sale_price"},
+            "last_price": {"$last": "$sale_price"},
+            "first_sold": {"$first": "$sold"},
+            "last_sold": {"$last": "$sold"},
+            "review_count": {"$last": "$review_count"},
+            "samples": {"$sum": 1},
+        }},
+        {"$sort": {"_id": 1}},
+    ]
+    rows = await ItemHistory.get_motor_collection().aggregate(pipeline).to_list(length=None)
+    points = []
+    for row in rows:
+        # 버킷의 rank 가 모두 null 이면 $avg 도 null 이므로 값과 무관하게 꺼내야 합니다.
+        avg_rank = row.pop("avg_rank", None)
+        points.append(ItemHistoryPoint(
+            timestamp=row.pop("_id"),
+            avg_rank=round(avg_rank, 2) if avg_rank is not None else None,
+            sold_delta=(
+                row["last_sold"] - row["first_sold"]
+                if row.get("last_sold") is not None and row.get("first_sold") is not None
+                else None
+            ),
+            **row,
+        ))
+    return ItemHistoryPublic(item_id=item_id, bucket=bucket, start=start, end=end, points=points)
@@ -0,0 +1,85 @@
+# app/services/reference_cache.py
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Optional, TypeVar
+
+from beanie import Document, PydanticObjectId
+
+from app.core.config import settings
+from app.models.market import MarketPlace
+from app.models.product import Brand, Category
+
+logger = logging.getLogger()
+
+T = TypeVar("T", bound=Document)
+
+
+class ReferenceCache:
+    """
+    카테고리/브랜드/마켓플레이스 조회용 프로세스 내 read-through 캐시
+    - 키: (모델, "id" | "name", 값), 항목마다 REFERENCE_CACHE_TTL 초 후 만료
+    - 생성/수정/삭제 라우트에서 invalidate(모델) 로 해당 모델의 항목을 모두 비웁니다.
+    - 워커(프로세스)마다 별도 캐시이므로 다른 워커의 변경은 TTL 이 지나야 반영됩니다.
+    - 조회 결과가 없으면 캐시하지 않습니다. (직후 생성된 문서를 바로 찾을 수 있도록)
+    반환하는 문서는 캐시 항목의 복사본이므로 수정해도 캐시에 영향이 없습니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str, Any], tuple[float, Document]] = {}
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    async def _get(self, model: type[T], field: str, value: Any) -> Optional[T]:
+        kind = model.__name__
+        key = (kind, field, value)
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.hits[kind] += 1
+            return entry[1].model_copy(deep=True)
+
+        self.misses[kind] += 1
+        if field == "id":
+            doc = await model.get(value)
+        else:
+            doc = await model.find_one({field: value})
+        if doc is not None:
+            self._entries[key] = (time.monotonic() + self.ttl, doc.model_copy(deep=True))
+        return doc
+
+    async def get_category(self, id: PydanticObjectId) -> Optional[Category]:
+        return await self._get(Category, "id", id)
+
+    async def get_category_by_name(self, name: str) -> Optional[Category]:
+        return await self._get(Category, "name", name)
+
+    async def get_brand(self, id: PydanticObjectId) -> Optional[Brand]:
+        return await self._get(Brand, "id", id)
+
+    async def get_marketplace(self, id: PydanticObjectId) -> Optional[MarketPlace]:
+        return await self._get(MarketPlace, "id", id)
+
+    def invalidate(self, model: Optional[type[Document]] = None) -> None:
+        """model 의 항목을 모두 삭제합니다. (None 이면 전체)"""
+        if model is None:
+            self._entries.clear()
+            return
+        kind = model.__name__
+        for key in [k for k in self._entries if k[0] == kind]:
+            del self._entries[key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        kinds = sorted(set(self.hits) | set(self.misses) | {k[0] for k in self._entries})
+        return {
+            kind: {
+                "hits": self.hits[kind],
+                "misses": self.misses[kind],
+                "size": sum(1 for k in self._entries if k[0] == kind),
+            }
+            for kind in kinds
+        }
+
+
+reference_cache = ReferenceCache(settings.REFERENCE_CACHE_TTL)
@@ -0,0 +1,187 @@
+# app/services/rollup_service.py
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from app.models.ranking import RankingDailyRollup, RankingEntry, RollupItem
+from app.schemas.ranking import RankingMoversPublic, RollupItemPublic, ScrapeItem
+
+logger = logging.getLogger()
+
+# 같은 (category, day) 롤업을 동시에 갱신할 때 재시도 횟수
+ROLLUP_UPDATE_ATTEMPTS = 5
+
+
+def _as_utc(ts: datetime) -> datetime:
+    # MongoDB 에서 읽은 datetime 은 naive(UTC) 이므로 aware 로 맞춰 비교합니다.
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def day_of(value: datetime | date) -> datetime:
+    """롤업 키로 사용하는 UTC 자정 시각"""
+    if isinstance(value, datetime):
+        value = _as_utc(value)
+    return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+
+
+def _merge_rows(
+    rollup: RankingDailyRollup,
+    timestamp: datetime,
+    rows: list[ScrapeItem] | list[RankingEntry],
+) -> None:
+    """스냅샷 한 건의 랭킹 행을 당일 롤업에 합칩니다."""
+    ts = _as_utc(timestamp)
+    is_latest = rollup.last_snapshot_at is None or ts >= _as_utc(rollup.last_snapshot_at)
+    items = {item.item_id: item for item in rollup.items}
+    seen: set[str] = set()
+
+    for row in rows:
+        seen.add(row.item_id)
+        item = items.get(row.item_id)
+        if item is None:
+            item = items[row.item_id] = RollupItem(
+                item_id=row.item_id,
+                item_name=row.item_name,
+                link=row.link,
+                in_latest=False,
+            )
+        if row.rank is not None:
+            item.best_rank = row.rank if item.best_rank is None else min(item.best_rank, row.rank)
+            item.worst_rank = row.rank if item.worst_rank is None else max(item.worst_rank, row.rank)
+        if is_latest or item.last_rank is None:
+            item.last_rank = row.rank
+            item.item_name = row.item_name
+            item.link = row.link
+            item.brand_name = row.brand_name
+            item.thumbnail = row.thumbnail
+
+    if is_latest:
+        rollup.last_snapshot_at = ts
+        for item in items.values():
+            item.in_latest = item.item_id in seen
+    rollup.items = list(items.values())
+    rollup.snapshot_count += 1
+
+
+def _compare_with_previous(rollup: RankingDailyRollup, previous: Optional[RankingDailyRollup]) -> None:
+    """전일 롤업의 마지막 순위와 비교해 순위 변동/신규 진입/이탈을 계산합니다."""
+    prev_items = {item.item_id: item for item in previous.items if item.in_latest} if previous else {}
+    rollup.previous_day = previous.day if previous else None
+
+    for item in rollup.items:
+        prev = prev_items.get(item.item_id)
+        item.prev_rank = prev.last_rank if prev else None
+        item.rank_delta = (
+            item.prev_rank - item.last_rank
+            if item.prev_rank is not None and item.last_rank is not None
+            else None
+        )
+        # 비교할 전일 롤업이 없으면 신규 진입으로 보지 않습니다.
+        item.is_new = previous is not None and item.in_latest and prev is None
+
+    current = {item.item_id for item in rollup.items if item.in_latest}
+    rollup.dropped = [
+        prev.model_copy(update={"prev_rank": prev.last_rank, "rank_delta": None, "in_latest": False, "is_new": False})
+        for item_id, prev in prev_items.items()
+        if item_id not in current
+    ]
+    rollup.items.sort(key=lambda i: (not i.in_latest, i.last_rank is None, i.last_rank or 0))
+    rollup.dropped.sort(key=lambda i: (i.prev_rank is None, i.prev_rank or 0))
+
+
+async def _save_rollup(rollup: RankingDailyRollup) -> bool:
+    """
+    읽은 뒤 다른 요청이 갱신하지 않았을 때만 저장합니다. (version 비교)
+    새 문서는 insert 하고, 그 사이 다른 요청이 먼저 만들었으면 False 를 반환합니다.
+    """
+    if rollup.id is None:
+        try:
+            await rollup.insert()
+        except DuplicateKeyError:
+            return False
+        return True
+
+    expected = rollup.version
+    rollup.version += 1
+    rollup.updated_at = datetime.now(timezone.utc)
+    # version 필드가 추가되기 전에 만들어진 문서는 version 이 없습니다.
+    version_filter = {"$in": [0, None]} if expected == 0 else expected
+    result = await RankingDailyRollup.find_one({"_id": rollup.id, "version": version_filter}).update(
+        {"$set": {
+            "previous_day": rollup.previous_day,
+            "snapshot_count": rollup.snapshot_count,
+            "last_snapshot_at": rollup.last_snapshot_at,
+            "items": rollup.items,
+            "dropped": rollup.dropped,
+            "version": rollup.version,
+            "updated_at": rollup.updated_at,
+        }}
+    )
+    return result.matched_count == 1
+
+
+async def refresh_daily_rollup(
+    category: str,
+    timestamp: datetime,
+    rows: list[ScrapeItem] | list[RankingEntry],
+) -> RankingDailyRollup:
+    """
+    스냅샷 저장 직후 호출되어 (category, day) 롤업 문서를 갱신합니다.
+    당일/전일 롤업 문서 2건만 읽으므로 스냅샷 수와 무관하게 비용이 일정합니다.
+    같은 카테고리의 스냅샷이 동시에 저장되면 (스크래핑 작업, 스케줄러, 전체 스크래핑 등)
+    먼저 저장된 결과를 다시 읽어 합치므로 어느 스냅샷도 누락되지 않습니다.
+    """
+    day = day_of(timestamp)
+    for _ in range(ROLLUP_UPDATE_ATTEMPTS):
+        rollup = await RankingDailyRollup.find_one({"category": category, "day": day})
+        previous = await RankingDailyRollup.find(
+            {"category": category, "day": {"$lt": day}}
+        ).sort("-day").first_or_none()
+
+        rollup = rollup or RankingDailyRollup(category=category, day=day)
+        _merge_rows(rollup, timestamp, rows)
+        _compare_with_previous(rollup, previous)
+        if await _save_rollup(rollup):
+            logger.info(
+                f"'{category}' {day:%Y-%m-%d} 일별 롤업 갱신 ({len(rollup.items)}건, 스냅샷 {rollup.snapshot_count}개)"
+            )
+            return rollup
+        logger.info(f"'{category}' {day:%Y-%m-%d} 일별 롤업 동시 갱신 감지, 다시 시도합니다.")
+    raise RuntimeError(f"'{category}' {day:%Y-%m-%d} 일별 롤업을 갱신하지 못했습니다. (동시 갱신 충돌)")
+
+
+def _to_public(items: list[RollupItem], limit: int) -> list[RollupItemPublic]:
+    return [RollupItemPublic(**item.model_dump()) for item in items[:limit]]
+
+
+async def get_movers(category: str, day: Optional[date] = None, limit: int = 10) -> Optional[RankingMoversPublic]:
+    """
+    롤업 문서 1건으로 급상승/급하락/신규 진입/이탈 아이템을 반환합니다.
+    day 를 지정하지 않으면 가장 최근 롤업을 사용합니다.
+    """
+    query: dict = {"category": category}
+    if day is not None:
+        query["day"] = day_of(day)
+    rollup = await RankingDailyRollup.find(query).sort("-day").first_or_none()
+    if rollup is None:
+        return None
+
+    latest = [item for item in rollup.items if item.in_latest]
+    risers = sorted((i for i in latest if i.rank_delta and i.rank_delta > 0), key=lambda i: -i.rank_delta)
+    fallers = sorted((i for i in latest if i.rank_delta and i.rank_delta < 0), key=lambda i: i.rank_delta)
+    new_entries = [i for i in latest if i.is_new]
+
+    return RankingMoversPublic(
+        category=rollup.category,
+        day=rollup.day,
+        previous_day=rollup.previous_day,
+        snapshot_count=rollup.snapshot_count,
+        last_snapshot_at=rollup.last_snapshot_at,
+        risers=_to_public(risers, limit),
+        fallers=_to_public(fallers, limit),
+        new_entries=_to_public(new_entries, limit),
+        dropped=_to_public(rollup.dropped, limit),
+    )
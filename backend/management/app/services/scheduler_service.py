@@ -0,0 +1,206 @@
+# app/services/scheduler_service.py
+
+import asyncio
+import logging
+import os
+import random
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import uuid4
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.models.ranking import ScrapeJob
+from app.models.scheduler import SchedulerLock, ScrapeSchedule
+from app.schemas.ranking import ScrapeSchedulePublic, ScrapeSchedulerStatus
+from app.services.scrape_job_service import ScrapeJobQueue, scrape_jobs
+from app.services.scraping_service import CATEGORY_URLS
+
+logger = logging.getLogger()
+
+LOCK_NAME = "ranking-scrape-scheduler"
+
+
+def _as_utc(ts: datetime) -> datetime:
+    # MongoDB 에서 읽은 datetime 은 naive(UTC)
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts
+
+
+def _jittered(seconds: float) -> float:
+    """대기 시간을 ±SCRAPE_SCHEDULE_JITTER 비율로 분산합니다."""
+    jitter = settings.SCRAPE_SCHEDULE_JITTER
+    return seconds * random.uniform(1 - jitter, 1 + jitter)
+
+
+def backoff_seconds(consecutive_failures: int) -> float:
+    """연속 실패 횟수에 따른 지수 백오프 (RETRY_BASE * 2^(n-1), 최대 MAX_BACKOFF)"""
+    delay = settings.SCRAPE_SCHEDULE_RETRY_BASE * 2 ** max(consecutive_failures - 1, 0)
+    return min(delay, settings.SCRAPE_SCHEDULE_MAX_BACKOFF)
+
+
+class ScrapeScheduler:
+    """
+    카테고리별 주기 스크래핑 스케줄러
+    - 모든 워커에서 시작되지만 scheduler_locks 의 리더 락을 가진 인스턴스만 작업을 등록합니다.
+    - 스크래핑은 ScrapeJobQueue 를 통해 실행되므로 온디맨드 요청과 같은 카테고리 작업이 중복되지 않습니다.
+    - 일정과 마지막 실행 지표는 scrape_schedules 에 저장되어 리더가 바뀌어도 이어집니다.
+    """
+
+    def __init__(self, jobs: ScrapeJobQueue, lock_name: str = LOCK_NAME):
+        self.jobs = jobs
+        self.lock_name = lock_name
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    def categories(self) -> list[str]:
+        configured = settings.SCRAPE_SCHEDULE_CATEGORIES or list(CATEGORY_URLS)
+        return [c for c in configured if c in CATEGORY_URLS]
+
+    def start(self) -> None:
+        if not settings.SCRAPE_SCHEDULE_ENABLED or self._task:
+            return
+        unknown = set(settings.SCRAPE_SCHEDULE_CATEGORIES) - set(CATEGORY_URLS)
+        if unknown:
+            logger.warning(f"스케줄 대상에서 제외된 카테고리: {', '.join(sorted(unknown))}")
+        self._task = asyncio.create_task(self._loop(), name="scrape-scheduler")
+        logger.info(f"스크래핑 스케줄러 시작 ({self.owner})")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.is_leader:
+            await SchedulerLock.get_motor_collection().delete_one({"_id": self.lock_name, "owner": self.owner})
+            self.is_leader = False
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                self.is_leader = await self._acquire_leadership()
+                if self.is_leader:
+                    await self.tick()
+            except Exception as e:
+                logger.error(f"스크래핑 스케줄러 오류: {e}")
+            await asyncio.sleep(settings.SCRAPE_SCHEDULE_TICK)
+
+    async def _acquire_leadership(self) -> bool:
+        """
+        락이 없거나 만료되었거나 이미 자신이 가진 경우에만 락을 갱신합니다.
+        다른 인스턴스가 유효한 락을 가지고 있으면 upsert 가 _id 충돌로 실패합니다.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            doc = await SchedulerLock.get_motor_collection().find_one_and_update(
+                {"_id": self.lock_name, "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {
+                    "owner": self.owner,
+                    "expires_at": now + timedelta(seconds=settings.SCRAPE_SCHEDULE_LOCK_TTL),
+                }},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            doc = None
+        leader = doc is not None and doc.get("owner") == self.owner
+        if leader and not self.is_leader:
+            logger.info(f"스크래핑 스케줄러 리더 획득 ({self.owner})")
+        elif self.is_leader and not leader:
+            logger.warning(f"스크래핑 스케줄러 리더 상실 ({self.owner})")
+        return leader
+
+    async def tick(self) -> None:
+        """예정 시각이 지난 카테고리의 작업을 등록하고, 끝난 작업의 결과로 다음 일정을 계산합니다."""
+        now = datetime.now(timezone.utc)
+        categories = self.categories()
+        schedules = {
+            s.category: s
+            async for s in ScrapeSchedule.find({"category": {"$in": categories}})
+        }
+        for category in categories:
+            schedule = schedules.get(category)
+            if schedule is None:
+                # 첫 실행 시각을 jitter 구간에 분산시켜 카테고리가 한꺼번에 실행되지 않도록 합니다.
+                spread = settings.SCRAPE_SCHEDULE_INTERVAL * settings.SCRAPE_SCHEDULE_JITTER
+                schedule = ScrapeSchedule(
+                    category=category,
+                    next_run_at=now + timedelta(seconds=random.uniform(0, spread)),
+                )
+                try:
+                    await schedule.insert()
+                except DuplicateKeyError:
+                    pass
+                continue
+
+            if schedule.job_id:
+                await self._collect(schedule, now)
+            elif _as_utc(schedule.next_run_at) <= now:
+                job = await self.jobs.enqueue(category)
+                schedule.job_id = job.id
+                schedule.last_started_at = now
+                await schedule.save()
+
+    async def _collect(self, schedule: ScrapeSchedule, now: datetime) -> None:
+        job = await ScrapeJob.get(schedule.job_id)
+        if job is not None and job.active:
+            # 워커가 종료되어 끝나지 못한 작업이면 실패 처리하고 결과를 반영합니다.
+            await self.jobs.expire_abandoned(job.category)
+            job = await ScrapeJob.get(schedule.job_id)
+            if job is not None and job.active:
+                return
+
+        schedule.job_id = None
+        schedule.run_count += 1
+        schedule.last_finished_at = job.finished_at if job and job.finished_at else now
+        schedule.last_duration = (
+            round((_as_utc(job.finished_at) - _as_utc(job.started_at)).total_seconds(), 3)
+            if job and job.started_at and job.finished_at
+            else None
+        )
+
+        error = None
+        if job is None:
+            error = "스크래핑 작업을 찾을 수 없습니다."
+        elif job.status != "succeeded":
+            error = job.error or "스크래핑 작업 실패"
+        elif job.item_count == 0:
+            error = "스크래핑 결과가 비어 있습니다."
+
+        if error is None:
+            schedule.last_status = "succeeded"
+            schedule.last_error = None
+            schedule.last_item_count = job.item_count
+            schedule.last_ranking_id = job.ranking_id
+            schedule.consecutive_failures = 0
+            delay = settings.SCRAPE_SCHEDULE_INTERVAL
+        else:
+            schedule.last_status = "failed"
+            schedule.last_error = error
+            schedule.consecutive_failures += 1
+            schedule.failure_count += 1
+            delay = backoff_seconds(schedule.consecutive_failures)
+            logger.warning(
+                f"'{schedule.category}' 주기 스크래핑 실패 {schedule.consecutive_failures}회: {error} "
+                f"({delay:.0f}초 후 재시도)"
+            )
+        schedule.next_run_at = now + timedelta(seconds=_jittered(delay))
+        await schedule.save()
+
+    async def status(self) -> ScrapeSchedulerStatus:
+        lock = await SchedulerLock.get_motor_collection().find_one({"_id": self.lock_name})
+        schedules = await ScrapeSchedule.find({"category": {"$in": self.categories()}}).sort("+category").to_list()
+        return ScrapeSchedulerStatus(
+            enabled=settings.SCRAPE_SCHEDULE_ENABLED,
+            interval=settings.SCRAPE_SCHEDULE_INTERVAL,
+            instance=self.owner,
+            leader=lock.get("owner") if lock else None,
+            lock_expires_at=lock.get("expires_at") if lock else None,
+            categories=[ScrapeSchedulePublic(**s.model_dump()) for s in schedules],
+        )
+
+
+scrape_scheduler = ScrapeScheduler(scrape_jobs)
@@ -0,0 +1,159 @@
+# app/services/scrape_job_service.py
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from beanie import PydanticObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.models.ranking import ScrapeJob
+from app.services.scraping_service import CATEGORY_URLS, update_db_from_scraped_data
+
+logger = logging.getLogger()
+
+
+class ScrapeJobQueue:
+    """
+    카테고리별 스크래핑 작업 큐
+    - 같은 카테고리의 진행 중(queued/running) 작업이 있으면 새 작업을 만들지 않고 기존 작업을 반환합니다 (single-flight).
+      프로세스 내부는 asyncio.Lock, 프로세스 간에는 scrape_jobs 의 부분 유니크 인덱스로 중복을 막습니다.
+    - 작업은 lifespan 에서 시작한 백그라운드 워커가 scrape_jobs 에서 queued 작업을 원자적으로 가져와(claim) 처리합니다.
+      메모리 큐는 워커를 깨우는 신호로만 쓰므로, 재시작 등으로 신호가 사라진 작업도
+      시작 직후 또는 SCRAPE_JOB_POLL_INTERVAL 마다 어느 프로세스의 워커든 가져가 처리합니다.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue[PydanticObjectId]] = None
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self, workers: Optional[int] = None) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        count = max(1, workers or settings.SCRAPE_JOB_WORKERS)
+        self._workers = [asyncio.create_task(self._worker(), name=f"scrape-job-worker-{i}") for i in range(count)]
+        logger.info(f"스크래핑 작업 워커 {count}개 시작")
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def expire_abandoned(self, category: str) -> None:
+        """
+        워커가 종료되어 끝나지 못한 작업을 실패 처리합니다.
+        대기 중인 작업은 최대 카테고리 수만큼의 작업 뒤에서 기다릴 수 있으므로 기준 시간을 길게 잡습니다.
+        """
+        now = datetime.now(timezone.utc)
+        timeout = settings.SCRAPE_JOB_TIMEOUT
+        await ScrapeJob.get_motor_collection().update_many(
+            {
+                "category": category,
+                "active": True,
+                "$or": [
+                    {"status": "running", "started_at": {"$lt": now - timedelta(seconds=timeout * 2)}},
+                    {"status": "queued", "created_at": {"$lt": now - timedelta(seconds=timeout * len(CATEGORY_URLS))}},
+                ],
+            },
+            {"$set": {
+                "status": "failed",
+                "active": False,
+                "error": "작업이 제한 시간 내에 완료되지 않았습니다.",
+                "finished_at": now,
+                "updated_at": now,
+            }},
+        )
+
+    async def enqueue(self, category: str) -> ScrapeJob:
+        """카테고리 스크래핑 작업을 등록하고, 이미 진행 중인 작업이 있으면 그 작업을 반환합니다."""
+        if category not in CATEGORY_URLS:
+            raise ValueError("지원하지 않는 카테고리입니다.")
+        if self._queue is None:
+            raise RuntimeError("스크래핑 작업 큐가 시작되지 않았습니다.")
+
+        async with self._locks[category]:
+            await self.expire_abandoned(category)
+            while True:
+                active = await ScrapeJob.find_one({"category": category, "active": True})
+                if active:
+                    return active
+                job = ScrapeJob(category=category)
+                try:
+                    await job.insert()
+                except DuplicateKeyError:
+                    # 다른 프로세스가 먼저 작업을 등록한 경우 그 작업을 다시 조회
+                    continue
+                # 워커를 깨웁니다. (실제 작업은 _claim 이 DB 에서 가져옵니다)
+                self._queue.put_nowait(job.id)
+                logger.info(f"'{category}' 스크래핑 작업 등록 ({job.id})")
+                return job
+
+    async def _claim(self) -> Optional[ScrapeJob]:
+        """가장 오래된 queued 작업을 running 으로 바꾸며 가져옵니다. (다른 워커/프로세스와 중복 처리 방지)"""
+        now = datetime.now(timezone.utc)
+        doc = await ScrapeJob.get_motor_collection().find_one_and_update(
+            {"status": "queued", "active": True},
+            {"$set": {"status": "running", "started_at": now, "updated_at": now}},
+            sort=[("created_at", 1)],
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        return await ScrapeJob.get(doc["_id"]) if doc else None
+
+    async def _wait_for_signal(self) -> None:
+        try:
+            await asyncio.wait_for(self._queue.get(), timeout=settings.SCRAPE_JOB_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            return
+        self._queue.task_done()
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except Exception as e:
+                logger.error(f"스크래핑 작업 조회 중 오류: {e}")
+                job = None
+            if job is None:
+                await self._wait_for_signal()
+                continue
+            try:
+                await self._run(job)
+            except Exception as e:
+                logger.error(f"스크래핑 작업 처리 중 오류 ({job.id}): {e}")
+
+    async def _run(self, job: ScrapeJob) -> None:
+        try:
+            # 시간 초과 시 저장 단계는 취소되지만 스레드에서 실행 중인 스크래핑은 끝까지 진행됩니다.
+            snapshot = await asyncio.wait_for(
+                update_db_from_scraped_data(job.category),
+                timeout=settings.SCRAPE_JOB_TIMEOUT,
+            )
+            job.status = "succeeded"
+            job.ranking_id = snapshot.id
+            job.item_count = snapshot.item_count()
+        except asyncio.TimeoutError:
+            job.status = "failed"
+            job.error = "작업이 제한 시간 내에 완료되지 않았습니다."
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+        job.active = False
+        job.finished_at = datetime.now(timezone.utc)
+        await job.save()
+        logger.info(f"'{job.category}' 스크래핑 작업 종료 ({job.id}, {job.status})")
+
+
+scrape_jobs = ScrapeJobQueue()
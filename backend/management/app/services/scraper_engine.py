@@ -0,0 +1,371 @@
+# app/services/scraper_engine.py
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import httpx
+from lxml import html as lxml_html
+
+from app.core.config import settings
+from app.schemas.ranking import ScrapeItem
+
+logger = logging.getLogger()
+
+# Qoo10 베스트셀러 페이지에서 아이템 목록을 담는 셀렉터 (ol.col4 > li)
+ITEM_LIST_XPATH = "//ol[contains(concat(' ', normalize-space(@class), ' '), ' col4 ')]/li"
+MAX_ITEMS = 100
+OVERSEA_SHIPPING_MARKERS = ("Oversea Shipping", "海外配送")
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "ja,en;q=0.8",
+}
+
+
+def _cls(name: str) -> str:
+    """class 속성에 name 이 포함된 요소를 찾는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _to_int(text: Optional[str], *strip: str) -> Optional[int]:
+    if not text:
+        return None
+    for token in strip:
+        text = text.replace(token, "")
+    try:
+        return int(text.replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def build_scrape_item(
+    *,
+    item_id: str,
+    ship_info: str,
+    rank_text: str,
+    name: str,
+    link: str,
+    image_url: str,
+    brand_name: str,
+    brand_link: str,
+    is_official: bool,
+    sold_text: Optional[str],
+    original_price_text: Optional[str],
+    sale_price_text: Optional[str],
+    mega_price_text: Optional[str],
+    review_count_text: Optional[str],
+) -> ScrapeItem:
+    """
+    엔진과 무관하게 추출한 원시 텍스트를 ScrapeItem 으로 변환합니다.
+    두 엔진이 동일한 결과를 내도록 숫자 변환과 할인율 계산을 이곳에 모아 둡니다.
+    """
+    original_price = _to_int(original_price_text, "円")
+    sale_price = _to_int(sale_price_text, "円")
+    mega_price = _to_int(mega_price_text.split("円")[0]) if mega_price_text else None
+
+    discount_rate = round((1 - sale_price / original_price) * 100, 1) if original_price and sale_price else None
+    mega_discount_rate = round((1 - mega_price / original_price) * 100, 1) if original_price and mega_price else None
+
+    return ScrapeItem(
+        item_id=item_id,
+        ship_info=ship_info,
+        item_name=name,
+        link=link,
+        brand_name=brand_name,
+        brand_link=brand_link,
+        thumbnail=image_url,
+        is_official=is_official,
+        rank=int(rank_text),
+        sold=_to_int(sold_text, " 個販売"),
+        original_price=original_price,
+        sale_price=sale_price,
+        discount_rate=discount_rate,
+        mega_price=mega_price,
+        mega_discount_rate=mega_discount_rate,
+        review_count=_to_int(review_count_text.strip("()") if review_count_text else None),
+    )
+
+
+class ScraperEngine:
+    """
+    랭킹 페이지를 ScrapeItem 리스트로 변환하는 스크래퍼 엔진의 기본 클래스
+    """
+
+    name: str = "base"
+
+    def scrape(self, url: str, category_name: str) -> list[ScrapeItem]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """엔진이 보유한 리소스(HTTP 커넥션, 브라우저 등)를 정리합니다."""
+
+
+class HttpScraperEngine(ScraperEngine):
+    """
+    httpx 로 원본 HTML 을 받아 lxml 로 한 번에 파싱하는 경량 엔진
+    """
+
+    name = "http"
+
+    def __init__(self, client: Optional[httpx.Client] = None, timeout: Optional[float] = None):
+        self._client = client or httpx.Client(
+            headers=DEFAULT_HEADERS,
+            timeout=timeout or settings.SCRAPER_HTTP_TIMEOUT,
+            follow_redirects=True,
+        )
+
+    def fetch(self, url: str) -> str:
+        response = self._client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    def scrape(self, url: str, category_name: str) -> list[ScrapeItem]:
+        logger.info(f"[{self.name}] '{category_name}' 카테고리 스크래핑 시작...")
+        data = parse_ranking_html(self.fetch(url))
+        logger.info(f"[{self.name}] '{category_name}' 카테고리 스크래핑 완료 ({len(data)}건)")
+        return data
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def parse_ranking_html(content: str | bytes) -> list[ScrapeItem]:
+    """
+    베스트셀러 페이지 HTML 에서 ol.col4 > li 항목을 파싱합니다.
+    Selenium 엔진과 동일하게 해외배송 상품만 상위 100건 내에서 추출합니다.
+    """
+    tree = lxml_html.fromstring(content)
+    elements = tree.xpath(ITEM_LIST_XPATH)[:MAX_ITEMS]
+    data: list[ScrapeItem] = []
+
+    def first(el, xpath: str):
+        found = el.xpath(xpath)
+        return found[0] if found else None
+
+    def text(el, xpath: str) -> Optional[str]:
+        node = first(el, xpath)
+        return " ".join(node.text_content().split()) if node is not None else None
+
+    for el in elements:
+        try:
+            ship_info = text(el, f".//*[{_cls('ship_area')}]//dfn") or ""
+            if not any(marker in ship_info for marker in OVERSEA_SHIPPING_MARKERS):
+                continue
+
+            name_el = first(el, f".//*[{_cls('tt')}]")
+            img_tag = first(el, f".//*[{_cls('thmb')}]//img")
+            brand_tag = first(el, f".//*[{_cls('txt_brand')}]")
+
+            data.append(build_scrape_item(
+                item_id=el.get("id"),
+                ship_info=ship_info,
+                rank_text=text(el, f".//*[{_cls('rank')}]"),
+                name=" ".join(name_el.text_content().split()),
+                link=name_el.get("href"),
+                image_url=(img_tag.get("gd_src") or img_tag.get("src") or "") if img_tag is not None else "",
+                brand_name=(brand_tag.get("title") or "") if brand_tag is not None else "",
+                brand_link=(brand_tag.get("href") or "") if brand_tag is not None else "",
+                is_official=brand_tag is not None and bool(brand_tag.xpath(f".//*[{_cls('official')}]")),
+                sold_text=text(el, f".//*[{_cls('sold')}]"),
+                original_price_text=text(el, ".//del"),
+                sale_price_text=text(el, ".//strong"),
+                mega_price_text=text(el, f".//*[{_cls('sale_coupon')}]"),
+                review_count_text=text(el, f".//*[{_cls('review_total_count')}]"),
+            ))
+        except Exception as e:
+            logger.error(f"[ERROR] 항목 처리 중 오류 발생: {e}")
+            continue
+    return data
+
+
+def new_chrome_driver():
+    # Selenium 은 폴백 용도이므로 실제 사용 시점에만 임포트합니다.
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless")
+    return webdriver.Chrome(options=options)
+
+
+class WebDriverPool:
+    """
+    재사용 가능한 헤드리스 Chrome 드라이버 풀 (스레드 안전)
+    드라이버는 필요할 때 최대 size 개까지 생성되며, 반납된 드라이버는 다음 요청에 재사용됩니다.
+    """
+
+    def __init__(self, size: int, factory: Callable = new_chrome_driver):
+        if size < 1:
+            raise ValueError("풀 크기는 1 이상이어야 합니다.")
+        self.size = size
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def _checkout(self, timeout: Optional[float]):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._idle.get(timeout=timeout)
+
+    def _discard(self, driver) -> None:
+        with self._lock:
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator:
+        driver = self._checkout(timeout)
+        try:
+            yield driver
+        except Exception:
+            # 오류가 난 드라이버는 상태를 신뢰할 수 없으므로 폐기합니다.
+            self._discard(driver)
+            raise
+        else:
+            if self._closed:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+class SeleniumScraperEngine(ScraperEngine):
+    """
+    헤드리스 Chrome 으로 페이지를 렌더링하는 기존 방식의 엔진 (HTTP 엔진 실패 시 폴백)
+    pool 을 지정하면 드라이버를 매번 띄우지 않고 풀에서 빌려 씁니다.
+    """
+
+    name = "selenium"
+
+    def __init__(self, render_wait: float = 3.0, pool: Optional[WebDriverPool] = None):
+        self.render_wait = render_wait
+        self.pool = pool
+
+    def _new_driver(self):
+        return new_chrome_driver()
+
+    def scrape(self, url: str, category_name: str) -> list[ScrapeItem]:
+        logger.info(f"[{self.name}] '{category_name}' 카테고리 스크래핑 시작...")
+        if self.pool:
+            with self.pool.acquire() as driver:
+                data = self.scrape_with_driver(driver, url)
+        else:
+            driver = self._new_driver()
+            try:
+                data = self.scrape_with_driver(driver, url)
+            finally:
+                driver.quit()
+        logger.info(f"[{self.name}] '{category_name}' 카테고리 스크래핑 완료 ({len(data)}건)")
+        return data
+
+    def close(self) -> None:
+        if self.pool:
+            self.pool.close()
+
+    def scrape_with_driver(self, driver, url: str) -> list[ScrapeItem]:
+        from selenium.webdriver.common.by import By
+
+        driver.get(url)
+        time.sleep(self.render_wait)
+
+        elements = driver.find_elements(By.CSS_SELECTOR, "ol.col4 > li")[:MAX_ITEMS]
+        data: list[ScrapeItem] = []
+
+        def optional_text(el, by, value) -> Optional[str]:
+            found = el.find_elements(by, value)
+            return found[0].text if found else None
+
+        for el in elements:
+            try:
+                ship_info = el.find_element(By.CLASS_NAME, "ship_area").find_element(By.TAG_NAME, "dfn").text.strip()
+                if not any(marker in ship_info for marker in OVERSEA_SHIPPING_MARKERS):
+                    continue
+                name_el = el.find_element(By.CLASS_NAME, "tt")
+
+                img_tags = el.find_elements(By.CSS_SELECTOR, ".thmb img")
+                image_url = (img_tags[0].get_attribute("gd_src") or img_tags[0].get_attribute("src")) if img_tags else ""
+
+                brand_elements = el.find_elements(By.CLASS_NAME, "txt_brand")
+                brand_tag = brand_elements[0] if brand_elements else None
+
+                data.append(build_scrape_item(
+                    item_id=el.get_attribute("id"),
+                    ship_info=ship_info,
+                    rank_text=el.find_element(By.CLASS_NAME, "rank").text,
+                    name=name_el.text.replace("\n", " "),
+                    link=name_el.get_attribute("href"),
+                    image_url=image_url or "",
+                    brand_name=(brand_tag.get_attribute("title") or "") if brand_tag else "",
+                    brand_link=(brand_tag.get_attribute("href") or "") if brand_tag else "",
+                    is_official=bool(brand_tag and brand_tag.find_elements(By.CLASS_NAME, "official")),
+                    sold_text=optional_text(el, By.CLASS_NAME, "sold"),
+                    original_price_text=optional_text(el, By.TAG_NAME, "del"),
+                    sale_price_text=optional_text(el, By.TAG_NAME, "strong"),
+                    mega_price_text=optional_text(el, By.CLASS_NAME, "sale_coupon"),
+                    review_count_text=optional_text(el, By.CLASS_NAME, "review_total_count"),
+                ))
+            except Exception as e:
+                logger.error(f"[ERROR] 항목 처리 중 오류 발생: {e}")
+                continue
+        return data
+
+
+ENGINES: dict[str, type[ScraperEngine]] = {
+    HttpScraperEngine.name: HttpScraperEngine,
+    SeleniumScraperEngine.name: SeleniumScraperEngine,
+}
+
+
+def get_scraper_engine(name: Optional[str] = None, pool_size: Optional[int] = None) -> ScraperEngine:
+    """
+    이름(기본값: settings.SCRAPER_ENGINE)에 해당하는 스크래퍼 엔진을 생성합니다.
+    pool_size 를 지정하면 여러 카테고리를 동시에 처리할 수 있도록 드라이버 풀/커넥션을 공유하는 엔진을 만듭니다.
+    """
+    engine_name = name or settings.SCRAPER_ENGINE
+    if engine_name not in ENGINES:
+        raise ValueError(f"지원하지 않는 스크래퍼 엔진입니다: {engine_name}")
+    if engine_name == SeleniumScraperEngine.name and pool_size:
+        return SeleniumScraperEngine(pool=WebDriverPool(pool_size))
+    if engine_name == HttpScraperEngine.name and pool_size:
+        return HttpScraperEngine(client=httpx.Client(
+            headers=DEFAULT_HEADERS,
+            timeout=settings.SCRAPER_HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=pool_size),
+        ))
+    return ENGINES[engine_name]()
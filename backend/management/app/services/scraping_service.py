@@ -1,182 +1,150 @@
 # app/services/scraping_service.py
 
 import asyncio
-from datetime import datetime, timedelta, timezone
-from app.models.ranking import Item, RankingSnapshot, ItemSnapshot
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+import logging
 import time
-
-from app.schemas.ranking import ScrapeItem
-
-def scrape_category(url: str, category_name: str) -> list[ScrapeItem]:
+from typing import Optional
+from app.core.config import settings
+from app.models.ranking import RankingSnapshot
+
+from app.schemas.ranking import CategoryScrapeResult, ScrapeAllResult, ScrapeItem
+from app.services.ranking_service import save_ranking_snapshot
+from app.services.rollup_service import refresh_daily_rollup
+from app.services.scraper_engine import ScraperEngine, get_scraper_engine
+
+logger = logging.getLogger()
+
+CATEGORY_URLS = {
+    "total": "https://www.qoo10.jp/gmkt.inc/BestSellers/",
+    "fashion": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=1",
+    "beauty": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=2",
+    "men_sports": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=3", # 남성스포츠
+    "appliance": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=4", # 가전.PC.게임
+    "smart_phone": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=5", # 스마트폰,이어폰
+    "food": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=6", # 식품/건강
+    "pet": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=15", # 반려동물
+    "kids": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=13", # 유아동
+    "k-pop": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=10", # K-POP
+}
+
+def scrape_category(
+    url: str,
+    category_name: str,
+    engine: Optional[ScraperEngine] = None,
+    fallback: Optional[ScraperEngine] = None,
+) -> list[ScrapeItem]:
     """
     지정한 URL과 카테고리명을 기준으로 스크래핑을 수행합니다.
-    각 아이템의 고유 아이디, 썸네일 URL, 순위 등 필요한 정보를 추출하여 딕셔너리 리스트로 반환합니다.
+    기본 엔진(settings.SCRAPER_ENGINE)이 실패하거나 결과가 비어 있으면 폴백 엔진으로 재시도합니다.
     """
-    print(f"[INFO] '{category_name}' 카테고리 스크래핑 시작...")
-    options = Options()
-    options.add_argument("--headless")
-    driver = webdriver.Chrome(options=options)
-    driver.get(url)
-    time.sleep(3)
-
-    elements = driver.find_elements(By.CSS_SELECTOR, "ol.col4 > li")[:100]
-    data: list[ScrapeItem] = []
-
-
-    for idx, el in enumerate(elements):
-        try:
-            item_id = el.get_attribute("id")  # 예: "g_1088366333"
-            ship_info = el.find_element(By.CLASS_NAME, "ship_area").find_element(By.TAG_NAME, "dfn").text.strip()
-            if "Oversea Shipping" not in ship_info and "海外配送" not in ship_info:
-                continue
-            print(f"  - [{idx+1}/{len(elements)}] 항목 처리 중...")
-            rank = int(el.find_element(By.CLASS_NAME, "rank").text)
-            name_el = el.find_element(By.CLASS_NAME, "tt")
-            name = name_el.text.replace("\n", " ")
-            link = name_el.get_attribute("href")
-
-            try:
-                img_tag = el.find_element(By.CLASS_NAME, "thmb").find_element(By.TAG_NAME, "img")
-                image_url = img_tag.get_attribute("gd_src") or img_tag.get_attribute("src")
-            except Exception:
-                image_url = ""
-
-            brand_elements = el.find_elements(By.CLASS_NAME, "txt_brand")
-            if brand_elements:
-                brand_tag = brand_elements[0]
-                brand_name = brand_tag.get_attribute("title")
-                brand_link = brand_tag.get_attribute("href")
-                is_official = True if brand_tag.find_elements(By.CLASS_NAME, "official") else False
-
-            else:
-                brand_name = ""
-                brand_link = ""
-
-            try:
-                sold = int(el.find_element(By.CLASS_NAME, "sold").text.replace(" 個販売", "").replace(",", ""))
-            except:
-                sold = None
-            try:
-                original_price = int(el.find_element(By.TAG_NAME, "del").text.replace("円", "").replace(",", ""))
-            except:
-                original_price = None
-            try:
-                sale_price = int(el.find_element(By.TAG_NAME, "strong").text.replace("円", "").replace(",", ""))
-            except:
-                sale_price = None
-            try:
-                mega_price_text = el.find_element(By.CLASS_NAME, "sale_coupon").text
-                mega_price = int(mega_price_text.split("円")[0].replace(",", "").strip())
-            except:
-                mega_price = None
-            try:
-                review_count = int(el.find_element(By.CLASS_NAME, "review_total_count").text.strip("()").replace(",", ""))
-            except:
-                review_count = None
-
-            discount_rate = round((1 - sale_price / original_price) * 100, 1) if original_price and sale_price else None
-            mega_discount_rate = round((1 - mega_price / original_price) * 100, 1) if original_price and mega_price else None
-
-            items = ScrapeItem(
-                item_id=item_id,
-                ship_info=ship_info,
-                item_name=name,
-                link=link,
-                brand_name=brand_name,
-                brand_link=brand_link,
-                thumbnail=image_url,
-                is_official=is_official,
-                rank=rank,
-                sold=sold,
-                original_price=original_price,
-                sale_price=sale_price,
-                discount_rate=discount_rate,
-                mega_price=mega_price,
-                mega_discount_rate=mega_discount_rate,
-                review_count=review_count
-            )
-       
-            data.append(items)
-        except Exception as e:
-            print(f"[ERROR] 항목 처리 중 오류 발생: {e}")
-            continue
-    driver.quit()
-    print(f"[INFO] '{category_name}' 카테고리 스크래핑 완료.")
-    return data
-    
+    primary = engine or get_scraper_engine()
+    try:
+        data = primary.scrape(url, category_name)
+        if data:
+            return data
+        logger.warning(f"[{primary.name}] '{category_name}' 스크래핑 결과가 비어 있습니다.")
+    except Exception as e:
+        logger.error(f"[{primary.name}] '{category_name}' 스크래핑 실패: {e}")
+        data = []
+    finally:
+        if engine is None:
+            primary.close()
+
+    if fallback is not None:
+        logger.info(f"'{category_name}' 카테고리를 '{fallback.name}' 엔진으로 재시도합니다.")
+        return fallback.scrape(url, category_name)
+
+    fallback_name = settings.SCRAPER_FALLBACK_ENGINE
+    if not fallback_name or fallback_name == primary.name:
+        return data
+    logger.info(f"'{category_name}' 카테고리를 '{fallback_name}' 엔진으로 재시도합니다.")
+    fallback_engine = get_scraper_engine(fallback_name)
+    try:
+        return fallback_engine.scrape(url, category_name)
+    finally:
+        fallback_engine.close()
+
+
+async def persist_scraped_items(category: str, scraped_items: list[ScrapeItem]) -> RankingSnapshot:
+    """
+    스냅샷을 저장한 뒤 일별 롤업을 갱신합니다.
+    롤업 갱신 실패는 스냅샷 저장 결과에 영향을 주지 않습니다.
+    """
+    snapshot = await save_ranking_snapshot(category, scraped_items)
+    try:
+        await refresh_daily_rollup(category, snapshot.timestamp, scraped_items)
+    except Exception as e:
+        logger.error(f"'{category}' 일별 롤업 갱신 실패: {e}")
+    return snapshot
 
 
 async def update_db_from_scraped_data(category: str) -> RankingSnapshot:
-    urls = {
-        "total": "https://www.qoo10.jp/gmkt.inc/BestSellers/",
-        "fashion": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=1",
-        "beauty": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=2",
-        "men_sports": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=3", # 남성스포츠
-        "appliance": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=4", # 가전.PC.게임
-        "smart_phone": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=5", # 스마트폰,이어폰
-        "food": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=6", # 식품/건강
-        "pet": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=15", # 반려동물
-        "kids": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=13", # 유아동
-        "k-pop": "https://www.qoo10.jp/gmkt.inc/Bestsellers/?g=10", # K-POP
-    }
-    if category not in urls:
+    if category not in CATEGORY_URLS:
         raise ValueError("지원하지 않는 카테고리입니다.")
-    scraped_items = await asyncio.to_thread(scrape_category, urls[category], category)
-
-
-    new_snapshot = await RankingSnapshot(category=category).insert()
-
-    for scraped_item in scraped_items:
-        item = await Item.find_one(Item.item_id == scraped_item.item_id)
-        if not item:
-            # 1) Item이 존재하지 않는 경우, 새로 생성
-            item = await Item(
-                item_id       = scraped_item.item_id,
-                item_name     = scraped_item.item_name,
-                link          = scraped_item.link,
-                brand_name    = scraped_item.brand_name,
-                brand_link    = scraped_item.brand_link,
-                thumbnail     = scraped_item.thumbnail,
-                ship_info     = scraped_item.ship_info,
-                is_official   = scraped_item.is_official,
-            ).insert()
-        else:
-            # 3) Item이 존재하는 경우, 업데이트
-            item.item_name     = scraped_item.item_name
-            item.link          = scraped_item.link
-            item.brand_name    = scraped_item.brand_name
-            item.brand_link    = scraped_item.brand_link
-            item.thumbnail     = scraped_item.thumbnail
-            item.ship_info     = scraped_item.ship_info
-            item.is_official     = scraped_item.is_official
-            await item.save()
-        
-        # 2) 오늘자 동일 ItemSnapshot 조회
-        item_snapshot = await ItemSnapshot.find_one({
-            "item": item, 
-            "ranking_snapshot": new_snapshot,  # 혹은 {"$exists": False} 로 확인도 가능
-        })
-        item_snapshot = await ItemSnapshot(
-            item              = item, # Link로 정적 Item 문서
-            category          = category,
-            rank              = scraped_item.rank,
-            sold              = scraped_item.sold,
-            original_price    = scraped_item.original_price,
-            sale_price        = scraped_item.sale_price,
-            discount_rate     = scraped_item.discount_rate,
-            mega_price        = scraped_item.mega_price,
-            mega_discount_rate= scraped_item.mega_discount_rate,
-            review_count      = scraped_item.review_count,
-            timestamp         = new_snapshot.timestamp,
-        ).insert()
-
-
-        # 4) RankingSnapshot에 링크 연결
-        new_snapshot.items.append(item_snapshot)
-
-    # 5) 최종 RankingSnapshot 저장 (items 배열 포함)
-    await new_snapshot.save()
-    return new_snapshot
\ No newline at end of file
+    scraped_items = await asyncio.to_thread(scrape_category, CATEGORY_URLS[category], category)
+    return await persist_scraped_items(category, scraped_items)
+
+
+async def scrape_all_categories(
+    categories: Optional[list[str]] = None,
+    pool_size: Optional[int] = None,
+) -> ScrapeAllResult:
+    """
+    여러 카테고리를 동시에 스크래핑하여 저장합니다.
+    드라이버 풀/HTTP 커넥션을 pool_size 만큼 미리 공유하여 카테고리마다 브라우저를 새로 띄우지 않습니다.
+    """
+    targets = categories or list(CATEGORY_URLS)
+    unknown = [c for c in targets if c not in CATEGORY_URLS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 카테고리입니다: {', '.join(unknown)}")
+
+    size = pool_size or settings.SCRAPER_POOL_SIZE
+    engine = get_scraper_engine(pool_size=size)
+    fallback_name = settings.SCRAPER_FALLBACK_ENGINE
+    fallback = (
+        get_scraper_engine(fallback_name, pool_size=size)
+        if fallback_name and fallback_name != engine.name
+        else None
+    )
+    semaphore = asyncio.Semaphore(size)
+
+    async def run(category: str) -> CategoryScrapeResult:
+        async with semaphore:
+            started = time.perf_counter()
+            scrape_seconds = 0.0
+            try:
+                scraped_items = await asyncio.to_thread(
+                    scrape_category, CATEGORY_URLS[category], category, engine, fallback
+                )
+                scrape_seconds = time.perf_counter() - started
+                snapshot = await persist_scraped_items(category, scraped_items)
+                total = time.perf_counter() - started
+                return CategoryScrapeResult(
+                    category=category,
+                    ranking_id=snapshot.id,
+                    item_count=len(scraped_items),
+                    scrape_seconds=round(scrape_seconds, 3),
+                    persist_seconds=round(total - scrape_seconds, 3),
+                    total_seconds=round(total, 3),
+                )
+            except Exception as e:
+                logger.error(f"'{category}' 카테고리 처리 실패: {e}")
+                return CategoryScrapeResult(
+                    category=category,
+                    scrape_seconds=round(scrape_seconds, 3),
+                    total_seconds=round(time.perf_counter() - started, 3),
+                    error=str(e),
+                )
+
+    started = time.perf_counter()
+    try:
+        results = await asyncio.gather(*(run(c) for c in targets))
+    finally:
+        await asyncio.to_thread(engine.close)
+        if fallback is not None:
+            await asyncio.to_thread(fallback.close)
+    return ScrapeAllResult(
+        pool_size=size,
+        total_seconds=round(time.perf_counter() - started, 3),
+        results=results,
+    )
@@ -0,0 +1,87 @@
+# app/services/search_service.py
+
+import re
+
+from app.models.product import Product, Variant
+from app.schemas.search import SearchHit, SearchResult
+
+# 일치 유형별 기본 점수: 바코드/SKU 정확히 일치 > SKU 접두어 > 전문 검색(textScore) > 이름 접두어
+MATCH_SCORES = {"barcode": 1000.0, "sku": 900.0, "sku_prefix": 500.0, "name_prefix": 1.0}
+
+PRODUCT_FIELDS = {"name": 1, "brand.name": 1}
+VARIANT_FIELDS = {"name": 1, "sku": 1, "barcode": 1, "product._id": 1, "product.name": 1, "product.brand.name": 1}
+
+
+def _product_hit(doc: dict, match: str, score: float) -> SearchHit:
+    return SearchHit(
+        type="product",
+        id=doc["_id"],
+        product_id=doc["_id"],
+        name=doc["name"],
+        product_name=doc["name"],
+        brand_name=doc.get("brand", {}).get("name"),
+        match=match,
+        score=score,
+    )
+
+
+def _variant_hit(doc: dict, match: str, score: float) -> SearchHit:
+    product = doc.get("product", {})
+    return SearchHit(
+        type="variant",
+        id=doc["_id"],
+        product_id=product.get("_id"),
+        name=doc["name"],
+        product_name=product.get("name", ""),
+        brand_name=product.get("brand", {}).get("name"),
+        sku=doc.get("sku"),
+        barcode=doc.get("barcode"),
+        match=match,
+        score=score,
+    )
+
+
+async def search_catalog(q: str, limit: int = 20) -> SearchResult:
+    """
+    제품/변형 통합 검색
+    1) 변형: 바코드·SKU 정확히 일치, SKU 접두어 (sku/barcode 인덱스)
+    2) 제품: 이름·현지화 이름·태그·브랜드명 전문 검색 (product_search_text 인덱스, textScore 순)
+    3) 전문 검색 결과가 부족하면 제품명 접두어 (name 인덱스, 공백 없는 한글/일본어 부분 입력 보완)
+    모든 단계는 인덱스 범위 조회이며 limit 건을 채우면 다음 단계를 생략합니다.
+    """
+    q = q.strip()
+    hits: list[SearchHit] = []
+    seen: set = set()
+
+    def add(hit: SearchHit) -> None:
+        if hit.id not in seen and len(hits) < limit:
+            seen.add(hit.id)
+            hits.append(hit)
+
+    variants = Variant.get_motor_collection()
+    sku = q.upper()
+    async for doc in variants.find({"$or": [{"barcode": q}, {"sku": sku}]}, VARIANT_FIELDS).limit(limit):
+        match = "barcode" if doc.get("barcode") == q else "sku"
+        add(_variant_hit(doc, match, MATCH_SCORES[match]))
+
+    if len(hits) < limit:
+        cursor = variants.find({"sku": {"$regex": f"^{re.escape(sku)}"}}, VARIANT_FIELDS).sort("sku", 1).limit(limit)
+        async for doc in cursor:
+            add(_variant_hit(doc, "sku_prefix", MATCH_SCORES["sku_prefix"]))
+
+    products = Product.get_motor_collection()
+    if len(hits) < limit:
+        cursor = (
+            products.find({"$text": {"$search": q}}, {**PRODUCT_FIELDS, "score": {"$meta": "textScore"}})
+            .sort([("score", {"$meta": "textScore"})])
+            .limit(limit)
+        )
+        async for doc in cursor:
+            add(_product_hit(doc, "text", doc["score"]))
+
+    if len(hits) < limit:
+        cursor = products.find({"name": {"$regex": f"^{re.escape(q)}"}}, PRODUCT_FIELDS).sort("name", 1).limit(limit)
+        async for doc in cursor:
+            add(_product_hit(doc, "name_prefix", MATCH_SCORES["name_prefix"]))
+
+    return SearchResult(query=q, hits=hits)
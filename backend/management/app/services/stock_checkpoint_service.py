@@ -0,0 +1,201 @@
+# app/services/stock_checkpoint_service.py
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+from uuid import uuid4
+
+from beanie import PydanticObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.models.inventory import Inventory, StockCheckpoint, StockCheckpointRun
+from app.services.inventory_service import STOCK_DELTA_EXPR, VARIANT_ID_EXPR
+
+logger = logging.getLogger()
+
+
+def _as_utc(ts: datetime) -> datetime:
+    # MongoDB 에서 읽은 datetime 및 시간대 없는 요청 값은 UTC 로 간주
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def day_boundary(ts: datetime) -> datetime:
+    """ts 가 속한 날의 UTC 자정 (체크포인트 기준 시각)"""
+    return _as_utc(ts).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def _latest_checkpoints(
+    variant_ids: list[PydanticObjectId],
+    at: datetime,
+    inclusive: bool,
+) -> dict[PydanticObjectId, dict]:
+    """변형별로 at 이전(inclusive 이면 at 포함) 가장 최근 체크포인트의 {as_of, quantity}"""
+    pipeline = [
+        {"$match": {"variant_id": {"$in": variant_ids}, "as_of": {"$lte" if inclusive else "$lt": at}}},
+        {"$sort": {"variant_id": 1, "as_of": -1}},
+        {"$group": {"_id": "$variant_id", "as_of": {"$first": "$as_of"}, "quantity": {"$first": "$quantity"}}},
+    ]
+    cursor = StockCheckpoint.get_motor_collection().aggregate(pipeline)
+    return {doc["_id"]: doc async for doc in cursor}
+
+
+async def _ledger_deltas(
+    starts: dict[PydanticObjectId, Optional[datetime]],
+    end: datetime,
+    inclusive: bool,
+) -> dict[PydanticObjectId, int]:
+    """변형별로 [start, end) (inclusive 이면 end 포함) 구간 원장의 증감 합계. start 가 없으면 처음부터"""
+    clauses = []
+    for variant_id, start in starts.items():
+        created_at = {"$lte" if inclusive else "$lt": end}
+        if start is not None:
+            created_at["$gte"] = start
+        clauses.append({"variant.$id": variant_id, "created_at": created_at})
+    if not clauses:
+        return {}
+    pipeline = [
+        {"$match": {"$or": clauses}},
+        {"$group": {"_id": VARIANT_ID_EXPR, "quantity": {"$sum": STOCK_DELTA_EXPR}}},
+    ]
+    cursor = Inventory.get_motor_collection().aggregate(pipeline)
+    return {doc["_id"]: doc["quantity"] async for doc in cursor}
+
+
+async def stock_as_of(variant_ids: list[PydanticObjectId], at: datetime) -> dict[PydanticObjectId, int]:
+    """
+    at 시점의 변형별 재고
+    가장 가까운 체크포인트(as_of <= at)에 [as_of, at] 구간 원장만 더하므로 원장 전체 크기와 무관하게
+    최대 하루치(+ 체크포인트가 무효화된 구간) 원장만 읽습니다.
+    """
+    at = _as_utc(at)
+    bases = await _latest_checkpoints(variant_ids, at, inclusive=True)
+    deltas = await _ledger_deltas(
+        {v: bases[v]["as_of"] if v in bases else None for v in variant_ids}, at, inclusive=True
+    )
+    return {v: (bases[v]["quantity"] if v in bases else 0) + deltas.get(v, 0) for v in variant_ids}
+
+
+async def build_checkpoints(as_of: datetime) -> int:
+    """
+    as_of 기준 체크포인트를 생성합니다. (같은 as_of 로 다시 실행해도 결과는 같습니다)
+    직전 체크포인트 이후 원장 내역이 있는 변형만 새로 기록하며, 나머지 변형은 이전 체크포인트가 그대로 유효합니다.
+    기록한 변형 수를 반환합니다.
+    """
+    as_of = _as_utc(as_of)
+    previous = await StockCheckpoint.find(StockCheckpoint.as_of < as_of).sort("-as_of").first_or_none()
+    created_at: dict = {"$lt": as_of}
+    if previous:
+        created_at["$gte"] = previous.as_of
+    cursor = Inventory.get_motor_collection().aggregate([
+        {"$match": {"created_at": created_at}},
+        {"$group": {"_id": VARIANT_ID_EXPR}},
+    ])
+    changed = [doc["_id"] async for doc in cursor]
+
+    collection = StockCheckpoint.get_motor_collection()
+    for batch in _chunks(changed, settings.STOCK_CHECKPOINT_BATCH):
+        bases = await _latest_checkpoints(batch, as_of, inclusive=False)
+        deltas = await _ledger_deltas(
+            {v: bases[v]["as_of"] if v in bases else None for v in batch}, as_of, inclusive=False
+        )
+        await collection.bulk_write([
+            UpdateOne(
+                {"variant_id": v, "as_of": as_of},
+                {"$set": {"quantity": (bases[v]["quantity"] if v in bases else 0) + deltas.get(v, 0)}},
+                upsert=True,
+            )
+            for v in batch
+        ], ordered=False)
+    return len(changed)
+
+
+class StockCheckpointTask:
+    """
+    매일 UTC 자정 기준 체크포인트를 생성하는 백그라운드 작업
+    모든 워커에서 시작되지만 stock_checkpoint_runs 에 기준일 문서를 먼저 선점한 워커만 실행합니다.
+    실패했거나 STOCK_CHECKPOINT_STALE 이상 running 상태인 실행은 다른 워커가 다시 가져갑니다.
+    """
+
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if not settings.STOCK_CHECKPOINT_ENABLED or self._task:
+            return
+        self._task = asyncio.create_task(self._loop(), name="stock-checkpoint")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"재고 체크포인트 작업 오류: {e}")
+            await asyncio.sleep(settings.STOCK_CHECKPOINT_TICK)
+
+    async def _claim(self, run_id: str, as_of: datetime, now: datetime) -> bool:
+        stale = now - timedelta(seconds=settings.STOCK_CHECKPOINT_STALE)
+        try:
+            doc = await StockCheckpointRun.get_motor_collection().find_one_and_update(
+                {"_id": run_id, "$or": [
+                    {"status": "failed"},
+                    {"status": "running", "started_at": {"$lt": stale}},
+                ]},
+                {"$set": {
+                    "as_of": as_of,
+                    "owner": self.owner,
+                    "status": "running",
+                    "started_at": now,
+                    "finished_at": None,
+                    "error": None,
+                }},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # 이미 완료되었거나 다른 워커가 실행 중
+            return False
+        return doc is not None and doc.get("owner") == self.owner
+
+    async def run_due(self) -> Optional[int]:
+        """오늘 자정 기준 체크포인트가 아직 없고 대기 시간이 지났으면 생성합니다."""
+        now = datetime.now(timezone.utc)
+        as_of = day_boundary(now)
+        if now < as_of + timedelta(seconds=settings.STOCK_CHECKPOINT_DELAY):
+            return None
+        run_id = as_of.strftime("%Y-%m-%d")
+        if not await self._claim(run_id, as_of, now):
+            return None
+
+        collection = StockCheckpointRun.get_motor_collection()
+        try:
+            count = await build_checkpoints(as_of)
+        except Exception as e:
+            await collection.update_one({"_id": run_id}, {"$set": {
+                "status": "failed", "error": str(e), "finished_at": datetime.now(timezone.utc),
+            }})
+            raise
+        await collection.update_one({"_id": run_id}, {"$set": {
+            "status": "succeeded", "variant_count": count, "finished_at": datetime.now(timezone.utc),
+        }})
+        logger.info(f"재고 체크포인트 생성 완료 ({run_id}): 변형 {count}개")
+        return count
+
+
+stock_checkpoints = StockCheckpointTask()
@@ -0,0 +1,181 @@
+# app/services/thumbnail_cache.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger()
+
+
+class ThumbnailCache:
+    """
+    썸네일 이미지 디스크 캐시
+    - blobs/<sha256(내용)>: 내용 기준 저장이라 URL 이 달라도 같은 이미지는 한 번만 저장됩니다.
+    - urls/<sha256(URL)>: URL -> blob 해시 인덱스, 수정 시각 기준으로 TTL 을 적용합니다.
+    - 전체 blob 크기가 max_bytes 를 넘으면 마지막 사용 시각(mtime)이 오래된 blob 부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ):
+        self.root = Path(root or settings.THUMBNAIL_CACHE_DIR)
+        self.ttl = ttl if ttl is not None else settings.THUMBNAIL_CACHE_TTL
+        self.max_bytes = max_bytes if max_bytes is not None else settings.THUMBNAIL_CACHE_MAX_BYTES
+        self.concurrency = concurrency or settings.THUMBNAIL_FETCH_CONCURRENCY
+        self.blob_dir = self.root / "blobs"
+        self.url_dir = self.root / "urls"
+        self._client: Optional[httpx.AsyncClient] = None
+
+    # ---------- 디스크 ----------
+
+    @staticmethod
+    def _hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _url_path(self, url: str) -> Path:
+        return self.url_dir / self._hash(url.encode())
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def get(self, url: str) -> Optional[bytes]:
+        index = self._url_path(url)
+        try:
+            if time.time() - index.stat().st_mtime > self.ttl:
+                return None
+            blob = self._blob_path(json.loads(index.read_text())["sha256"])
+            data = blob.read_bytes()
+            os.utime(blob)  # LRU 기준 시각 갱신 (그 사이 evict 로 삭제되었으면 캐시 미스)
+        except (OSError, ValueError, KeyError):
+            return None
+        return data
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # 같은 내용/URL 을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 고유한 이름을 사용합니다.
+        tmp = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def put(self, url: str, data: bytes) -> None:
+        digest = self._hash(data)
+        blob = self._blob_path(digest)
+        try:
+            os.utime(blob)
+        except FileNotFoundError:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(blob, data)
+        self.url_dir.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(
+            self._url_path(url),
+            json.dumps({"url": url, "sha256": digest}).encode(),
+        )
+
+    def evict(self) -> int:
+        """만료된 URL 인덱스와 용량 초과분 blob 을 삭제하고 삭제한 blob 수를 반환합니다."""
+        now = time.time()
+        if self.url_dir.exists():
+            for index in self.url_dir.iterdir():
+                try:
+                    if now - index.stat().st_mtime > self.ttl:
+                        index.unlink()
+                except OSError:
+                    pass
+
+        if not self.blob_dir.exists():
+            return 0
+        blobs = []
+        total = 0
+        for blob in self.blob_dir.glob("*/*"):
+            try:
+                stat = blob.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, blob))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, blob in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            try:
+                blob.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        # 삭제된 blob 을 가리키는 URL 인덱스는 조회 시 캐시 미스로 처리됩니다.
+        logger.info(f"썸네일 캐시 정리: blob {removed}개 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    # ---------- 네트워크 ----------
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.THUMBNAIL_FETCH_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch(self, url: str, semaphore: asyncio.Semaphore) -> Optional[bytes]:
+        async with semaphore:
+            try:
+                resp = await self._get_client().get(url)
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                logger.warning(f"썸네일 다운로드 실패 ({url}): {e}")
+                return None
+        if resp.status_code != 200 or not resp.content:
+            return None
+        if not resp.headers.get("content-type", "image/").startswith("image/"):
+            return None
+        try:
+            await asyncio.to_thread(self.put, url, resp.content)
+        except OSError as e:
+            # 디스크 부족 등으로 저장하지 못해도 이번 내보내기에는 받은 이미지를 사용합니다.
+            logger.warning(f"썸네일 캐시 저장 실패 ({url}): {e}")
+        return resp.content
+
+    async def fetch_many(self, urls: Iterable[str]) -> dict[str, Optional[bytes]]:
+        """
+        캐시에 없는 URL 만 공유 AsyncClient 로 동시에(최대 concurrency 개) 다운로드합니다.
+        실패한 URL 은 None 으로 반환합니다.
+        """
+        unique = list(dict.fromkeys(u for u in urls if u))
+        cached = await asyncio.to_thread(lambda: {u: self.get(u) for u in unique})
+        misses = [u for u, data in cached.items() if data is None]
+        if misses:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            fetched = await asyncio.gather(*(self._fetch(u, semaphore) for u in misses))
+            cached.update(zip(misses, fetched))
+            await asyncio.to_thread(self.evict)
+        logger.info(f"썸네일 {len(unique)}개 (캐시 적중 {len(unique) - len(misses)}개)")
+        return cached
+
+
+thumbnail_cache = ThumbnailCache()
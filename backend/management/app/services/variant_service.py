@@ -0,0 +1,108 @@
+# app/services/variant_service.py
+
+import itertools
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+from bson import DBRef
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.models.product import Product, Variant, VariantOption, assign_unique_skus, generate_sku
+from app.schemas.variant import VariantOptionAxis
+
+logger = logging.getLogger()
+
+DUPLICATE_KEY = 11000
+SKU_ATTEMPTS = 3  # 동시 요청과 SKU 가 겹친 경우 재배정 횟수
+
+
+def option_matrix(axes: List[VariantOptionAxis]) -> List[List[VariantOption]]:
+    return [
+        list(combo)
+        for combo in itertools.product(*[
+            [VariantOption(name=axis.name, value=value, unit=axis.unit) for value in axis.values]
+            for axis in axes
+        ])
+    ]
+
+
+def variant_name(product_name: str, options: List[VariantOption]) -> str:
+    return f"{product_name} " + " / ".join(f"{opt.value}{opt.unit or ''}" for opt in options)
+
+
+async def attach_variants(product_id: PydanticObjectId, variant_ids: List[PydanticObjectId]) -> None:
+    """제품 문서의 variants 링크 목록에 추가합니다."""
+    await Product.get_motor_collection().update_one(
+        {"_id": product_id},
+        {"$push": {"variants": {"$each": [DBRef(Variant.get_collection_name(), vid) for vid in variant_ids]}}},
+    )
+
+
+async def insert_variant(variant: Variant) -> Variant:
+    """
+    단일 변형 저장. SKU 는 Insert 훅에서 자동 배정되며,
+    동시 요청과 같은 SKU 가 배정되어 고유 인덱스에 막히면 다시 배정합니다.
+    """
+    for attempt in range(SKU_ATTEMPTS):
+        try:
+            return await variant.insert()
+        except DuplicateKeyError:
+            if attempt == SKU_ATTEMPTS - 1:
+                raise
+            variant.sku = None
+
+
+async def create_variant_matrix(
+    product: Product,
+    axes: List[VariantOptionAxis],
+    price: float,
+    media_urls: Optional[List[str]] = None,
+) -> List[Variant]:
+    """
+    옵션 축의 모든 조합으로 변형을 만들어 insert_many 로 한 번에 저장합니다.
+    SKU 는 조합 전체에 대해 한 번에 생성하고 assign_unique_skus 의 $in 조회 한 번으로 충돌을 해소합니다.
+    동시 요청과 겹쳐 고유 인덱스에 막힌 행만 다시 배정해 재시도합니다.
+    """
+    brand = product.brand
+    now = datetime.now(timezone.utc)
+    variants = [
+        Variant(
+            id=PydanticObjectId(),
+            name=variant_name(product.name, options),
+            options=options,
+            media_urls=media_urls,
+            price=price,
+            product=product,
+            created_at=now,
+            updated_at=now,
+        )
+        for options in option_matrix(axes)
+    ]
+    bases = [generate_sku(brand.category.name, brand.name, product.name, v.options) for v in variants]
+
+    pending = list(range(len(variants)))
+    inserted: List[int] = []
+    try:
+        for attempt in range(SKU_ATTEMPTS):
+            skus = await assign_unique_skus([bases[i] for i in pending])
+            for i, sku in zip(pending, skus):
+                variants[i].sku = sku
+            try:
+                await Variant.insert_many([variants[i] for i in pending], ordered=False)
+                inserted += pending
+                break
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                failed = [pending[err["index"]] for err in errors]
+                inserted += sorted(set(pending) - set(failed))
+                if attempt == SKU_ATTEMPTS - 1 or any(err.get("code") != DUPLICATE_KEY for err in errors):
+                    raise
+                logger.info(f"SKU 충돌 {len(failed)}건 재배정 ({product.id})")
+                pending = failed
+    finally:
+        # 일부만 저장된 채 실패해도 저장된 변형은 제품에 연결합니다.
+        if inserted:
+            await attach_variants(product.id, [variants[i].id for i in sorted(inserted)])
+    return variants
@@ -0,0 +1,126 @@
+# benchmarks/bench_catalog_queries.py
+"""
+관리 API 목록 조회 왕복 수 벤치마크 (문서별 fetch_link 반복 vs $lookup 집계)
+
+    cd backend/management
+    BENCH_MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.bench_catalog_queries --limit 100
+
+별도 DB(기본: julyland_bench)에 제품/변형/재고/리스팅을 생성한 뒤
+products / inventory / listings 목록 한 페이지를 기존 방식과 app.api.queries 로 각각 조회해
+소요 시간과 MongoDB 커맨드 수를 출력합니다. 실행이 끝나면 DB 를 삭제합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.api.queries import list_inventory_query, list_listings_query, list_products_query
+from app.models.inventory import Inventory
+from app.models.listing import Listing
+from app.models.market import MarketPlace
+from app.models.product import Brand, Category, Product, Variant, VariantOption
+from benchmarks.mongo_harness import DEFAULT_URL, bench_database
+
+
+async def seed(products: int, variants_per_product: int) -> None:
+    category = await Category(name="beauty").insert()
+    brand = await Brand(name="JULY", category=category).insert()
+    markets = [await MarketPlace(name=name).insert() for name in ("Qoo10", "Amazon")]
+
+    inventory: list[Inventory] = []
+    listings: list[Listing] = []
+    for p in range(products):
+        product = await Product(name=f"Product {p}", brand=brand).insert()
+        variants = [
+            Variant(
+                name=f"Product {p} / {v}",
+                sku=f"BE-JULY-P{p}-{v}",
+                options=[VariantOption(name="size", value=v, unit="ml")],
+                price=1000 + v,
+                product=product,
+            )
+            for v in range(variants_per_product)
+        ]
+        result = await Variant.insert_many(variants)
+        variant_ids = result.inserted_ids
+        product.variants = [Variant.link_from_id(vid) for vid in variant_ids]
+        await product.save()
+        for i, vid in enumerate(variant_ids):
+            inventory.append(Inventory(variant=Variant.link_from_id(vid), change_type="in", quantity=10))
+            listings.append(Listing(
+                market_place=MarketPlace.link_from_id(markets[i % len(markets)].id),
+                variant=Variant.link_from_id(vid),
+                marketplace_item_id=f"M{p}-{i}",
+                status="published",
+            ))
+    await Inventory.insert_many(inventory)
+    await Listing.insert_many(listings)
+
+
+async def legacy_products(limit: int) -> int:
+    docs = await Product.find({}, fetch_links=True).limit(limit).to_list()
+    for d in docs:
+        await d.fetch_all_links()
+    return len(docs)
+
+
+async def legacy_inventory(limit: int) -> int:
+    docs = await Inventory.find_all().limit(limit).to_list()
+    for d in docs:
+        await d.fetch_link(Inventory.variant)
+    return len(docs)
+
+
+async def legacy_listings(limit: int) -> int:
+    docs = await Listing.find_all().limit(limit).to_list()
+    for d in docs:
+        await d.fetch_link(Listing.variant)
+        await d.fetch_link(Listing.market_place)
+    return len(docs)
+
+
+async def run(url: str, db_name: str, products: int, variants: int, limit: int, rounds: int) -> None:
+    async with bench_database(url, db_name) as (_, counter):
+        await seed(products, variants)
+
+        cases = [
+            ("products", "legacy", lambda: legacy_products(limit)),
+            ("products", "lookup", lambda: list_products_query({}, 0, limit, include_variants=True)),
+            ("inventory", "legacy", lambda: legacy_inventory(limit)),
+            ("inventory", "lookup", lambda: list_inventory_query({}, 0, limit)),
+            ("listings", "legacy", lambda: legacy_listings(limit)),
+            ("listings", "lookup", lambda: list_listings_query({}, 0, limit)),
+        ]
+        for endpoint, name, query in cases:
+            timings, commands = [], []
+            rows = 0
+            for _ in range(rounds):
+                counter.reset()
+                start = time.perf_counter()
+                result = await query()
+                timings.append(time.perf_counter() - start)
+                commands.append(counter.count)
+                rows = result if isinstance(result, int) else len(result)
+            print(
+                f"{endpoint:<10} {name:<7} rows={rows:<4} "
+                f"mean={statistics.mean(timings) * 1000:9.2f}ms "
+                f"p50={statistics.median(timings) * 1000:9.2f}ms "
+                f"commands/request={statistics.mean(commands):7.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 조회 왕복 수 벤치마크")
+    parser.add_argument("--mongodb-url", default=DEFAULT_URL)
+    parser.add_argument("--db", default="julyland_bench")
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3, help="제품당 변형 수")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.mongodb_url, args.db, args.products, args.variants, args.limit, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_excel_export.py
+"""
+랭킹 엑셀 내보내기 벤치마크 (기존 파일 저장 vs 스트리밍)
+
+    cd backend/management
+    python -m benchmarks.bench_excel_export --image-size 800
+
+픽스처 HTML 을 파싱한 100행 랭킹에 image-size x image-size JPEG 썸네일을 붙여
+각 모드를 별도 프로세스에서 실행하고 소요 시간, 출력 크기, 최대 RSS 를 출력합니다.
+(썸네일 다운로드/DB 조회 제외, 워크북 작성 비용만 측정)
+
+- file: 원본 이미지, 일반 모드, results/ 에 파일로 저장 (기존 download_ranking 경로)
+- stream: 축소 이미지, constant_memory 모드, SpooledTemporaryFile 에 기록
+"""
+
+import argparse
+import io
+import multiprocessing
+import os
+import random
+import resource
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+
+from beanie import PydanticObjectId
+from PIL import Image
+
+FIXTURE = Path(__file__).parent / "fixtures" / "qoo10_bestsellers.html"
+
+
+def _make_thumbnail(size: int, seed: int) -> bytes:
+    rnd = random.Random(seed)
+    img = Image.effect_noise((size, size), 40 + seed % 30).convert("RGB")
+    img.paste((rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)), (0, 0, size // 2, size // 2))
+    out = io.BytesIO()
+    img.save(out, format="JPEG", quality=90)
+    return out.getvalue()
+
+
+def _run(mode: str, image_size: int, queue) -> None:
+    from app.models.ranking import RankingEntry
+    from app.services.excel_service import THUMBNAIL_BOX, write_ranking_workbook
+    from app.services.scraper_engine import parse_ranking_html
+
+    items = [
+        RankingEntry(item_ref=PydanticObjectId(), **s.model_dump())
+        for s in parse_ranking_html(FIXTURE.read_bytes())
+    ]
+    thumbnails = {s.thumbnail: _make_thumbnail(image_size, i) for i, s in enumerate(items) if s.thumbnail}
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if mode == "file":
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ranking.xlsx")
+            write_ranking_workbook("beauty", datetime.now(), items, thumbnails, path)
+            size = os.path.getsize(path)
+    else:
+        with SpooledTemporaryFile(max_size=16 * 1024 * 1024) as spool:
+            write_ranking_workbook(
+                "beauty", datetime.now(), items, thumbnails, spool,
+                constant_memory=True, thumbnail_box=THUMBNAIL_BOX,
+            )
+            size = spool.tell()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((len(items), elapsed, size, baseline / 1024, peak / 1024))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="랭킹 엑셀 내보내기 벤치마크")
+    parser.add_argument("--image-size", type=int, default=800, help="원본 썸네일 한 변 픽셀")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    for mode in ("file", "stream"):
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run, args=(mode, args.image_size, queue))
+        proc.start()
+        rows, elapsed, size, baseline, peak = queue.get()
+        proc.join()
+        print(
+            f"{mode:<7} rows={rows:<4} time={elapsed * 1000:9.1f}ms "
+            f"size={size / 1024:9.1f}KB maxrss={peak:7.1f}MB (+{peak - baseline:6.1f}MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
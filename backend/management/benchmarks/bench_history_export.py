@@ -0,0 +1,88 @@
+# benchmarks/bench_history_export.py
+"""
+아이템 이력 내보내기 처리량 벤치마크 (스냅샷별 Excel vs Parquet / Arrow IPC)
+
+    cd backend/management
+    python -m benchmarks.bench_history_export --days 30 --snapshots-per-day 24
+
+픽스처 HTML 을 파싱한 랭킹을 days x snapshots-per-day 번 반복한 이력을 만들고,
+- excel: 스냅샷마다 write_ranking_workbook 으로 워크북 1개 작성 (썸네일 제외, 기존 분석 방식)
+- parquet / arrow: rows_to_batch + HistoryWriter 로 batch-size 행 단위 기록
+의 처리량(rows/s)과 출력 크기를 비교합니다. (DB 조회 비용 제외)
+"""
+
+import argparse
+import io
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from beanie import PydanticObjectId
+
+from app.models.ranking import RankingEntry
+from app.services.excel_service import write_ranking_workbook
+from app.services.history_export_service import HistoryWriter, rows_to_batch
+from app.services.scraper_engine import parse_ranking_html
+
+FIXTURE = Path(__file__).parent / "fixtures" / "qoo10_bestsellers.html"
+
+
+def _report(name: str, rows: int, elapsed: float, size: int) -> None:
+    print(
+        f"{name:<8} rows={rows:<8} time={elapsed:8.2f}s "
+        f"throughput={rows / elapsed:12,.0f} rows/s size={size / 1024 / 1024:8.2f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="아이템 이력 내보내기 처리량 벤치마크")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--snapshots-per-day", type=int, default=24)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    entries = [
+        RankingEntry(item_ref=PydanticObjectId(), **s.model_dump())
+        for s in parse_ranking_html(FIXTURE.read_bytes())
+    ]
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    timestamps = [
+        start + timedelta(days=d, hours=h * 24 / args.snapshots_per_day)
+        for d in range(args.days)
+        for h in range(args.snapshots_per_day)
+    ]
+    total_rows = len(timestamps) * len(entries)
+
+    began = time.perf_counter()
+    size = 0
+    for ts in timestamps:
+        out = io.BytesIO()
+        write_ranking_workbook("beauty", ts, entries, {}, out)
+        size += out.tell()
+    _report("excel", total_rows, time.perf_counter() - began, size)
+
+    base_rows = [
+        {"category": "beauty", **e.model_dump(include={
+            "item_id", "rank", "sold", "original_price", "sale_price", "mega_price", "review_count",
+            "item_name", "brand_name", "link", "thumbnail", "is_official",
+        })}
+        for e in entries
+    ]
+    for fmt in ("parquet", "arrow"):
+        out = io.BytesIO()
+        began = time.perf_counter()
+        writer = HistoryWriter(out, fmt)
+        rows: list[dict] = []
+        for ts in timestamps:
+            rows.extend({**row, "timestamp": ts} for row in base_rows)
+            if len(rows) >= args.batch_size:
+                writer.write(rows_to_batch(rows))
+                rows = []
+        if rows:
+            writer.write(rows_to_batch(rows))
+        writer.close()
+        _report(fmt, total_rows, time.perf_counter() - began, out.tell())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_ranking_persist.py
+"""
+랭킹 스냅샷 저장 단계 벤치마크 (행 단위 저장 vs 일괄 저장)
+
+    cd backend/management
+    BENCH_MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.bench_ranking_persist --rounds 5
+
+픽스처 HTML 을 파싱한 아이템으로 별도 DB(기본: julyland_bench)에 저장하며,
+소요 시간과 MongoDB 커맨드(왕복) 수를 함께 출력합니다. 실행이 끝나면 DB 를 삭제합니다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+from app.models.ranking import Item, ItemSnapshot, RankingSnapshot
+from app.schemas.ranking import ScrapeItem
+from app.services.ranking_service import save_ranking_snapshot
+from app.services.scraper_engine import parse_ranking_html
+from benchmarks.mongo_harness import DEFAULT_URL, bench_database
+
+FIXTURE = Path(__file__).parent / "fixtures" / "qoo10_bestsellers.html"
+
+
+async def legacy_persist(category: str, scraped_items: list[ScrapeItem]) -> RankingSnapshot:
+    """기존 update_db_from_scraped_data 의 행 단위 저장 로직"""
+    new_snapshot = await RankingSnapshot(category=category).insert()
+    for scraped_item in scraped_items:
+        item = await Item.find_one(Item.item_id == scraped_item.item_id)
+        if not item:
+            item = await Item(
+                item_id=scraped_item.item_id,
+                item_name=scraped_item.item_name,
+                link=scraped_item.link,
+                brand_name=scraped_item.brand_name,
+                brand_link=scraped_item.brand_link,
+                thumbnail=scraped_item.thumbnail,
+                ship_info=scraped_item.ship_info,
+                is_official=scraped_item.is_official,
+            ).insert()
+        else:
+            item.item_name = scraped_item.item_name
+            item.link = scraped_item.link
+            item.brand_name = scraped_item.brand_name
+            item.brand_link = scraped_item.brand_link
+            item.thumbnail = scraped_item.thumbnail
+            item.ship_info = scraped_item.ship_info
+            item.is_official = scraped_item.is_official
+            await item.save()
+        await ItemSnapshot.find_one({"item": item, "ranking_snapshot": new_snapshot})
+        item_snapshot = await ItemSnapshot(
+            item=item,
+            category=category,
+            rank=scraped_item.rank,
+            sold=scraped_item.sold,
+            original_price=scraped_item.original_price,
+            sale_price=scraped_item.sale_price,
+            discount_rate=scraped_item.discount_rate,
+            mega_price=scraped_item.mega_price,
+            mega_discount_rate=scraped_item.mega_discount_rate,
+            review_count=scraped_item.review_count,
+        ).insert()
+        new_snapshot.items.append(item_snapshot)
+    await new_snapshot.save()
+    return new_snapshot
+
+
+async def run(url: str, db_name: str, rounds: int) -> None:
+    scraped_items = parse_ranking_html(FIXTURE.read_bytes())
+
+    async with bench_database(url, db_name) as (_, counter):
+        for name, persist in (("legacy", legacy_persist), ("bulk", save_ranking_snapshot)):
+            timings, commands = [], []
+            for _ in range(rounds):
+                counter.reset()
+                start = time.perf_counter()
+                await persist("beauty", scraped_items)
+                timings.append(time.perf_counter() - start)
+                commands.append(counter.count)
+            print(
+                f"{name:<7} items={len(scraped_items):<4} rounds={rounds:<3} "
+                f"mean={statistics.mean(timings) * 1000:9.2f}ms "
+                f"p50={statistics.median(timings) * 1000:9.2f}ms "
+                f"commands/round={statistics.mean(commands):7.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="랭킹 저장 단계 벤치마크")
+    parser.add_argument("--mongodb-url", default=DEFAULT_URL)
+    parser.add_argument("--db", default="julyland_bench")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.mongodb_url, args.db, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_scraper_engines.py
+"""
+저장된 Qoo10 베스트셀러 HTML 픽스처로 스크래퍼 엔진을 비교합니다.
+
+    cd backend/management
+    python -m benchmarks.bench_scraper_engines --rounds 20
+
+- http: 픽스처 HTML 을 lxml 로 파싱 (네트워크 제외, 순수 파싱 비용)
+- selenium: 헤드리스 Chrome 으로 file:// 픽스처를 렌더링 (Chrome 이 없으면 건너뜀)
+"""
+
+import argparse
+import resource
+import statistics
+import time
+from pathlib import Path
+
+from app.services.scraper_engine import SeleniumScraperEngine, parse_ranking_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _max_rss_mb() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (usage + children) / 1024
+
+
+def _report(name: str, timings: list[float], count: int) -> None:
+    print(
+        f"{name:<10} rounds={len(timings):<4} items={count:<4} "
+        f"mean={statistics.mean(timings) * 1000:8.2f}ms "
+        f"p50={statistics.median(timings) * 1000:8.2f}ms "
+        f"max={max(timings) * 1000:8.2f}ms "
+        f"maxrss={_max_rss_mb():7.1f}MB"
+    )
+
+
+def bench_http(fixture: Path, rounds: int) -> list:
+    content = fixture.read_bytes()
+    timings, items = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        items = parse_ranking_html(content)
+        timings.append(time.perf_counter() - start)
+    _report("http", timings, len(items))
+    return items
+
+
+def bench_selenium(fixture: Path, rounds: int) -> list:
+    engine = SeleniumScraperEngine(render_wait=0)
+    try:
+        driver = engine._new_driver()
+    except Exception as e:
+        print(f"selenium   건너뜀: Chrome 드라이버를 시작할 수 없습니다 ({e})")
+        return []
+    timings, items = [], []
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            items = engine.scrape_with_driver(driver, fixture.resolve().as_uri())
+            timings.append(time.perf_counter() - start)
+    finally:
+        driver.quit()
+    _report("selenium", timings, len(items))
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스크래퍼 엔진 벤치마크")
+    parser.add_argument("--fixture", type=Path, default=FIXTURE_DIR / "qoo10_bestsellers.html")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--skip-selenium", action="store_true")
+    args = parser.parse_args()
+
+    http_items = bench_http(args.fixture, args.rounds)
+    if args.skip_selenium:
+        return
+    selenium_items = bench_selenium(args.fixture, max(1, args.rounds // 4))
+    if selenium_items:
+        same = [a.model_dump() for a in http_items] == [b.model_dump() for b in selenium_items]
+        print(f"결과 일치 여부: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/bench_search.py
+"""
+/search 지연 시간 벤치마크 (인덱스 기반 search_catalog vs 인덱스 없는 정규식 스캔)
+
+    cd backend/management
+    BENCH_MONGODB_URL=mongodb://localhost:27017 python -m benchmarks.bench_search --products 20000 --target-p95-ms 50
+
+별도 DB(기본: julyland_bench)에 제품과 변형을 생성하고 바코드/SKU/SKU 접두어/단어/이름 접두어 질의를
+각각 rounds 번 실행해 p50/p95 를 출력합니다. p95 가 목표를 넘으면 종료 코드 1 을 반환합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import sys
+import time
+
+from app.models.product import Brand, Category, LocaleName, Product, Variant, VariantOption
+from app.services.search_service import search_catalog
+from benchmarks.mongo_harness import DEFAULT_URL, bench_database
+
+WORDS = [
+    "rose", "green", "tea", "cica", "snail", "vitamin", "water", "cream", "toner", "serum",
+    "essence", "mask", "sun", "cleansing", "foam", "oil", "collagen", "aqua", "honey", "rice",
+]
+BRANDS = ["JULY", "LAND", "MISSHA", "COSRX", "ROUND", "ANUA", "TORRIDEN", "SKIN1004"]
+
+
+async def seed(products: int, variants_per_product: int, rng: random.Random) -> list[Variant]:
+    category = await Category(name="beauty").insert()
+    brands = [await Brand(name=name, category=category).insert() for name in BRANDS]
+
+    docs = []
+    for p in range(products):
+        words = rng.sample(WORDS, 3)
+        docs.append(Product(
+            name=f"{' '.join(words).title()} {p}",
+            locale_names=[LocaleName(locale="ko", name=f"{words[0]} 제품 {p}")],
+            tags=rng.sample(WORDS, 2),
+            brand=rng.choice(brands),
+        ))
+    inserted = await Product.insert_many(docs)
+    for doc, product_id in zip(docs, inserted.inserted_ids):
+        doc.id = product_id
+
+    variants = [
+        Variant(
+            name=f"{product.name} / {v}",
+            sku=f"BE-{product.brand.name[:4]}-{p:06d}-{v}",
+            barcode=f"880{p:07d}{v}",
+            options=[VariantOption(name="size", value=50 * (v + 1), unit="ml")],
+            price=10000,
+            product=product,
+        )
+        for p, product in enumerate(docs)
+        for v in range(variants_per_product)
+    ]
+    await Variant.insert_many(variants)
+    return variants
+
+
+async def regex_scan(q: str, limit: int) -> int:
+    """비교 기준: 인덱스를 쓸 수 없는 대소문자 무시 부분 일치 정규식"""
+    pattern = {"$regex": re.escape(q), "$options": "i"}
+    products = await Product.get_motor_collection().find(
+        {"$or": [{"name": pattern}, {"locale_names.name": pattern}, {"tags": pattern}, {"brand.name": pattern}]},
+        {"name": 1},
+    ).limit(limit).to_list(length=None)
+    variants = await Variant.get_motor_collection().find(
+        {"$or": [{"sku": pattern}, {"barcode": pattern}]}, {"name": 1}
+    ).limit(limit).to_list(length=None)
+    return len(products) + len(variants)
+
+
+async def run(args: argparse.Namespace) -> bool:
+    rng = random.Random(42)
+    async with bench_database(args.mongodb_url, args.db) as _:
+        variants = await seed(args.products, args.variants, rng)
+        samples = rng.sample(variants, min(args.rounds, len(variants)))
+        cases = {
+            "barcode": [v.barcode for v in samples],
+            "sku": [v.sku for v in samples],
+            "sku_prefix": [v.sku.rsplit("-", 2)[0] + "-" + v.sku.rsplit("-", 2)[1][:4] for v in samples],
+            "word": [rng.choice(WORDS) for _ in samples],
+            "name_prefix": [v.product.name.split()[0][:3] for v in samples],
+        }
+
+        ok = True
+        for name, queries in cases.items():
+            for label, query in (("search", search_catalog), ("regex", regex_scan)):
+                timings = []
+                for q in queries:
+                    start = time.perf_counter()
+                    await query(q, args.limit)
+                    timings.append((time.perf_counter() - start) * 1000)
+                p95 = statistics.quantiles(timings, n=20)[-1]
+                status = ""
+                if label == "search":
+                    passed = p95 <= args.target_p95_ms
+                    ok &= passed
+                    status = "OK" if passed else "SLOW"
+                print(
+                    f"{name:<12} {label:<7} p50={statistics.median(timings):8.2f}ms "
+                    f"p95={p95:8.2f}ms {status}"
+                )
+        return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/search 지연 시간 벤치마크")
+    parser.add_argument("--mongodb-url", default=DEFAULT_URL)
+    parser.add_argument("--db", default="julyland_bench")
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--variants", type=int, default=3, help="제품당 변형 수")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--target-p95-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
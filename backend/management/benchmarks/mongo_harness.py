@@ -0,0 +1,54 @@
+# benchmarks/mongo_harness.py
+"""
+벤치마크 공통 MongoDB 하네스
+- CommandCounter: 클라이언트에 등록해 실행된 커맨드(왕복) 수를 커맨드 이름별로 집계합니다.
+- bench_database: 벤치마크 전용 DB 에 Beanie 를 초기화하고 종료 시 DB 를 삭제합니다.
+"""
+
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app import models
+
+DEFAULT_URL = os.getenv("BENCH_MONGODB_URL", "mongodb://localhost:27017")
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.commands: Counter[str] = Counter()
+
+    @property
+    def count(self) -> int:
+        return sum(self.commands.values())
+
+    def reset(self) -> None:
+        self.commands.clear()
+
+    def started(self, event):
+        self.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+@asynccontextmanager
+async def bench_database(url: str, db_name: str):
+    """(client, counter) 를 반환합니다. 초기화 중 실행된 커맨드는 집계에서 제외됩니다."""
+    counter = CommandCounter()
+    client = AsyncIOMotorClient(url, uuidRepresentation="standard", event_listeners=[counter])
+    await client.drop_database(db_name)
+    await init_beanie(database=client[db_name], document_models=models.__all__)
+    counter.reset()
+    try:
+        yield client, counter
+    finally:
+        await client.drop_database(db_name)
+        client.close()